@@ -6,6 +6,7 @@
 #include <cmath>
 #include <thread>
 #include <chrono>
+#include <cstdint>
 #include <librdkafka/rdkafkacpp.h>
 #include <nlohmann/json.hpp>
 
@@ -76,6 +77,12 @@ int main() {
                     std::chrono::system_clock::now().time_since_epoch()
                 ).count();
 
+                // Origin event time and per-symbol sequence of the source
+                // tick, carried through so consumers can measure end-to-end
+                // staleness and spot gaps; `timestamp` stays compute time.
+                double eventTs = tickJson.value("timestamp", ts);
+                uint64_t seq = tickJson.value("seq", uint64_t{0});
+
                 std::cout << "📥 Consumed tick → "
                           << symbol << " | price=" << price
                           << " | volume=" << volume
@@ -134,6 +141,8 @@ int main() {
                 json outMsg = {
                     {"symbol", symbol},
                     {"timestamp", ts},
+                    {"event_ts", eventTs},
+                    {"seq", seq},
                     {"vwap", vwap},
                     {"volatility", volatility},
                     {"pct_change", pctChange},
@@ -149,7 +158,8 @@ int main() {
                     RdKafka::Producer::RK_MSG_COPY,
                     const_cast<char*>(outStr.c_str()),
                     outStr.size(),
-                    nullptr, 0, 0, nullptr
+                    symbol.data(), symbol.size(),  // keyed: per-symbol order
+                    0, nullptr
                 );
 
                 if (resp == RdKafka::ERR_NO_ERROR) {
@@ -0,0 +1,123 @@
+"""timescale hypertables, compression and retention
+
+Revision ID: 3f6a9c1e7b24
+Revises: bfbb9d4bc131
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a9c1e7b24'
+down_revision: Union[str, Sequence[str], None] = 'bfbb9d4bc131'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same shape the data-pipeline bootstraps, so either may run first.
+CREATE_TICKS = """
+CREATE TABLE IF NOT EXISTS ticks (
+    id SERIAL,
+    symbol TEXT NOT NULL,
+    price DOUBLE PRECISION NOT NULL,
+    volume INTEGER NOT NULL,
+    ts TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (symbol, ts, id)
+)
+"""
+
+# (table, compress_orderby, compress after, retention)
+HYPERTABLES = (
+    ("ticks", "ts DESC, id", settings.TICKS_COMPRESS_AFTER, settings.TICKS_RETENTION),
+    ("analytics", "time DESC", settings.ANALYTICS_COMPRESS_AFTER, settings.ANALYTICS_RETENTION),
+)
+
+
+def _set_policies(table: str, compress_after: str, retention: str) -> None:
+    # remove + add so re-running with new settings replaces the old ages
+    op.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE)")
+    op.execute(
+        sa.text(
+            f"SELECT add_compression_policy('{table}', CAST(:age AS INTERVAL))"
+        ).bindparams(age=compress_after)
+    )
+    op.execute(f"SELECT remove_retention_policy('{table}', if_exists => TRUE)")
+    op.execute(
+        sa.text(
+            f"SELECT add_retention_policy('{table}', CAST(:age AS INTERVAL))"
+        ).bindparams(age=retention)
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+    op.execute(CREATE_TICKS)
+
+    op.execute(
+        """
+        SELECT create_hypertable(
+            'ticks',
+            'ts',
+            partitioning_column => 'symbol',
+            number_partitions => 8,
+            if_not_exists => TRUE,
+            migrate_data => TRUE
+        )
+        """
+    )
+    op.execute(
+        """
+        SELECT create_hypertable(
+            'analytics',
+            'time',
+            if_not_exists => TRUE,
+            migrate_data => TRUE
+        )
+        """
+    )
+
+    # Per-symbol time-range reads (baselines, history scans), latest first.
+    op.execute("CREATE INDEX IF NOT EXISTS ticks_symbol_ts_idx ON ticks (symbol, ts DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS ticks_ts_idx ON ticks (ts DESC)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS analytics_symbol_time_idx ON analytics (symbol, time DESC)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS analytics_time_idx ON analytics (time DESC)")
+
+    # Segmenting by symbol keeps each symbol's rows in their own compressed
+    # batches, so a per-symbol range scan decompresses only that symbol.
+    for table, orderby, compress_after, retention in HYPERTABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table} SET (
+                timescaledb.compress,
+                timescaledb.compress_segmentby = 'symbol',
+                timescaledb.compress_orderby = '{orderby}'
+            )
+            """
+        )
+        _set_policies(table, compress_after, retention)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Policies and compression are removed; the tables stay hypertables,
+    since TimescaleDB cannot convert a hypertable back in place.
+    """
+    for table, _, _, _ in HYPERTABLES:
+        op.execute(f"SELECT remove_retention_policy('{table}', if_exists => TRUE)")
+        op.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE)")
+        op.execute(
+            f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{table}') c"
+        )
+        op.execute(f"ALTER TABLE {table} SET (timescaledb.compress = FALSE)")
+
+    op.execute("DROP INDEX IF EXISTS analytics_symbol_time_idx")
+    op.execute("DROP INDEX IF EXISTS analytics_time_idx")
@@ -0,0 +1,96 @@
+"""ohlcv continuous aggregates
+
+Revision ID: 8d1b5e2f4a60
+Revises: 3f6a9c1e7b24
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1b5e2f4a60'
+down_revision: Union[str, Sequence[str], None] = '3f6a9c1e7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 1s and 1m bars aggregate raw ticks; 5m and 1h roll up the 1m bars
+# (hierarchical continuous aggregates, TimescaleDB >= 2.9), so the wide
+# intervals never rescan ticks.
+FROM_TICKS = """
+CREATE MATERIALIZED VIEW {view}
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '{width}', ts) AS bucket,
+    symbol,
+    first(price, ts) AS open,
+    max(price) AS high,
+    min(price) AS low,
+    last(price, ts) AS close,
+    sum(volume)::BIGINT AS volume,
+    count(*)::BIGINT AS trades
+FROM ticks
+GROUP BY bucket, symbol
+WITH NO DATA
+"""
+
+FROM_BARS = """
+CREATE MATERIALIZED VIEW {view}
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '{width}', bucket) AS bucket,
+    symbol,
+    first(open, bucket) AS open,
+    max(high) AS high,
+    min(low) AS low,
+    last(close, bucket) AS close,
+    sum(volume)::BIGINT AS volume,
+    sum(trades)::BIGINT AS trades
+FROM {source}
+GROUP BY 1, symbol
+WITH NO DATA
+"""
+
+# (view, width, source, refresh start_offset, schedule, retention)
+# start_offset stays well inside the ticks retention window, so refreshes
+# never see raw ticks already dropped and bars outlive the ticks.
+BAR_VIEWS = (
+    ("bars_1s", "1 second", "ticks", "1 hour", "10 seconds", "7 days"),
+    ("bars_1m", "1 minute", "ticks", "3 hours", "1 minute", "90 days"),
+    ("bars_5m", "5 minutes", "bars_1m", "1 day", "5 minutes", None),
+    ("bars_1h", "1 hour", "bars_1m", "3 days", "1 hour", None),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for view, width, source, start_offset, schedule, retention in BAR_VIEWS:
+        template = FROM_TICKS if source == "ticks" else FROM_BARS
+        op.execute(template.format(view=view, width=width, source=source))
+        op.execute(
+            f"""
+            SELECT add_continuous_aggregate_policy(
+                '{view}',
+                start_offset => INTERVAL '{start_offset}',
+                end_offset => INTERVAL '{width}',
+                schedule_interval => INTERVAL '{schedule}'
+            )
+            """
+        )
+        if retention is not None:
+            op.execute(f"SELECT add_retention_policy('{view}', INTERVAL '{retention}')")
+
+    # Policies only refresh their recent window; materialize existing
+    # history once so older bars exist too. CALL can't run in a transaction.
+    with op.get_context().autocommit_block():
+        for view, _, _, _, _, retention in BAR_VIEWS:
+            start = f"now() - INTERVAL '{retention}'" if retention else "NULL"
+            op.execute(f"CALL refresh_continuous_aggregate('{view}', {start}, NULL)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for view, *_ in reversed(BAR_VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
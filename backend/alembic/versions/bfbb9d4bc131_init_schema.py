@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = 'bfbb9d4bc131'
@@ -31,24 +30,11 @@ def upgrade() -> None:
     sa.Column('volume_spike', sa.Boolean(), nullable=True),
     sa.PrimaryKeyConstraint('time', 'symbol')
     )
-    op.drop_index(op.f('ticks_symbol_ts_idx'), table_name='ticks')
-    op.drop_index(op.f('ticks_ts_idx'), table_name='ticks')
-    op.drop_table('ticks')
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    op.create_table('ticks',
-    sa.Column('id', sa.INTEGER(), autoincrement=True, nullable=False),
-    sa.Column('symbol', sa.TEXT(), autoincrement=False, nullable=False),
-    sa.Column('price', sa.DOUBLE_PRECISION(precision=53), autoincrement=False, nullable=False),
-    sa.Column('volume', sa.INTEGER(), autoincrement=False, nullable=False),
-    sa.Column('ts', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=False),
-    sa.PrimaryKeyConstraint('symbol', 'ts', 'id', name=op.f('ticks_pkey'))
-    )
-    op.create_index(op.f('ticks_ts_idx'), 'ticks', [sa.literal_column('ts DESC')], unique=False)
-    op.create_index(op.f('ticks_symbol_ts_idx'), 'ticks', ['symbol', sa.literal_column('ts DESC')], unique=False)
     op.drop_table('analytics')
     # ### end Alembic commands ###
@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.schemas.bars import Bar
+from app.services.http.bars_service import BAR_INTERVAL_MS, BAR_VIEWS, BarsService
+from app.services.http.ticks_redis_service import now_ms
+
+router = APIRouter(tags=["Bars"])
+
+
+@router.get("/bars", response_model=List[Bar])
+async def get_bars(
+    symbol: str = Query(..., description="Symbol, e.g. AAPL"),
+    interval: str = Query(
+        "1m",
+        pattern="^(" + "|".join(BAR_VIEWS) + ")$",
+        description="Bar width: " + ", ".join(BAR_VIEWS),
+    ),
+    from_ms: Optional[int] = Query(
+        None, alias="from", ge=0, description="Range start, epoch ms (inclusive)"
+    ),
+    to_ms: Optional[int] = Query(
+        None, alias="to", ge=0, description="Range end, epoch ms (exclusive); default now"
+    ),
+    limit: int = Query(
+        1000,
+        ge=1,
+        le=10_000,
+        description="Maximum bars; the most recent ones in the range are kept",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> List[Bar]:
+    """OHLCV bars from the continuous aggregates."""
+    end = to_ms if to_ms is not None else now_ms()
+    start = from_ms if from_ms is not None else end - limit * BAR_INTERVAL_MS[interval]
+    if start >= end:
+        raise HTTPException(status_code=400, detail="from must be before to")
+
+    return await BarsService.get_bars(symbol.upper(), interval, start, end, limit, db)
@@ -5,4 +5,5 @@ router = APIRouter(tags=["Health"])
 
 @router.get("/health")
 async def get_health():
-    return await HealthService.get_health()
\ No newline at end of file
+    """Kafka, Redis and Postgres status from the background health monitor."""
+    return HealthService.get_health()
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app.services.ingestion import ingestion_hub
+
+router = APIRouter(tags=["Ingestion"])
+
+@router.get("/ingest/stats")
+async def get_ingest_stats():
+    """Kafka consumer lag per consumer group and queue stats per sink."""
+    return ingestion_hub.stats()
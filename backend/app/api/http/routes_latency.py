@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app.services.metrics import stage_tracers
+
+router = APIRouter(tags=["Ingestion"])
+
+@router.get("/latency")
+async def get_stage_latency():
+    """Event-time staleness and sequence gaps for each pipeline stage."""
+    return {tracer.stage: tracer.snapshot() for tracer in stage_tracers()}
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+import app.services.metrics  # noqa: F401  (registers the backend collector)
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus text exposition of throughput, lag, batch and fan-out metrics."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -17,7 +17,7 @@ async def search_symbols(
         "",
         min_length=0,
         max_length=32,
-        description="Symbol search term, e.g. 'aap' or 'ts'",
+        description="Symbol or company name search term, e.g. 'aap', 'ts' or 'apple'",
     ),
     limit: int = Query(
         10,
@@ -27,7 +27,8 @@ async def search_symbols(
     ),
 ) -> List[SymbolSearchResult]:
     """
-    Search across all available symbols defined in shared/symbols.py.
+    Search across all available symbols defined in shared/symbols.py, by
+    ticker or company name, best matches first.
 
     Response is a plain array:
       [
@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.services.http.downsample import parse_bucket
 from app.services.http.ticks_redis_service import (
     get_ticks_from_redis,
     get_latest_tick,
+    get_latest_ticks,
+    stream_ticks_ndjson,
 )
 
 router = APIRouter(tags=["Ticks"])
@@ -16,20 +21,73 @@ async def get_recent_ticks(
         le=72,
         description="Number of hours of tick data to retrieve",
     ),
+    max_points: Optional[int] = Query(
+        None,
+        ge=3,
+        le=10_000,
+        description="Downsample to at most this many points (LTTB, or OHLCV bars with `bucket`)",
+    ),
+    bucket: Optional[str] = Query(
+        None,
+        description="Return OHLCV bars of this width instead of ticks, e.g. 10s, 1m, 5m, 1h",
+    ),
+    since_ms: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Only ticks after this timestamp_ms (exclusive), e.g. the last one received",
+    ),
+    fmt: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="json: one array; ndjson: one tick per line, streamed",
+    ),
 ):
-    """
-    Return the last `lookback_hours` of ticks for a symbol from Redis.
-    """
+    """Return the last `lookback_hours` of ticks for a symbol from Redis."""
     symbol = symbol.upper()
-    return await get_ticks_from_redis(symbol, lookback_hours)
+
+    if fmt == "ndjson":
+        if max_points is not None or bucket is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="format=ndjson streams raw ticks; drop max_points/bucket",
+            )
+        return StreamingResponse(
+            stream_ticks_ndjson(symbol, lookback_hours, since_ms),
+            media_type="application/x-ndjson",
+        )
+
+    bucket_ms = None
+    if bucket is not None:
+        try:
+            bucket_ms = parse_bucket(bucket)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await get_ticks_from_redis(
+        symbol, lookback_hours, max_points, bucket_ms, since_ms
+    )
 
 
 @router.get("/ticks/latest")
 async def get_latest(
-    symbol: str = Query(..., description="Symbol, e.g. AAPL"),
+    symbol: Optional[str] = Query(None, description="Symbol, e.g. AAPL"),
+    symbols: Optional[str] = Query(
+        None,
+        description="Comma-separated symbols, e.g. AAPL,MSFT, or * for all",
+    ),
 ):
-    """
-    Return the most recent tick for the requested symbol (from Redis).
-    """
+    """Return the most recent tick for a symbol, or for each of `symbols`, from Redis."""
+    if symbols is not None:
+        if symbols.strip() == "*":
+            return await get_latest_ticks()
+        requested = list(dict.fromkeys(
+            s.strip().upper() for s in symbols.split(",") if s.strip()
+        ))
+        return await get_latest_ticks(requested)
+
+    if symbol is None:
+        raise HTTPException(status_code=400, detail="symbol or symbols is required")
+
     symbol = symbol.upper()
     return await get_latest_tick(symbol)
\ No newline at end of file
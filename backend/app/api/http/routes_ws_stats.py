@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from app.core.config import settings
+from app.services.ws.tick_broadcaster import tick_fanout
+from app.services.ws.analytics_broadcaster import analytics_fanout
+from app.services.ws.gateway import gateway_subscriber
+
+router = APIRouter(tags=["WebSockets"])
+
+@router.get("/ws/stats")
+async def get_ws_stats():
+    """Per-client queue depth and frame counts for the WebSocket streams."""
+    stats = {
+        engine.name: {
+            "clients": len(engine),
+            "connections": engine.stats(),
+        }
+        for engine in (tick_fanout, analytics_fanout)
+    }
+    if settings.BACKEND_ROLE == "gateway":
+        stats["gateway"] = gateway_subscriber.stats()
+    return stats
@@ -0,0 +1,9 @@
+from fastapi import Query
+
+# The `max_hz` query parameter shared by every WS route; see ClientChannel.
+MaxHzQuery = Query(
+    None,
+    gt=0,
+    le=100,
+    description="Max updates per symbol per second; coalesces frames",
+)
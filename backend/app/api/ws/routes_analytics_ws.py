@@ -1,11 +1,21 @@
-from fastapi import APIRouter, WebSocket
+from typing import Optional
+from fastapi import APIRouter, Query, WebSocket
 import asyncio
-from app.services.ws.analytics_broadcaster import connected_clients
+from app.api.ws.params import MaxHzQuery
+from app.services.ws.analytics_broadcaster import analytics_fanout
 
 router = APIRouter(tags=["WebSockets"])
 
 @router.websocket("/ws/analytics")
-async def websocket_analytics_multi(websocket: WebSocket, symbols: str = ""):
+async def websocket_analytics_multi(
+    websocket: WebSocket,
+    symbols: str = "",
+    max_hz: Optional[float] = MaxHzQuery,
+    snapshot: bool = Query(
+        False,
+        description="Send recent history as a snapshot frame before live updates",
+    ),
+):
     await websocket.accept()
 
     if not symbols.strip():
@@ -13,7 +23,7 @@ async def websocket_analytics_multi(websocket: WebSocket, symbols: str = ""):
         return
 
     subs = {s.strip().upper() for s in symbols.split(",")}
-    connected_clients[websocket] = subs
+    analytics_fanout.attach(websocket, subs, max_hz=max_hz, snapshot=snapshot)
 
     try:
         while True:
@@ -24,15 +34,23 @@ async def websocket_analytics_multi(websocket: WebSocket, symbols: str = ""):
     except:
         pass
     finally:
-        connected_clients.pop(websocket, None)
+        analytics_fanout.detach(websocket)
         await websocket.close()
 
 @router.websocket("/ws/analytics/{symbol}")
-async def websocket_analytics_symbol(websocket: WebSocket, symbol: str):
+async def websocket_analytics_symbol(
+    websocket: WebSocket,
+    symbol: str,
+    max_hz: Optional[float] = MaxHzQuery,
+    snapshot: bool = Query(
+        False,
+        description="Send recent history as a snapshot frame before live updates",
+    ),
+):
     await websocket.accept()
 
     subs = {symbol.upper()}
-    connected_clients[websocket] = subs
+    analytics_fanout.attach(websocket, subs, max_hz=max_hz, snapshot=snapshot)
 
     try:
         while True:
@@ -43,5 +61,5 @@ async def websocket_analytics_symbol(websocket: WebSocket, symbol: str):
     except:
         pass
     finally:
-        connected_clients.pop(websocket, None)
+        analytics_fanout.detach(websocket)
         await websocket.close()
\ No newline at end of file
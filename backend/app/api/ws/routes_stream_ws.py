@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import APIRouter, Query, WebSocket
+import asyncio
+from app.api.ws.params import MaxHzQuery
+from app.services.ws.stream_session import StreamSession, parse_symbols
+
+router = APIRouter(tags=["WebSockets"])
+
+@router.websocket("/ws/stream")
+async def websocket_stream(
+    websocket: WebSocket,
+    ticks: str = Query("", description="Initial tick symbols, e.g. AAPL,MSFT"),
+    analytics: str = Query("", description="Initial analytics symbols"),
+    max_hz: Optional[float] = MaxHzQuery,
+    binary: bool = Query(False, description="Send data frames as binary"),
+    snapshot: bool = Query(
+        True,
+        description="Send recent history for the initial symbols before live updates",
+    ),
+):
+    """Multiplexed ticks + analytics stream; see StreamSession."""
+    await websocket.accept()
+
+    session = StreamSession(websocket, max_hz=max_hz, binary=binary)
+    session.subscribe("ticks", parse_symbols(ticks), snapshot=snapshot)
+    session.subscribe("analytics", parse_symbols(analytics), snapshot=snapshot)
+
+    try:
+        while True:
+            try:
+                raw = await asyncio.wait_for(websocket.receive_text(), timeout=30)
+            except asyncio.TimeoutError:
+                session.heartbeat()
+                continue
+            session.handle(raw)
+    except Exception:
+        pass
+    finally:
+        session.close()
+        await websocket.close()
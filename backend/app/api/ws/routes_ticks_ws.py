@@ -1,11 +1,21 @@
-from fastapi import APIRouter, WebSocket
+from typing import Optional
+from fastapi import APIRouter, Query, WebSocket
 import asyncio
-from app.services.ws.tick_broadcaster import tick_clients
+from app.api.ws.params import MaxHzQuery
+from app.services.ws.tick_broadcaster import tick_fanout
 
 router = APIRouter(tags=["WebSockets"])
 
 @router.websocket("/ws/ticks")
-async def websocket_ticks_multi(websocket: WebSocket, symbols: str = ""):
+async def websocket_ticks_multi(
+    websocket: WebSocket,
+    symbols: str = "",
+    max_hz: Optional[float] = MaxHzQuery,
+    snapshot: bool = Query(
+        False,
+        description="Send recent history as a snapshot frame before live updates",
+    ),
+):
     await websocket.accept()
 
     if not symbols.strip():
@@ -13,7 +23,7 @@ async def websocket_ticks_multi(websocket: WebSocket, symbols: str = ""):
         return
 
     subs = {s.strip().upper() for s in symbols.split(",")}
-    tick_clients[websocket] = subs
+    tick_fanout.attach(websocket, subs, max_hz=max_hz, snapshot=snapshot)
 
     try:
         while True:
@@ -24,15 +34,23 @@ async def websocket_ticks_multi(websocket: WebSocket, symbols: str = ""):
     except:
         pass
     finally:
-        tick_clients.pop(websocket, None)
+        tick_fanout.detach(websocket)
         await websocket.close()
 
 @router.websocket("/ws/ticks/{symbol}")
-async def websocket_ticks_symbol(websocket: WebSocket, symbol: str):
+async def websocket_ticks_symbol(
+    websocket: WebSocket,
+    symbol: str,
+    max_hz: Optional[float] = MaxHzQuery,
+    snapshot: bool = Query(
+        False,
+        description="Send recent history as a snapshot frame before live updates",
+    ),
+):
     await websocket.accept()
 
     subs = {symbol.upper()}
-    tick_clients[websocket] = subs
+    tick_fanout.attach(websocket, subs, max_hz=max_hz, snapshot=snapshot)
 
     try:
         while True:
@@ -43,5 +61,5 @@ async def websocket_ticks_symbol(websocket: WebSocket, symbol: str):
     except:
         pass
     finally:
-        tick_clients.pop(websocket, None)
+        tick_fanout.detach(websocket)
         await websocket.close()
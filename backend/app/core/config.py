@@ -2,8 +2,46 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/tradestream"
+    DB_ECHO: bool = False
+
+    # Postgres intervals, applied when the Timescale migration runs.
+    TICKS_COMPRESS_AFTER: str = "1 day"
+    TICKS_RETENTION: str = "30 days"
+    ANALYTICS_COMPRESS_AFTER: str = "7 days"
+    ANALYTICS_RETENTION: str = "365 days"
+
+    ANALYTICS_FLUSH_SIZE: int = 500
+    ANALYTICS_FLUSH_INTERVAL_S: float = 0.5
 
     REDIS_URL: str = "redis://localhost:6379/0"
+
+    # standalone: Kafka ingestion and WS fan-out in one process.
+    # ingest: Kafka ingestion only; live messages go to Redis pub/sub.
+    # gateway: WS fan-out only, fed from Redis pub/sub; run as many as needed.
+    BACKEND_ROLE: str = "standalone"  # standalone | ingest | gateway
+
+    KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
+    INGEST_LIVE_QUEUE_SIZE: int = 10_000
+    INGEST_REDIS_QUEUE_SIZE: int = 50_000
+    INGEST_DB_QUEUE_SIZE: int = 50_000
+    # Live analytics share the durable DB feed, which replays its
+    # uncommitted backlog after a restart or a DB stall; records older
+    # than this (by event time) are not pushed to WebSocket clients.
+    INGEST_LIVE_MAX_AGE_S: float = 10.0
+
+    HEALTH_PROBE_INTERVAL_S: float = 5.0
+    HEALTH_PROBE_TIMEOUT_S: float = 2.0
+    HEALTH_STALE_AFTER_S: float = 15.0
+
+    REDIS_TICK_STORAGE: str = "zset"  # zset | bucketed | dual
+    REDIS_FLUSH_SIZE: int = 500
+    REDIS_FLUSH_INTERVAL_S: float = 0.05
+    REDIS_TRIM_INTERVAL_S: float = 10.0
+    REDIS_READ_PAGE_SIZE: int = 5000
+
+    WS_CLIENT_QUEUE_SIZE: int = 256
+    WS_SLOW_CONSUMER_POLICY: str = "drop_oldest"  # drop_oldest | conflate | disconnect
+    WS_SNAPSHOT_TICKS: int = 100
     
     class Config:
         env_file = ".env"
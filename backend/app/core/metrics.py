@@ -0,0 +1,48 @@
+from prometheus_client import Histogram
+from telemetry import BATCH_BUCKETS, LATENCY_BUCKETS
+
+# Per-message counts are plain int attributes on the services, exported
+# at scrape time by app.services.metrics.
+
+INGEST_SINK_SECONDS = Histogram(
+    "tradestream_ingest_sink_seconds",
+    "Time an ingestion-hub sink spent handling one batch.",
+    ["topic", "sink"],
+    buckets=LATENCY_BUCKETS,
+)
+INGEST_SINK_BATCH_SIZE = Histogram(
+    "tradestream_ingest_sink_batch_size",
+    "Records per batch handed to an ingestion-hub sink.",
+    ["topic", "sink"],
+    buckets=BATCH_BUCKETS,
+)
+
+REDIS_WRITE_SECONDS = Histogram(
+    "tradestream_redis_write_seconds",
+    "Duration of one Redis tick pipeline flush.",
+    buckets=LATENCY_BUCKETS,
+)
+REDIS_WRITE_BATCH_SIZE = Histogram(
+    "tradestream_redis_write_batch_size",
+    "Ticks per Redis pipeline flush.",
+    buckets=BATCH_BUCKETS,
+)
+
+DB_WRITE_SECONDS = Histogram(
+    "tradestream_db_write_seconds",
+    "Duration of one analytics batch insert, retries included.",
+    buckets=LATENCY_BUCKETS,
+)
+DB_WRITE_BATCH_SIZE = Histogram(
+    "tradestream_db_write_batch_size",
+    "Rows per analytics batch insert.",
+    buckets=BATCH_BUCKETS,
+)
+
+WS_FANOUT_SECONDS = Histogram(
+    "tradestream_ws_fanout_seconds",
+    "Time to queue one batch of messages (one message in the gateway "
+    "role) for every subscribed WebSocket client.",
+    ["stream"],
+    buckets=LATENCY_BUCKETS,
+)
@@ -5,3 +5,10 @@ redis_client = Redis.from_url(
     settings.REDIS_URL,
     decode_responses=True,
 )
+
+
+# For binary values (packed tick buckets); responses stay as bytes.
+redis_binary_client = Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=False,
+)
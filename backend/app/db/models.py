@@ -7,7 +7,11 @@ from sqlalchemy import (
     ForeignKey,
     TIMESTAMP,
     Float,
-    Boolean
+    Boolean,
+    Integer,
+    Text,
+    Index,
+    PrimaryKeyConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -49,6 +53,23 @@ class Watchlist(Base):
     user = relationship("User", back_populates="watchlist")
 
 
+class Tick(Base):
+    """Raw ticks, written by the data-pipeline with COPY."""
+    __tablename__ = "ticks"
+
+    id = Column(Integer, autoincrement=True, nullable=False)
+    symbol = Column(Text, nullable=False)
+    price = Column(Float(precision=53), nullable=False)
+    volume = Column(Integer, nullable=False)
+    ts = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(symbol, ts, id),
+        Index("ticks_symbol_ts_idx", symbol, ts.desc()),
+        Index("ticks_ts_idx", ts.desc()),
+    )
+
+
 class Analytics(Base):
     __tablename__ = "analytics"
 
@@ -59,3 +80,8 @@ class Analytics(Base):
     pct_change = Column(Float)
     avg_volume = Column(Float)
     volume_spike = Column(Boolean)
+
+    __table_args__ = (
+        Index("analytics_symbol_time_idx", symbol, time.desc()),
+        Index("analytics_time_idx", time.desc()),
+    )
@@ -7,9 +7,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import engine, Base
 from app.core.logger import logger
 
-from app.services.ws.analytics_broadcaster import analytics_kafka_consumer
-from app.services.ws.tick_broadcaster import tick_kafka_consumer
-from app.services.analytics_consumer import consume_analytics
+from app.core.config import settings
+from app.services.ingestion import ingestion_hub
+from app.services.ws.gateway import gateway_subscriber
+from app.services.redis_tick_writer import redis_tick_writer
+from app.services.http.health_service import health_monitor
 
 from app.api.http.routes_users import router as users_router_http
 from app.api.http.routes_watchlist import router as watchlist_router_http
@@ -17,22 +19,36 @@ from app.api.http.routes_health import router as health_router_http
 from app.api.http.routes_baselines import router as baselines_router_http
 from app.api.http.routes_ticks_redis import router as ticks_router_redis_http
 from app.api.http.routes_symbols import router as symbols_router_http
+from app.api.http.routes_ws_stats import router as ws_stats_router_http
+from app.api.http.routes_bars import router as bars_router_http
+from app.api.http.routes_ingest_stats import router as ingest_stats_router_http
+from app.api.http.routes_latency import router as latency_router_http
+from app.api.http.routes_metrics import router as metrics_router_http
 
 from app.api.ws.routes_analytics_ws import router as analytics_router_ws
 from app.api.ws.routes_ticks_ws import router as ticks_router_ws
+from app.api.ws.routes_stream_ws import router as stream_router_ws
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting backend...")
 
-    asyncio.create_task(tick_kafka_consumer())
-    logger.info("Tick background consumer started")
+    if settings.BACKEND_ROLE not in ("standalone", "ingest", "gateway"):
+        raise ValueError(f"Unknown BACKEND_ROLE: {settings.BACKEND_ROLE}")
 
-    asyncio.create_task(analytics_kafka_consumer())
-    logger.info("Analytics background consumer started")
+    if settings.BACKEND_ROLE in ("standalone", "ingest"):
+        asyncio.create_task(redis_tick_writer.run())
+        logger.info("Redis tick writer started")
 
-    asyncio.create_task(consume_analytics())
-    logger.info("Analytics DB consumer started")
+        asyncio.create_task(ingestion_hub.run())
+        logger.info("Kafka ingestion hub started")
+
+    if settings.BACKEND_ROLE == "gateway":
+        asyncio.create_task(gateway_subscriber.run())
+        logger.info("WebSocket gateway subscribed to Redis pub/sub")
+
+    asyncio.create_task(health_monitor.run())
+    logger.info("Health monitor started")
 
     yield
 
@@ -59,6 +75,14 @@ app.include_router(health_router_http, prefix="/api")
 app.include_router(baselines_router_http, prefix="/api")
 app.include_router(ticks_router_redis_http, prefix="/api")
 app.include_router(symbols_router_http, prefix="/api")
+app.include_router(ws_stats_router_http, prefix="/api")
+app.include_router(bars_router_http, prefix="/api")
+app.include_router(ingest_stats_router_http, prefix="/api")
+app.include_router(latency_router_http, prefix="/api")
+
+# Unprefixed, where Prometheus scrapers look by default.
+app.include_router(metrics_router_http)
 
 app.include_router(analytics_router_ws)
-app.include_router(ticks_router_ws)
\ No newline at end of file
+app.include_router(ticks_router_ws)
+app.include_router(stream_router_ws)
\ No newline at end of file
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class Bar(BaseModel):
+    timestamp_ms: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    count: int
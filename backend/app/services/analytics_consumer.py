@@ -1,56 +1,113 @@
-import json
-import asyncio
-from aiokafka import AIOKafkaConsumer
-from datetime import datetime
-from app.db.session import async_session
+import time
+from datetime import datetime, timezone
+from typing import List
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import InterfaceError, OperationalError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from retry import retry
+from app.core.logger import logger
+from app.core.metrics import DB_WRITE_BATCH_SIZE, DB_WRITE_SECONDS
+from app.db.session import engine
 from app.db.models import Analytics
 
-KAFKA_BOOTSTRAP = "kafka:9092"
-TOPIC = "market_analytics"
+# 7 bind parameters per row; keeps each statement well under asyncpg's
+# 32767-parameter limit.
+INSERT_CHUNK_ROWS = 2000
 
+RETRYABLE_ERRORS = (OperationalError, InterfaceError, ConnectionError, OSError)
 
-async def consume_analytics():
-    consumer = AIOKafkaConsumer(
-        TOPIC,
-        bootstrap_servers=KAFKA_BOOTSTRAP,
-        group_id="analytics-db-writer",
-        enable_auto_commit=True,
-        auto_offset_reset="earliest",
+
+def analytics_to_row(data: dict) -> dict:
+    return {
+        "time": datetime.fromtimestamp(float(data["timestamp"]), tz=timezone.utc),
+        "symbol": data["symbol"],
+        "vwap": data["vwap"],
+        "volatility": data["volatility"],
+        "pct_change": data["pct_change"],
+        "avg_volume": data["avg_volume"],
+        "volume_spike": data["volume_spike"],
+    }
+
+
+def insert_analytics(rows: List[dict], table=Analytics.__table__):
+    """Bulk INSERT that skips rows already stored, so replays are no-ops."""
+    return (
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["time", "symbol"])
     )
 
-    while True:
-        try:
-            await consumer.start()
-            print("🔥 Analytics DB Consumer connected to Kafka.")
-            break
-        except Exception:
-            print("⚠️ DB Consumer waiting for Kafka...")
-            await asyncio.sleep(3)
-
-    try:
-        async for msg in consumer:
-            try:
-                data = json.loads(msg.value.decode("utf-8"))
-                ts = datetime.fromtimestamp(data["timestamp"])
 
-                async with async_session() as session:
-                    row = Analytics(
-                        time=ts,
-                        symbol=data["symbol"],
-                        vwap=data["vwap"],
-                        volatility=data["volatility"],
-                        pct_change=data["pct_change"],
-                        avg_volume=data["avg_volume"],
-                        volume_spike=data["volume_spike"],
-                    )
+class BatchAnalyticsWriter:
+    """Durable ingestion-hub sink writing analytics batches to Postgres."""
 
-                    session.add(row)
-                    await session.commit()
+    def __init__(self, db_engine: AsyncEngine) -> None:
+        self._engine = db_engine
 
-                print(f"💾 Saved analytics → {data['symbol']} @ {ts}")
+        self.written = 0
+        self.skipped = 0
 
+    async def write(self, messages: List[dict]) -> None:
+        rows = []
+        for data in messages:
+            try:
+                rows.append(analytics_to_row(data))
             except Exception as e:
-                print(f"⚠️ Error inserting analytics: {e}")
+                self.skipped += 1
+                logger.warning("Skipping malformed analytics message: %s", e)
+
+        if rows:
+            self.written += await self._write(rows)
+
+    async def _write(self, rows: List[dict]) -> int:
+        """Write `rows`; returns how many were written."""
+        first_started = time.perf_counter()
+        written = await retry(
+            lambda: self._insert(rows), RETRYABLE_ERRORS, "Analytics batch write", logger
+        )
+        DB_WRITE_SECONDS.observe(time.perf_counter() - first_started)
+        DB_WRITE_BATCH_SIZE.observe(len(rows))
+        return written
+
+    async def _insert(self, rows: List[dict]) -> int:
+        started = time.perf_counter()
+        try:
+            async with self._engine.begin() as conn:
+                for i in range(0, len(rows), INSERT_CHUNK_ROWS):
+                    await conn.execute(insert_analytics(rows[i:i + INSERT_CHUNK_ROWS]))
+            written = len(rows)
+        except RETRYABLE_ERRORS:
+            raise
+        except SQLAlchemyError as e:
+            logger.warning(
+                "Analytics batch of %d rows rejected (%s); writing row by row",
+                len(rows), e,
+            )
+            written = await self._write_rows(rows)
+        logger.debug(
+            "Wrote %d analytics rows in %.1f ms",
+            written,
+            (time.perf_counter() - started) * 1000,
+        )
+        return written
+
+    async def _write_rows(self, rows: List[dict]) -> int:
+        """One transaction per row, skipping rows the database rejects."""
+        written = 0
+        for row in rows:
+            try:
+                async with self._engine.begin() as conn:
+                    await conn.execute(insert_analytics([row]))
+                written += 1
+            except RETRYABLE_ERRORS:
+                raise
+            except SQLAlchemyError as e:
+                self.skipped += 1
+                logger.warning(
+                    "Skipping analytics row %s @ %s rejected by the database: %s",
+                    row["symbol"], row["time"], e,
+                )
+        return written
+
 
-    finally:
-        await consumer.stop()
+analytics_db_writer = BatchAnalyticsWriter(engine)
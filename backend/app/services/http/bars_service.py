@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from typing import Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+
+# interval -> continuous aggregate (alembic revision 8d1b5e2f4a60)
+BAR_VIEWS: Dict[str, str] = {
+    "1s": "bars_1s",
+    "1m": "bars_1m",
+    "5m": "bars_5m",
+    "1h": "bars_1h",
+}
+
+BAR_INTERVAL_MS: Dict[str, int] = {
+    "1s": 1000,
+    "1m": 60_000,
+    "5m": 300_000,
+    "1h": 3_600_000,
+}
+
+# Newest `limit` bars in the range, via the aggregate's (symbol, bucket DESC)
+# index; reversed to oldest-first below.
+BARS_QUERY = """
+SELECT bucket, open, high, low, close, volume, trades
+FROM {view}
+WHERE symbol = :symbol
+  AND bucket >= :start
+  AND bucket < :end
+ORDER BY bucket DESC
+LIMIT :limit
+"""
+
+
+def _from_ms(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc)
+
+
+class BarsService:
+    @staticmethod
+    async def get_bars(
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        limit: int,
+        db: AsyncSession,
+    ) -> List[dict]:
+        """OHLCV bars for `symbol` in [start_ms, end_ms), oldest first."""
+        rows = await db.execute(
+            text(BARS_QUERY.format(view=BAR_VIEWS[interval])),
+            {
+                "symbol": symbol,
+                "start": _from_ms(start_ms),
+                "end": _from_ms(end_ms),
+                "limit": limit,
+            },
+        )
+
+        return [
+            {
+                "timestamp_ms": int(bucket.timestamp() * 1000),
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "count": trades,
+            }
+            for bucket, open_, high, low, close, volume, trades in reversed(rows.fetchall())
+        ]
@@ -1,6 +1,70 @@
-from typing import Dict, List
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+
+# First price per symbol in [day_start, day_end). The plain range on `ts`
+# (instead of `ts::date = ...`) lets TimescaleDB exclude chunks and use the
+# (symbol, ts) primary key; DISTINCT ON keeps the earliest row per symbol.
+BASELINES_QUERY = text(
+    """
+    SELECT DISTINCT ON (symbol) symbol, price
+    FROM ticks
+    WHERE symbol IN :symbols
+      AND ts >= :day_start
+      AND ts < :day_end
+    ORDER BY symbol, ts ASC
+    """
+).bindparams(bindparam("symbols", expanding=True))
+
+
+def trading_day(ts: Optional[float] = None) -> date:
+    """UTC calendar day of an epoch timestamp (now if omitted)."""
+    if ts is None:
+        return datetime.now(timezone.utc).date()
+    return datetime.fromtimestamp(ts, timezone.utc).date()
+
+
+class DailyBaselineCache:
+    """Opening price per symbol for the current trading day."""
+
+    def __init__(self) -> None:
+        self._day: Optional[date] = None
+        self._prices: Dict[str, float] = {}
+        self._first_observed: Optional[date] = None
+
+    def observe(self, tick: dict) -> None:
+        day = trading_day(float(tick["timestamp"]))
+        if self._first_observed is None:
+            self._first_observed = day
+        if self._day is not None and day < self._day:
+            return
+        self._roll(day)
+
+        if day > self._first_observed and tick["symbol"] not in self._prices:
+            self._prices[tick["symbol"]] = float(tick["price"])
+
+    def lookup(self, day: date, symbols: List[str]) -> Dict[str, float]:
+        self._roll(day)
+        if day != self._day:
+            return {}
+        return {s: self._prices[s] for s in symbols if s in self._prices}
+
+    def store(self, day: date, prices: Dict[str, float]) -> None:
+        self._roll(day)
+        if day != self._day:
+            return
+        for symbol, price in prices.items():
+            self._prices.setdefault(symbol, price)
+
+    def _roll(self, day: date) -> None:
+        if self._day is None or day > self._day:
+            self._day = day
+            self._prices = {}
+
+
+daily_baselines = DailyBaselineCache()
+
 
 class BaselineService:
     @staticmethod
@@ -11,24 +75,25 @@ class BaselineService:
         """
         Returns {symbol: first_price_today} for each symbol that has ticks today.
         """
-        result: Dict[str, float] = {}
-
-        for sym in symbols:
-            rows = await db.execute(
-                text(
-                    """
-                    SELECT price
-                    FROM ticks
-                    WHERE symbol = :symbol
-                      AND ts::date = CURRENT_DATE
-                    ORDER BY ts ASC
-                    LIMIT 1
-                    """
-                ),
-                {"symbol": sym},
-            )
-            row = rows.fetchone()
-            if row is not None:
-                result[sym] = float(row[0])
-
-        return result
\ No newline at end of file
+        symbols = list(dict.fromkeys(symbols))
+        day = trading_day()
+
+        result = daily_baselines.lookup(day, symbols)
+        missing = [s for s in symbols if s not in result]
+        if not missing:
+            return result
+
+        day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        rows = await db.execute(
+            BASELINES_QUERY,
+            {
+                "symbols": missing,
+                "day_start": day_start,
+                "day_end": day_start + timedelta(days=1),
+            },
+        )
+        fetched = {symbol: float(price) for symbol, price in rows.fetchall()}
+        daily_baselines.store(day, fetched)
+
+        result.update(fetched)
+        return result
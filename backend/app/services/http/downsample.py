@@ -0,0 +1,115 @@
+import math
+import re
+from typing import List, Optional
+
+import numpy as np
+
+_BUCKET_RE = re.compile(r"^(\d+)([smh])$")
+_UNIT_MS = {"s": 1000, "m": 60_000, "h": 3_600_000}
+
+
+def parse_bucket(bucket: str) -> int:
+    """'10s' / '1m' / '1h' -> bucket width in milliseconds."""
+    match = _BUCKET_RE.match(bucket.strip().lower())
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid bucket {bucket!r}; expected e.g. 10s, 1m, 5m, 1h")
+    return int(match.group(1)) * _UNIT_MS[match.group(2)]
+
+
+def lttb_indices(ts: np.ndarray, values: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB: indices of `n_out` points that best keep the series' shape."""
+    n = len(ts)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = ts.astype(np.float64)
+    y = values.astype(np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of each bucket, used as the third triangle vertex.
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            next_x, next_y = avg_x[i + 1], avg_y[i + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+
+        px, py = x[prev], y[prev]
+        areas = np.abs(
+            (px - next_x) * (y[start:end] - py) - (px - x[start:end]) * (next_y - py)
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def ohlcv(
+    ts: np.ndarray,
+    price: np.ndarray,
+    volume: np.ndarray,
+    bucket_ms: int,
+) -> List[dict]:
+    """Aggregate time-sorted ticks into OHLCV bars of `bucket_ms` width."""
+    if len(ts) == 0:
+        return []
+
+    bucket_ids = ts // bucket_ms
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_ids)) + 1))
+    ends = np.concatenate((starts[1:], [len(ts)]))
+
+    columns = zip(
+        (bucket_ids[starts] * bucket_ms).tolist(),
+        price[starts].tolist(),
+        np.maximum.reduceat(price, starts).tolist(),
+        np.minimum.reduceat(price, starts).tolist(),
+        price[ends - 1].tolist(),
+        np.add.reduceat(volume.astype(np.int64), starts).tolist(),
+        (ends - starts).tolist(),
+    )
+
+    return [
+        {
+            "timestamp_ms": t,
+            "open": o,
+            "high": h,
+            "low": lo,
+            "close": c,
+            "volume": v,
+            "count": count,
+        }
+        for t, o, h, lo, c, v, count in columns
+    ]
+
+
+def downsample(
+    symbol: str,
+    ts: np.ndarray,
+    price: np.ndarray,
+    volume: np.ndarray,
+    max_points: Optional[int] = None,
+    bucket_ms: Optional[int] = None,
+) -> List[dict]:
+    """OHLCV bars with `bucket_ms`, otherwise LTTB-selected raw ticks."""
+    if bucket_ms is not None:
+        if max_points is not None and max_points > 1 and len(ts) > 0:
+            needed = math.ceil(int(ts[-1] - ts[0]) / (max_points - 1))
+            bucket_ms *= max(1, math.ceil(needed / bucket_ms))
+        return ohlcv(ts, price, volume, bucket_ms)
+
+    keep = lttb_indices(ts, price, max_points) if max_points else np.arange(len(ts))
+    return [
+        {"symbol": symbol, "price": p, "volume": v, "timestamp_ms": t}
+        for t, p, v in zip(
+            ts[keep].tolist(), price[keep].tolist(), volume[keep].tolist()
+        )
+    ]
@@ -1,27 +1,137 @@
-from aiokafka import AIOKafkaProducer
 import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
 
-KAFKA_BROKER = "kafka:9092"
+from aiokafka.client import AIOKafkaClient
+from sqlalchemy import text
 
-class HealthService:
-    @staticmethod
-    async def check_kafka() -> bool:
-        """Return True if we can successfully connect to Kafka."""
-        producer = AIOKafkaProducer(bootstrap_servers=KAFKA_BROKER)
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.redis_client import redis_client
+from app.db.session import engine
+from app.services.ingestion import ingestion_hub
+
+
+class HealthMonitor:
+    """Probes Kafka, Redis and Postgres in the background and keeps the last result."""
+
+    def __init__(
+        self,
+        interval_s: float,
+        timeout_s: float,
+        stale_after_s: float,
+    ) -> None:
+        self._interval_s = interval_s
+        self._timeout_s = timeout_s
+        self._stale_after_s = stale_after_s
+        self._kafka: Optional[AIOKafkaClient] = None
+
+        self._checks: Dict[str, dict] = {}
+        self._consumer_lag: Dict[str, Optional[int]] = {}
+        self._checked_at: Optional[float] = None  # time.time() of the last round
+
+    async def run(self) -> None:
         try:
-            await producer.start()
-            return True
-        except Exception:
-            return False
+            while True:
+                await self.probe()
+                await asyncio.sleep(self._interval_s)
         finally:
-            try:
-                await producer.stop()
-            except Exception:
-                pass
+            await self._close_kafka()
+
+    async def probe(self) -> None:
+        probes: Dict[str, Callable[[], Awaitable[dict]]] = {
+            "kafka": self._probe_kafka,
+            "redis": self._probe_redis,
+            "postgres": self._probe_postgres,
+        }
+        results = await asyncio.gather(*(self._timed(fn) for fn in probes.values()))
+
+        self._checks = dict(zip(probes, results))
+        self._consumer_lag = {
+            group_id: feed["consumer_lag"] for group_id, feed in ingestion_hub.stats().items()
+        }
+        self._checked_at = time.time()
+
+    def snapshot(self) -> dict:
+        if self._checked_at is None:
+            return {"status": "starting", "stale": True, "age_s": None, "checks": {}}
+
+        age_s = time.time() - self._checked_at
+        stale = age_s > self._stale_after_s
+        checks = self._checks
+
+        health = {name: check["ok"] and not stale for name, check in checks.items()}
+        if stale:
+            status = "stale"
+        elif all(health.values()):
+            status = "ok"
+        else:
+            status = "degraded"
 
-    @classmethod
-    async def get_health(cls) -> dict:
-        kafka_ok = await cls.check_kafka()
         return {
-            "kafka": kafka_ok,
-        }
\ No newline at end of file
+            **health,
+            "status": status,
+            "stale": stale,
+            "age_s": round(age_s, 3),
+            "checks": checks,
+            "consumer_lag": self._consumer_lag,
+        }
+
+    async def _timed(self, probe: Callable[[], Awaitable[dict]]) -> dict:
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(probe(), self._timeout_s)
+            result = {"ok": True, **detail}
+        except Exception as exc:
+            result = {"ok": False, "error": str(exc) or type(exc).__name__}
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    async def _probe_kafka(self) -> dict:
+        if self._kafka is None:
+            client = AIOKafkaClient(bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS)
+            try:
+                await client.bootstrap()
+            except BaseException:
+                await client.close()
+                raise
+            self._kafka = client
+
+        try:
+            metadata = await self._kafka.fetch_all_metadata()
+        except Exception:
+            # Re-bootstrap next round in case the cluster moved.
+            await self._close_kafka()
+            raise
+        return {"brokers": len(metadata.brokers())}
+
+    async def _probe_redis(self) -> dict:
+        await redis_client.ping()
+        return {}
+
+    async def _probe_postgres(self) -> dict:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return {}
+
+    async def _close_kafka(self) -> None:
+        client, self._kafka = self._kafka, None
+        if client is not None:
+            try:
+                await client.close()
+            except Exception as exc:
+                logger.warning("Closing Kafka health client failed: %s", exc)
+
+
+health_monitor = HealthMonitor(
+    interval_s=settings.HEALTH_PROBE_INTERVAL_S,
+    timeout_s=settings.HEALTH_PROBE_TIMEOUT_S,
+    stale_after_s=settings.HEALTH_STALE_AFTER_S,
+)
+
+
+class HealthService:
+    @staticmethod
+    def get_health() -> dict:
+        """Latest background probe results; never touches the dependencies."""
+        return health_monitor.snapshot()
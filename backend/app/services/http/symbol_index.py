@@ -0,0 +1,146 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from symbols import SymbolConfig
+
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Z]+")
+_MAX_CHAR = "￿"
+NGRAM = 3
+
+
+def normalize(text: str) -> str:
+    """Upper-case, apostrophes dropped, other punctuation collapsed to spaces."""
+    return _NON_ALNUM_RE.sub(" ", text.upper().replace("'", "")).strip()
+
+
+def ngrams(text: str) -> Set[str]:
+    """Character trigrams of each word in `text` (already normalized)."""
+    return {
+        word[i:i + NGRAM]
+        for word in text.split()
+        for i in range(len(word) - NGRAM + 1)
+    }
+
+
+def _short_substrings(symbol: str) -> Set[str]:
+    return {
+        symbol[i:i + n]
+        for n in range(1, NGRAM)
+        for i in range(len(symbol) - n + 1)
+    }
+
+
+class SymbolIndex:
+    """Prebuilt search over ticker symbols and company names."""
+
+    def __init__(self, configs: Iterable[SymbolConfig]) -> None:
+        self._insertion_order: List[SymbolConfig] = list(configs)
+        self._configs: List[SymbolConfig] = sorted(
+            self._insertion_order, key=lambda cfg: cfg.symbol
+        )
+        self._symbols: List[str] = [cfg.symbol.upper() for cfg in self._configs]
+        self._ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._names: List[str] = [normalize(cfg.name) for cfg in self._configs]
+
+        words: List[Tuple[str, int]] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        short_postings: Dict[str, List[int]] = defaultdict(list)
+        for i, (symbol, name) in enumerate(zip(self._symbols, self._names)):
+            words.extend((word, i) for word in set(name.split()))
+            for gram in ngrams(f"{symbol} {name}"):
+                postings[gram].append(i)
+            for sub in _short_substrings(symbol):
+                short_postings[sub].append(i)
+        words.sort()
+
+        self._words: List[str] = [word for word, _ in words]
+        self._word_ids: List[int] = [i for _, i in words]
+        self._postings: Dict[str, np.ndarray] = {
+            gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+        self._short_postings: Dict[str, List[int]] = dict(short_postings)
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def search(self, query: str, limit: int = 10) -> List[SymbolConfig]:
+        cleaned = query.strip().upper()
+        if not cleaned:
+            return self._insertion_order[:limit]
+
+        text = normalize(cleaned)
+        found: List[int] = []
+        seen: Set[int] = set()
+        for tier in (
+            self._exact(cleaned),
+            self._symbol_prefix(cleaned),
+            self._word_prefix(text),
+            self._ngram_matches(cleaned, text),
+        ):
+            for i in tier:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+                    if len(found) == limit:
+                        return [self._configs[i] for i in found]
+
+        return [self._configs[i] for i in found]
+
+    def _exact(self, query: str) -> Iterator[int]:
+        i = self._ids.get(query)
+        if i is not None:
+            yield i
+
+    def _symbol_prefix(self, query: str) -> Iterator[int]:
+        yield from self._prefix_range(self._symbols, query)
+
+    def _word_prefix(self, text: str) -> Iterator[int]:
+        if not text:
+            return
+        # Multi-word queries ("bank of") walk the range of their rarest
+        # word and must contain the whole phrase.
+        rarest = min(text.split(), key=self._word_count)
+        for j in self._prefix_range(self._words, rarest):
+            i = self._word_ids[j]
+            if text in self._names[i]:
+                yield i
+
+    def _word_count(self, prefix: str) -> int:
+        start = bisect_left(self._words, prefix)
+        return bisect_left(self._words, prefix + _MAX_CHAR, start) - start
+
+    def _ngram_matches(self, query: str, text: str) -> Iterator[int]:
+        """Tiers 4 and 5: substring, then fuzzy matches."""
+        if len(query) < NGRAM:
+            yield from self._short_postings.get(query, ())
+            return
+
+        grams = ngrams(text)
+        postings = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not postings:
+            return
+        hits = np.bincount(np.concatenate(postings), minlength=len(self._configs))
+
+        if len(postings) == len(grams):
+            for i in np.flatnonzero(hits == len(grams)).tolist():
+                if query in self._symbols[i] or text in self._names[i]:
+                    yield i
+
+        need = (len(grams) + 1) // 2
+        if len(grams) < 2 or len(postings) < need:
+            return
+        candidates = np.flatnonzero(hits >= need)
+        # Stable sort: most hits first, ties in id (alphabetical) order.
+        order = np.argsort(-hits[candidates], kind="stable")
+        yield from candidates[order].tolist()
+
+    @staticmethod
+    def _prefix_range(keys: Sequence[str], prefix: str) -> Iterator[int]:
+        for j in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[j].startswith(prefix):
+                return
+            yield j
@@ -1,29 +1,22 @@
 from typing import List
 from symbols import SYMBOL_CONFIGS, SymbolConfig
 
+from app.services.http.symbol_index import SymbolIndex
+
+# Built once at import; SYMBOL_CONFIGS is static for the process lifetime.
+symbol_index = SymbolIndex(SYMBOL_CONFIGS)
+
 class SymbolsService:
     @staticmethod
     async def search_symbols(query: str, limit: int = 10) -> List[SymbolConfig]:
         """
-        Search available symbols from shared.symbols.SYMBOL_CONFIGS.
+        Search available symbols from shared.symbols.SYMBOL_CONFIGS by
+        ticker or company name.
 
         - If query is empty → first `limit` symbols.
-        - Otherwise → symbols that START with query first, then those that
-          just CONTAIN it.
+        - Otherwise → exact symbol, then symbols that START with query,
+          names with a word starting with it, symbols or names that
+          CONTAIN it, and finally close (typo-tolerant) matches.
+          See SymbolIndex.
         """
-        cleaned = query.strip().upper()
-
-        if cleaned == "":
-            return SYMBOL_CONFIGS[:limit]
-
-        starts_with: List[SymbolConfig] = [
-            cfg for cfg in SYMBOL_CONFIGS
-            if cfg.symbol.startswith(cleaned)
-        ]
-
-        contains: List[SymbolConfig] = [
-            cfg for cfg in SYMBOL_CONFIGS
-            if cleaned in cfg.symbol and cfg not in starts_with
-        ]
-
-        return (starts_with + contains)[:limit]
\ No newline at end of file
+        return symbol_index.search(query, limit)
@@ -1,14 +1,33 @@
-import json
+import struct
+import time
+import orjson
+import numpy as np
 from datetime import datetime, timezone
-from app.core.redis_client import redis_client
+from typing import AsyncIterator, Dict, List, Optional
+from redis.asyncio import Redis
+from app.core.config import settings
+from app.core.redis_client import redis_client, redis_binary_client
+from app.services.http.downsample import downsample
 
 WINDOW_MS = 24 * 60 * 60 * 1000
 
+# symbol -> JSON of its newest tick, for bulk latest-tick reads. Kept out
+# of the `ticks:{symbol}` namespace so it can never collide with a symbol.
+LATEST_HASH_KEY = "ticklatest"
+
+# timestamp_ms, price, volume -- 20 bytes, no padding.
+PACKED_TICK = np.dtype([("ts", "<i8"), ("price", "<f8"), ("volume", "<u4")])
+_PACKED_TICK = struct.Struct("<qdI")
+
 
 def now_ms():
     return int(datetime.now(timezone.utc).timestamp() * 1000)
 
-async def add_tick_to_redis(tick: dict):
+def tick_key(symbol: str) -> str:
+    return f"ticks:{symbol}"
+
+def serialize_tick(tick: dict):
+    """Return (sorted-set member, score) for a tick."""
     ts_ms = int(float(tick["timestamp"]) * 1000)
 
     data = {
@@ -18,26 +37,345 @@ async def add_tick_to_redis(tick: dict):
         "timestamp_ms": ts_ms,
     }
 
-    key = f"ticks:{data['symbol']}"
-    serialized = json.dumps(data)
+    return orjson.dumps(data), ts_ms
+
+
+def stage_latest(pipe, ticks: List[dict]) -> None:
+    """Queue one HSET of the newest tick per symbol in `ticks`."""
+    newest: Dict[str, tuple] = {}
+    for tick in ticks:
+        member, ts_ms = serialize_tick(tick)
+        symbol = tick["symbol"]
+        if symbol not in newest or ts_ms >= newest[symbol][0]:
+            newest[symbol] = (ts_ms, member)
+
+    if newest:
+        pipe.hset(
+            LATEST_HASH_KEY,
+            mapping={symbol: member for symbol, (_, member) in newest.items()},
+        )
+
+
+class ZSetTickStore:
+    """One sorted set of JSON ticks per symbol (`ticks:{symbol}`), scored by timestamp_ms."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        trim_interval_s: float = 10.0,
+        window_ms: int = WINDOW_MS,
+    ) -> None:
+        self._redis = redis
+        self._trim_interval_s = trim_interval_s
+        self._window_ms = window_ms
+        self._last_trim: Dict[str, float] = {}
+        self._staged_trims: Dict[str, float] = {}
+
+    def stage(self, pipe, ticks: List[dict]) -> None:
+        members: Dict[str, Dict[bytes, int]] = {}
+        newest: Dict[str, int] = {}
+        for tick in ticks:
+            key = tick_key(tick["symbol"])
+            member, ts_ms = serialize_tick(tick)
+            members.setdefault(key, {})[member] = ts_ms
+            if ts_ms > newest.get(key, 0):
+                newest[key] = ts_ms
+
+        for key, mapping in members.items():
+            pipe.zadd(key, mapping)
+
+        now = time.monotonic()
+        self._staged_trims = {}
+        for key, ts_ms in newest.items():
+            last_trim = self._last_trim.get(key)
+            if last_trim is None or now - last_trim >= self._trim_interval_s:
+                pipe.zremrangebyscore(key, 0, ts_ms - self._window_ms)
+                self._staged_trims[key] = now
+
+    def executed(self) -> None:
+        """Record the trims staged by the last `stage()`; call after its pipeline ran."""
+        self._last_trim.update(self._staged_trims)
+        self._staged_trims = {}
+
+    async def read_range(self, symbol: str, start_ms: int, end_ms: int) -> List[dict]:
+        raw_items = await self._redis.zrangebyscore(tick_key(symbol), start_ms, end_ms)
+        return [orjson.loads(item) for item in raw_items]
+
+    async def iter_range(
+        self, symbol: str, start_ms: int, end_ms: int, page_size: int = 5000
+    ) -> AsyncIterator[List]:
+        """Yield the stored JSON members in [start_ms, end_ms], `page_size` at a time."""
+        cursor, skip = start_ms, 0
+        while True:
+            page = await self._redis.zrangebyscore(
+                tick_key(symbol), cursor, end_ms,
+                start=skip, num=page_size, withscores=True,
+            )
+            if not page:
+                return
+
+            yield [member for member, _ in page]
+
+            if len(page) < page_size:
+                return
+
+            last = page[-1][1]
+            ties = sum(1 for _, score in page if score == last)
+            skip = skip + ties if last == cursor else ties
+            cursor = last
+
+    async def read_columns(self, symbol: str, start_ms: int, end_ms: int) -> np.ndarray:
+        ticks = await self.read_range(symbol, start_ms, end_ms)
+        records = np.empty(len(ticks), dtype=PACKED_TICK)
+        records["ts"] = [t["timestamp_ms"] for t in ticks]
+        records["price"] = [t["price"] for t in ticks]
+        records["volume"] = [t["volume"] for t in ticks]
+        return records
+
+    async def read_latest(self, symbol: str) -> Optional[dict]:
+        raw = await self._redis.zrevrange(tick_key(symbol), 0, 0)
+        if not raw:
+            return None
+        return orjson.loads(raw[0])
+
+
+class BucketTickStore:
+    """Binary ticks in per-minute `tickbin:` keys; needs a decode_responses=False client."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        window_ms: int = WINDOW_MS,
+        bucket_ms: int = 60_000,
+    ) -> None:
+        self._redis = redis
+        self._window_ms = window_ms
+        self._bucket_ms = bucket_ms
+        self._ttl_s = (window_ms + bucket_ms) // 1000
+
+    def bucket_key(self, symbol: str, bucket: int) -> str:
+        return f"tickbin:{symbol}:{bucket}"
+
+    def stage(self, pipe, ticks: List[dict], update_latest: bool = True) -> None:
+        blobs: Dict[tuple, List[bytes]] = {}
+        latest: Dict[str, tuple] = {}
+
+        for tick in ticks:
+            symbol = tick["symbol"]
+            ts_ms = int(float(tick["timestamp"]) * 1000)
+            record = _PACKED_TICK.pack(ts_ms, tick["price"], tick["volume"])
+
+            blobs.setdefault((symbol, ts_ms // self._bucket_ms), []).append(record)
+            if symbol not in latest or ts_ms >= latest[symbol][0]:
+                latest[symbol] = (ts_ms, record)
+
+        for (symbol, bucket), parts in blobs.items():
+            key = self.bucket_key(symbol, bucket)
+            pipe.append(key, b"".join(parts))
+            pipe.pexpireat(key, (bucket + 1) * self._bucket_ms + self._window_ms)
+
+        if update_latest:
+            for symbol, (_, record) in latest.items():
+                pipe.set(f"tickbin:{symbol}:latest", record, ex=self._ttl_s)
+
+    def executed(self) -> None:
+        pass
 
-    await redis_client.zadd(key, {serialized: ts_ms})
+    async def read_range(self, symbol: str, start_ms: int, end_ms: int) -> List[dict]:
+        records = await self.read_columns(symbol, start_ms, end_ms)
+        return [
+            {"symbol": symbol, "price": price, "volume": volume, "timestamp_ms": ts}
+            for ts, price, volume in zip(
+                records["ts"].tolist(),
+                records["price"].tolist(),
+                records["volume"].tolist(),
+            )
+        ]
 
-    await redis_client.zremrangebyscore(key, 0, ts_ms - WINDOW_MS)
+    async def iter_range(
+        self, symbol: str, start_ms: int, end_ms: int, page_size: int = 5000
+    ) -> AsyncIterator[List]:
+        """Yield ticks in [start_ms, end_ms] as JSON lines, one hour of buckets per read."""
+        step_ms = max(self._bucket_ms, 3_600_000 // self._bucket_ms * self._bucket_ms)
+        page_start = start_ms
+        while page_start <= end_ms:
+            page_end = min(end_ms, page_start + step_ms - 1)
+            records = await self.read_columns(symbol, page_start, page_end)
 
-async def get_ticks_from_redis(symbol: str, lookback_hours: int = 24):
-    key = f"ticks:{symbol}"
+            for i in range(0, len(records), page_size):
+                chunk = records[i:i + page_size]
+                yield [
+                    orjson.dumps(
+                        {"symbol": symbol, "price": price, "volume": volume, "timestamp_ms": ts}
+                    )
+                    for ts, price, volume in zip(
+                        chunk["ts"].tolist(),
+                        chunk["price"].tolist(),
+                        chunk["volume"].tolist(),
+                    )
+                ]
+
+            page_start = page_end + 1
+
+    async def read_columns(self, symbol: str, start_ms: int, end_ms: int) -> np.ndarray:
+        """Ticks in [start_ms, end_ms] as a time-sorted PACKED_TICK array."""
+        keys = [
+            self.bucket_key(symbol, bucket)
+            for bucket in range(start_ms // self._bucket_ms, end_ms // self._bucket_ms + 1)
+        ]
+
+        pipe = self._redis.pipeline(transaction=False)
+        for i in range(0, len(keys), 500):
+            pipe.mget(keys[i:i + 500])
+        chunks = await pipe.execute()
+
+        blob = b"".join(part for chunk in chunks for part in chunk if part)
+        records = np.frombuffer(blob, dtype=PACKED_TICK)
+        records = records[(records["ts"] >= start_ms) & (records["ts"] <= end_ms)]
+        return records[np.argsort(records["ts"], kind="stable")]
+
+    async def read_latest(self, symbol: str) -> Optional[dict]:
+        raw = await self._redis.get(f"tickbin:{symbol}:latest")
+        if not raw:
+            return None
+        record = np.frombuffer(raw, dtype=PACKED_TICK)[0]
+        return {
+            "symbol": symbol,
+            "price": float(record["price"]),
+            "volume": int(record["volume"]),
+            "timestamp_ms": int(record["ts"]),
+        }
+
+    async def earliest_ms(self, symbol: str, end_ms: int) -> Optional[int]:
+        """Timestamp of the oldest retained tick for `symbol`, if any."""
+        first = (end_ms - self._window_ms) // self._bucket_ms
+        buckets = list(range(first, end_ms // self._bucket_ms + 1))
+
+        pipe = self._redis.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.exists(self.bucket_key(symbol, bucket))
+        present = await pipe.execute()
+
+        for bucket, exists in zip(buckets, present):
+            if exists:
+                raw = await self._redis.get(self.bucket_key(symbol, bucket))
+                return int(np.frombuffer(raw, dtype=PACKED_TICK)["ts"].min())
+        return None
+
+
+class DualTickStore:
+    """Writes both layouts and reads from the sorted sets, while migrating."""
+
+    def __init__(self, primary, secondary) -> None:
+        self._primary = primary
+        self._secondary = secondary
+
+    def stage(self, pipe, ticks: List[dict]) -> None:
+        self._primary.stage(pipe, ticks)
+        self._secondary.stage(pipe, ticks)
+
+    def executed(self) -> None:
+        self._primary.executed()
+        self._secondary.executed()
+
+    async def read_range(self, symbol: str, start_ms: int, end_ms: int) -> List[dict]:
+        return await self._primary.read_range(symbol, start_ms, end_ms)
+
+    def iter_range(
+        self, symbol: str, start_ms: int, end_ms: int, page_size: int = 5000
+    ) -> AsyncIterator[List]:
+        return self._primary.iter_range(symbol, start_ms, end_ms, page_size)
+
+    async def read_columns(self, symbol: str, start_ms: int, end_ms: int) -> np.ndarray:
+        return await self._primary.read_columns(symbol, start_ms, end_ms)
+
+    async def read_latest(self, symbol: str) -> Optional[dict]:
+        return await self._primary.read_latest(symbol)
+
+
+def build_tick_store(layout: str, redis: Redis, redis_binary: Redis):
+    if layout == "zset":
+        return ZSetTickStore(redis, settings.REDIS_TRIM_INTERVAL_S)
+    if layout == "bucketed":
+        return BucketTickStore(redis_binary)
+    if layout == "dual":
+        return DualTickStore(
+            ZSetTickStore(redis, settings.REDIS_TRIM_INTERVAL_S),
+            BucketTickStore(redis_binary),
+        )
+    raise ValueError(f"Unknown REDIS_TICK_STORAGE: {layout}")
+
+
+tick_store = build_tick_store(
+    settings.REDIS_TICK_STORAGE,
+    redis_client,
+    redis_binary_client,
+)
+
+async def add_tick_to_redis(tick: dict):
+    pipe = redis_client.pipeline(transaction=False)
+    tick_store.stage(pipe, [tick])
+    stage_latest(pipe, [tick])
+    await pipe.execute()
+    tick_store.executed()
+
+def _window(lookback_hours: int, since_ms: Optional[int]) -> tuple:
+    """[start, end] in ms; `since_ms` is an exclusive cursor inside the lookback."""
     end = now_ms()
     start = end - lookback_hours * 60 * 60 * 1000
+    if since_ms is not None:
+        start = max(start, since_ms + 1)
+    return start, end
+
+async def get_ticks_from_redis(
+    symbol: str,
+    lookback_hours: int = 24,
+    max_points: Optional[int] = None,
+    bucket_ms: Optional[int] = None,
+    since_ms: Optional[int] = None,
+):
+    start, end = _window(lookback_hours, since_ms)
+
+    if max_points is None and bucket_ms is None:
+        return await tick_store.read_range(symbol, start, end)
+
+    records = await tick_store.read_columns(symbol, start, end)
+    return downsample(
+        symbol,
+        records["ts"],
+        records["price"],
+        records["volume"],
+        max_points=max_points,
+        bucket_ms=bucket_ms,
+    )
 
-    raw_items = await redis_client.zrangebyscore(key, start, end)
-    return [json.loads(item) for item in raw_items]
+async def stream_ticks_ndjson(
+    symbol: str,
+    lookback_hours: int = 24,
+    since_ms: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """NDJSON body for a tick range, read and sent one page at a time."""
+    start, end = _window(lookback_hours, since_ms)
+    async for page in tick_store.iter_range(
+        symbol, start, end, settings.REDIS_READ_PAGE_SIZE
+    ):
+        lines = [line.encode("utf-8") if isinstance(line, str) else line for line in page]
+        yield b"\n".join(lines) + b"\n"
 
 async def get_latest_tick(symbol: str):
-    key = f"ticks:{symbol}"
+    return await tick_store.read_latest(symbol)
 
-    raw = await redis_client.zrevrange(key, 0, 0)
-    if not raw:
-        return None
+async def get_latest_ticks(symbols: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+    """Newest tick per symbol from the `ticklatest` hash; unknown symbols map to None."""
+    if symbols is None:
+        raw = await redis_client.hgetall(LATEST_HASH_KEY)
+        return {symbol: orjson.loads(value) for symbol, value in sorted(raw.items())}
+
+    if not symbols:
+        return {}
 
-    return json.loads(raw[0])
\ No newline at end of file
+    values = await redis_client.hmget(LATEST_HASH_KEY, symbols)
+    return {
+        symbol: orjson.loads(value) if value is not None else None
+        for symbol, value in zip(symbols, values)
+    }
@@ -0,0 +1,340 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional
+
+from aiokafka import AIOKafkaConsumer, TopicPartition
+from codec import decode
+from retry import retry
+from tracing import StageTracer, event_time
+
+from app.core.logger import logger
+from app.core.metrics import INGEST_SINK_BATCH_SIZE, INGEST_SINK_SECONDS
+
+
+class Record(NamedTuple):
+    tp: TopicPartition
+    offset: int
+    data: dict
+    received: float  # time.monotonic() when the hub decoded it
+
+
+SinkHandler = Callable[[List[dict]], Awaitable[None]]
+
+
+class Sink:
+    """One consumer of a topic's messages, with its own bounded queue and task."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: SinkHandler,
+        max_queue: int,
+        durable: bool = False,
+        batch_size: int = 500,
+        linger_s: float = 0.0,
+        max_age_s: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.durable = durable
+
+        self._handler = handler
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._linger_s = linger_s
+        self._max_age_s = max_age_s
+        self._queue: Deque[Record] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+
+        self.acked: Dict[TopicPartition, int] = {}
+        self.processed = 0
+        self.dropped = 0
+        self.stale = 0
+        self.errors = 0
+        self.queue_lag_ms = 0.0
+        self.handler_ms = 0.0
+
+        self.tracer: Optional[StageTracer] = None
+        self._seconds_hist = None
+        self._batch_size_hist = None
+
+    def bind_metrics(self, topic: str) -> None:
+        self.tracer = StageTracer(f"{topic}:{self.name}")
+        self._seconds_hist = INGEST_SINK_SECONDS.labels(topic, self.name)
+        self._batch_size_hist = INGEST_SINK_BATCH_SIZE.labels(topic, self.name)
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    async def put(self, record: Record) -> None:
+        if self._max_age_s is not None:
+            ts = event_time(record.data)
+            if ts is not None and time.time() - ts > self._max_age_s:
+                self.stale += 1
+                return
+
+        if self.durable:
+            while len(self._queue) >= self._max_queue:
+                self._space.clear()
+                await self._space.wait()
+        elif len(self._queue) >= self._max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+
+        self._queue.append(record)
+        self._ready.set()
+
+    async def run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+
+            started = time.monotonic()
+            self.queue_lag_ms = (started - batch[0].received) * 1000
+            records = [r.data for r in batch]
+            await self._handle(records)
+            elapsed = time.monotonic() - started
+            self.handler_ms = elapsed * 1000
+            self.processed += len(batch)
+            if self._seconds_hist is not None:
+                self._seconds_hist.observe(elapsed)
+                self._batch_size_hist.observe(len(batch))
+                self.tracer.observe_many(records)
+
+            for r in batch:
+                self.acked[r.tp] = r.offset + 1
+
+    async def _handle(self, records: List[dict]) -> None:
+        """Run the handler; a durable sink retries until it succeeds."""
+        if self.durable:
+            await retry(
+                lambda: self._handler(records),
+                (Exception,),
+                f"Ingest sink {self.name} batch of {len(records)} records",
+                logger,
+                on_retry=self._count_error,
+            )
+            return
+
+        try:
+            await self._handler(records)
+        except Exception as exc:
+            self._count_error(exc)
+            logger.warning(
+                "Ingest sink %s failed on %d records: %s", self.name, len(records), exc
+            )
+
+    def _count_error(self, exc: BaseException) -> None:
+        self.errors += 1
+
+    async def _next_batch(self) -> List[Record]:
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+
+        if self._linger_s and len(self._queue) < self._batch_size:
+            deadline = time.monotonic() + self._linger_s
+            while len(self._queue) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._ready.clear()
+                try:
+                    await asyncio.wait_for(self._ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+        batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+        self._space.set()
+        return batch
+
+    def stats(self) -> dict:
+        return {
+            "durable": self.durable,
+            "queue_depth": len(self._queue),
+            "max_queue": self._max_queue,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "stale": self.stale,
+            "errors": self.errors,
+            "queue_lag_ms": round(self.queue_lag_ms, 2),
+            "handler_ms": round(self.handler_ms, 2),
+        }
+
+
+RecordObserver = Callable[[dict], None]
+
+
+class TopicFeed:
+    """One Kafka consumer group on a topic, fanning decoded messages out to its sinks."""
+
+    def __init__(
+        self,
+        topic: str,
+        group_id: str,
+        auto_offset_reset: str = "latest",
+        commit_interval_s: float = 1.0,
+    ) -> None:
+        self.topic = topic
+        self.group_id = group_id
+        self.auto_offset_reset = auto_offset_reset
+        self.sinks: List[Sink] = []
+        self.observers: List[RecordObserver] = []
+
+        self._commit_interval_s = commit_interval_s
+        self._consumer: Optional[AIOKafkaConsumer] = None
+        self._committed: Dict[TopicPartition, int] = {}
+        self._positions: Dict[TopicPartition, int] = {}
+
+        self.consumed = 0
+        self.decode_errors = 0
+        self.tracer = StageTracer(f"{group_id}:consume")
+
+    @property
+    def durable(self) -> bool:
+        return any(sink.durable for sink in self.sinks)
+
+    async def run(self, bootstrap_servers: str, consumer_factory=AIOKafkaConsumer) -> None:
+        self._consumer = consumer_factory(
+            self.topic,
+            bootstrap_servers=bootstrap_servers,
+            group_id=self.group_id,
+            auto_offset_reset=self.auto_offset_reset,
+            enable_auto_commit=not self.durable,
+        )
+
+        while True:
+            try:
+                await self._consumer.start()
+                logger.info(
+                    "Ingest hub connected to Kafka topic %s (%s)", self.topic, self.group_id
+                )
+                break
+            except Exception:
+                logger.info("Ingest hub waiting for Kafka (%s)...", self.topic)
+                await asyncio.sleep(3)
+
+        sink_tasks = [asyncio.create_task(sink.run()) for sink in self.sinks]
+        last_commit = time.monotonic()
+        try:
+            while True:
+                batches = await self._consumer.getmany(timeout_ms=100)
+                for tp, messages in batches.items():
+                    for m in messages:
+                        await self._dispatch(tp, m)
+
+                if self.durable and time.monotonic() - last_commit >= self._commit_interval_s:
+                    await self._commit()
+                    last_commit = time.monotonic()
+        finally:
+            for task in sink_tasks:
+                task.cancel()
+            await self._consumer.stop()
+
+    async def _dispatch(self, tp: TopicPartition, m) -> None:
+        self._positions[tp] = m.offset + 1
+        try:
+            data = decode(m.value, m.headers)
+        except Exception as exc:
+            self.decode_errors += 1
+            logger.warning("Skipping undecodable %s message: %s", self.topic, exc)
+            return
+
+        self.consumed += 1
+        self.tracer.observe(data)
+        for observe in self.observers:
+            try:
+                observe(data)
+            except Exception as exc:
+                logger.warning(
+                    "%s observer skipped a %s message: %s", self.group_id, self.topic, exc
+                )
+        record = Record(tp, m.offset, data, time.monotonic())
+        for sink in self.sinks:
+            await sink.put(record)
+
+    async def _commit(self) -> None:
+        """Commit, per partition, the lowest offset every durable sink has acknowledged."""
+        durable = [sink for sink in self.sinks if sink.durable]
+        offsets: Dict[TopicPartition, int] = {}
+        for tp in set().union(*(sink.acked for sink in durable)):
+            if all(tp in sink.acked for sink in durable):
+                offset = min(sink.acked[tp] for sink in durable)
+                if offset > self._committed.get(tp, -1):
+                    offsets[tp] = offset
+
+        if offsets:
+            await self._consumer.commit(offsets)
+            self._committed.update(offsets)
+
+    def partition_lag(self) -> Optional[Dict[int, int]]:
+        """Messages behind the broker's high watermark, per assigned partition."""
+        if self._consumer is None:
+            return None
+
+        lag = {}
+        for tp, position in self._positions.items():
+            highwater = self._consumer.highwater(tp)
+            if highwater is not None:
+                lag[tp.partition] = max(0, highwater - position)
+        return lag
+
+    def stats(self) -> dict:
+        lag = self.partition_lag()
+        if lag is not None:
+            lag = sum(lag.values())
+
+        return {
+            "topic": self.topic,
+            "consumed": self.consumed,
+            "decode_errors": self.decode_errors,
+            "consumer_lag": lag,
+            "sinks": {sink.name: sink.stats() for sink in self.sinks},
+        }
+
+
+class IngestionHub:
+    """The backend's Kafka consumers, one TopicFeed per consumer group."""
+
+    def __init__(self, bootstrap_servers: str, consumer_factory=AIOKafkaConsumer) -> None:
+        self._bootstrap_servers = bootstrap_servers
+        self.consumer_factory = consumer_factory
+        self.feeds: Dict[str, TopicFeed] = {}
+
+    def add_feed(
+        self, topic: str, group_id: str, auto_offset_reset: str = "latest"
+    ) -> TopicFeed:
+        feed = TopicFeed(topic, group_id, auto_offset_reset)
+        self.feeds[group_id] = feed
+        return feed
+
+    def register(self, group_id: str, sink: Sink) -> Sink:
+        feed = self.feeds[group_id]
+        if feed.sinks and feed.durable != sink.durable:
+            raise ValueError(
+                f"Feed {group_id} mixes live and durable sinks; a full durable "
+                "queue would stall the live ones"
+            )
+        feed.sinks.append(sink)
+        sink.bind_metrics(feed.topic)
+        return sink
+
+    async def run(self) -> None:
+        await asyncio.gather(
+            *(
+                feed.run(self._bootstrap_servers, self.consumer_factory)
+                for feed in self.feeds.values()
+            )
+        )
+
+    def stats(self) -> dict:
+        return {group_id: feed.stats() for group_id, feed in self.feeds.items()}
+
+    def tracers(self) -> List[StageTracer]:
+        tracers = []
+        for feed in self.feeds.values():
+            tracers.append(feed.tracer)
+            tracers.extend(sink.tracer for sink in feed.sinks if sink.tracer is not None)
+        return tracers
@@ -0,0 +1,70 @@
+from app.core.config import settings
+from app.core.redis_client import redis_client
+from app.services.ingest_hub import IngestionHub, Sink
+from app.services.analytics_consumer import analytics_db_writer
+from app.services.http.baseline_service import daily_baselines
+from app.services.redis_tick_writer import redis_tick_writer
+from app.services.ws.tick_broadcaster import publish_ticks
+from app.services.ws.analytics_broadcaster import publish_analytics
+from app.services.ws.gateway import RedisFramePublisher
+
+TICKS_TOPIC = "market_ticks"
+ANALYTICS_TOPIC = "market_analytics"
+
+# In the ingest role live messages go to Redis pub/sub for the gateways
+# instead of this process's own WebSocket clients.
+if settings.BACKEND_ROLE == "ingest":
+    live_ticks = RedisFramePublisher(redis_client, "ticks").publish
+    live_analytics = RedisFramePublisher(redis_client, "analytics").publish
+else:
+    live_ticks = publish_ticks
+    live_analytics = publish_analytics
+
+ingestion_hub = IngestionHub(settings.KAFKA_BOOTSTRAP_SERVERS)
+
+# Ticks: live only, so the feed auto-commits and starts from the latest offset.
+# Daily baselines are seeded from the feed itself, which sees every tick in
+# either role; the sinks may drop ticks when they fall behind.
+tick_feed = ingestion_hub.add_feed(TICKS_TOPIC, group_id="backend-tick-group")
+tick_feed.observers.append(daily_baselines.observe)
+ingestion_hub.register(
+    "backend-tick-group",
+    Sink("live", live_ticks, settings.INGEST_LIVE_QUEUE_SIZE),
+)
+ingestion_hub.register(
+    "backend-tick-group",
+    Sink("redis", redis_tick_writer.add_many, settings.INGEST_REDIS_QUEUE_SIZE),
+)
+
+# Analytics: the live sink reads through its own consumer group, so a
+# slow or unreachable database, which stalls the durable feed, never holds
+# it up. It skips by event-time age what its feed replays after a restart.
+ingestion_hub.add_feed(ANALYTICS_TOPIC, group_id="backend-analytics-group")
+ingestion_hub.register(
+    "backend-analytics-group",
+    Sink(
+        "live",
+        live_analytics,
+        settings.INGEST_LIVE_QUEUE_SIZE,
+        max_age_s=settings.INGEST_LIVE_MAX_AGE_S,
+    ),
+)
+
+# The DB sink is durable: offsets are committed only once rows are stored
+# and a restart resumes from the last stored message.
+ingestion_hub.add_feed(
+    ANALYTICS_TOPIC,
+    group_id="analytics-db-writer",
+    auto_offset_reset="earliest",
+)
+ingestion_hub.register(
+    "analytics-db-writer",
+    Sink(
+        "db",
+        analytics_db_writer.write,
+        settings.INGEST_DB_QUEUE_SIZE,
+        durable=True,
+        batch_size=settings.ANALYTICS_FLUSH_SIZE,
+        linger_s=settings.ANALYTICS_FLUSH_INTERVAL_S,
+    ),
+)
@@ -0,0 +1,168 @@
+from typing import Iterator, List
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from tracing import StageTracer, StageTracerCollector
+
+from app.core.config import settings
+from app.services.analytics_consumer import analytics_db_writer
+from app.services.ingestion import ingestion_hub
+from app.services.redis_tick_writer import redis_tick_writer
+from app.services.ws.analytics_broadcaster import analytics_fanout
+from app.services.ws.fanout import channel_totals
+from app.services.ws.gateway import gateway_subscriber
+from app.services.ws.tick_broadcaster import tick_fanout
+
+
+def stage_tracers() -> List[StageTracer]:
+    """Staleness tracers for every stage this process runs, in pipeline order."""
+    if settings.BACKEND_ROLE == "gateway":
+        return list(gateway_subscriber.tracers.values())
+    return ingestion_hub.tracers()
+
+
+class BackendCollector(Collector):
+    """Exports the services' plain-int counters at scrape time."""
+
+    def collect(self) -> Iterator[Metric]:
+        yield from self._ingest()
+        yield from self._writers()
+        yield from self._websockets()
+
+    def _ingest(self) -> Iterator[Metric]:
+        consumed = CounterMetricFamily(
+            "tradestream_ingest_consumed",
+            "Messages consumed from Kafka per consumer group.",
+            labels=["topic", "group"],
+        )
+        decode_errors = CounterMetricFamily(
+            "tradestream_ingest_decode_errors",
+            "Undecodable messages skipped per consumer group.",
+            labels=["topic", "group"],
+        )
+        messages = CounterMetricFamily(
+            "tradestream_ingest_messages",
+            "Messages handled per topic and sink.",
+            labels=["topic", "stage"],
+        )
+        dropped = CounterMetricFamily(
+            "tradestream_ingest_dropped",
+            "Records a live sink discarded because its queue was full.",
+            labels=["topic", "sink"],
+        )
+        stale = CounterMetricFamily(
+            "tradestream_ingest_stale",
+            "Records a live sink skipped as older than its freshness bound.",
+            labels=["topic", "sink"],
+        )
+        errors = CounterMetricFamily(
+            "tradestream_ingest_errors",
+            "Failed sink batches.",
+            labels=["topic", "stage"],
+        )
+        depth = GaugeMetricFamily(
+            "tradestream_ingest_queue_depth",
+            "Records queued for an ingestion-hub sink.",
+            labels=["topic", "sink"],
+        )
+        lag = GaugeMetricFamily(
+            "tradestream_kafka_consumer_lag",
+            "Messages behind the partition's high watermark.",
+            labels=["topic", "group", "partition"],
+        )
+
+        for feed in ingestion_hub.feeds.values():
+            topic = feed.topic
+            consumed.add_metric([topic, feed.group_id], feed.consumed)
+            decode_errors.add_metric([topic, feed.group_id], feed.decode_errors)
+            for sink in feed.sinks:
+                messages.add_metric([topic, sink.name], sink.processed)
+                dropped.add_metric([topic, sink.name], sink.dropped)
+                stale.add_metric([topic, sink.name], sink.stale)
+                errors.add_metric([topic, sink.name], sink.errors)
+                depth.add_metric([topic, sink.name], sink.depth)
+            for partition, behind in (feed.partition_lag() or {}).items():
+                lag.add_metric([topic, feed.group_id, str(partition)], behind)
+
+        yield from (consumed, decode_errors, messages, dropped, stale, errors, depth, lag)
+
+    def _writers(self) -> Iterator[Metric]:
+        yield CounterMetricFamily(
+            "tradestream_redis_ticks_written",
+            "Ticks written to Redis.",
+            value=redis_tick_writer.written,
+        )
+        yield CounterMetricFamily(
+            "tradestream_redis_ticks_dropped",
+            "Ticks dropped after failed Redis flushes overflowed the buffer.",
+            value=redis_tick_writer.dropped,
+        )
+        yield CounterMetricFamily(
+            "tradestream_db_rows_written",
+            "Analytics rows written to Postgres.",
+            value=analytics_db_writer.written,
+        )
+        yield CounterMetricFamily(
+            "tradestream_db_rows_skipped",
+            "Analytics messages the DB writer skipped: malformed or rejected by the database.",
+            value=analytics_db_writer.skipped,
+        )
+
+    def _websockets(self) -> Iterator[Metric]:
+        clients = GaugeMetricFamily(
+            "tradestream_ws_clients",
+            "Connected WebSocket clients per stream.",
+            labels=["stream"],
+        )
+        subscribers = GaugeMetricFamily(
+            "tradestream_ws_subscribers",
+            "Clients subscribed per stream and symbol ('*' for wildcard).",
+            labels=["stream", "symbol"],
+        )
+        published = CounterMetricFamily(
+            "tradestream_ws_messages_published",
+            "Messages fanned out to at least one client.",
+            labels=["stream"],
+        )
+        deliveries = CounterMetricFamily(
+            "tradestream_ws_deliveries",
+            "Frames offered to client queues.",
+            labels=["stream"],
+        )
+
+        for engine in (tick_fanout, analytics_fanout):
+            clients.add_metric([engine.name], len(engine))
+            for symbol, count in engine.subscriptions.audience_sizes().items():
+                subscribers.add_metric([engine.name, symbol], count)
+            published.add_metric([engine.name], engine.published)
+            deliveries.add_metric([engine.name], engine.deliveries)
+
+        yield from (clients, subscribers, published, deliveries)
+
+        yield CounterMetricFamily(
+            "tradestream_ws_frames_sent",
+            "Frames written to WebSocket clients.",
+            value=channel_totals.sent,
+        )
+        yield CounterMetricFamily(
+            "tradestream_ws_frames_dropped",
+            "Frames discarded by the slow-consumer policy.",
+            value=channel_totals.dropped,
+        )
+        yield CounterMetricFamily(
+            "tradestream_ws_frames_conflated",
+            "Queued frames replaced by a newer frame for the same symbol.",
+            value=channel_totals.conflated,
+        )
+
+        if settings.BACKEND_ROLE == "gateway":
+            yield CounterMetricFamily(
+                "tradestream_gateway_messages_received",
+                "Messages received from Redis pub/sub.",
+                value=gateway_subscriber.received,
+            )
+
+
+REGISTRY.register(BackendCollector())
+REGISTRY.register(StageTracerCollector(stage_tracers))
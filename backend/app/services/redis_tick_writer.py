@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import List
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import REDIS_WRITE_BATCH_SIZE, REDIS_WRITE_SECONDS
+from app.core.redis_client import redis_client
+from app.services.http.ticks_redis_service import stage_latest, tick_store
+
+
+class RedisTickWriter:
+    """Buffers ticks and writes them to Redis in one pipeline per flush."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        store=tick_store,
+        flush_size: int = 500,
+        flush_interval_s: float = 0.05,
+        max_pending: int = 100_000,
+    ) -> None:
+        self._redis = redis
+        self._store = store
+        self._flush_size = flush_size
+        self._flush_interval_s = flush_interval_s
+        self._max_pending = max_pending
+
+        self._pending: List[dict] = []
+        self._lock = asyncio.Lock()
+
+        self.written = 0
+        self.dropped = 0
+
+    async def add_many(self, ticks: List[dict]) -> None:
+        self._pending.extend(ticks)
+
+        if len(self._pending) >= self._flush_size and not self._lock.locked():
+            await self._flush_logged()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+
+            batch, self._pending = self._pending, []
+
+            pipe = self._redis.pipeline(transaction=False)
+            self._store.stage(pipe, batch)
+            stage_latest(pipe, batch)
+
+            started = time.perf_counter()
+            try:
+                await pipe.execute()
+            except Exception:
+                self._requeue(batch)
+                raise
+            self._store.executed()
+
+            REDIS_WRITE_SECONDS.observe(time.perf_counter() - started)
+            REDIS_WRITE_BATCH_SIZE.observe(len(batch))
+            self.written += len(batch)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            await self._flush_logged()
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.warning("Redis tick flush failed: %s", exc)
+
+    def _requeue(self, batch: List[dict]) -> None:
+        pending = batch + self._pending
+        overflow = len(pending) - self._max_pending
+        if overflow > 0:
+            self.dropped += overflow
+            pending = pending[overflow:]
+        self._pending = pending
+
+
+redis_tick_writer = RedisTickWriter(
+    redis_client,
+    flush_size=settings.REDIS_FLUSH_SIZE,
+    flush_interval_s=settings.REDIS_FLUSH_INTERVAL_S,
+)
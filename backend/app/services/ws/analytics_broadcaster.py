@@ -1,45 +1,25 @@
-import asyncio
-from aiokafka import AIOKafkaConsumer
-import json
+import time
+from typing import List
+from app.core.config import settings
+from app.core.metrics import WS_FANOUT_SECONDS
+from app.services.ws.fanout import FanoutEngine
+from app.services.ws.recent_history import LatestValueCache
+
+latest_analytics = LatestValueCache()
+
+analytics_fanout = FanoutEngine(
+    "analytics",
+    max_queue=settings.WS_CLIENT_QUEUE_SIZE,
+    policy=settings.WS_SLOW_CONSUMER_POLICY,
+    snapshot_source=latest_analytics,
+)
+fanout_seconds = WS_FANOUT_SECONDS.labels("analytics")
+
+async def publish_analytics(records: List[dict]) -> None:
+    """Ingestion-hub sink: latest-value cache, then live fan-out."""
+    started = time.perf_counter()
+    for data in records:
+        latest_analytics.append(data)
+        analytics_fanout.publish(data.get("symbol"), data)
+    fanout_seconds.observe(time.perf_counter() - started)
 
-KAFKA_BROKER = "kafka:9092"
-TOPIC = "market_analytics"
-
-connected_clients = {}
-
-async def analytics_kafka_consumer():
-    consumer = AIOKafkaConsumer(
-        TOPIC,
-        bootstrap_servers=KAFKA_BROKER,
-        group_id="backend-analytics-group",
-        value_deserializer=lambda v: json.loads(v.decode("utf-8")),
-        auto_offset_reset="latest"
-    )
-
-    while True:
-        try:
-            await consumer.start()
-            print("Connected to Kafka: Analytics consumer started")
-            break
-        except Exception as e:
-            await asyncio.sleep(3)
-
-    try:
-        async for msg in consumer:
-            data = msg.value
-            symbol = data.get("symbol")
-
-            dead = []
-
-            for ws, subs in connected_clients.items():
-                if "*" in subs or symbol in subs:
-                    try:
-                        await ws.send_json(data)
-                    except:
-                        dead.append(ws)
-
-            for ws in dead:
-                del connected_clients[ws]
-
-    finally:
-        await consumer.stop()
\ No newline at end of file
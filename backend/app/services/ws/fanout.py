@@ -0,0 +1,329 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Protocol
+
+import orjson
+from fastapi import WebSocket
+
+from app.core.logger import logger
+from app.services.ws.subscriptions import WILDCARD, SubscriptionRegistry
+
+DROP_OLDEST = "drop_oldest"
+CONFLATE = "conflate"
+DISCONNECT = "disconnect"
+
+SLOW_CONSUMER_POLICIES = (DROP_OLDEST, CONFLATE, DISCONNECT)
+
+# 1013 = "try again later"; the client is asked to reconnect.
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class ChannelTotals:
+    """Frame counts across every ClientChannel of the process, closed ones included."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+
+
+channel_totals = ChannelTotals()
+
+
+class ClientChannel:
+    """Bounded outbound queue for one socket, drained by its own writer task."""
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        max_queue: int,
+        policy: str,
+        on_close: Callable[[WebSocket], None],
+        max_hz: Optional[float] = None,
+        envelope: bool = False,
+        binary: bool = False,
+    ) -> None:
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow-consumer policy: {policy}")
+
+        self.ws = ws
+        self.policy = policy
+        self.max_hz = max_hz
+        self.envelope = envelope
+        self.binary = binary
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+
+        self._max_queue = max_queue
+        self._on_close = on_close
+        self._conflating = policy == CONFLATE or max_hz is not None
+        self._control: Deque[str] = deque()
+        self._queue: Deque[str] = deque()
+        self._latest: "OrderedDict[str, str]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._drain())
+
+    @property
+    def depth(self) -> int:
+        return len(self._latest) if self._conflating else len(self._queue)
+
+    def offer(self, key: str, frame: str) -> None:
+        if self._closed:
+            return
+
+        if self._conflating:
+            if key in self._latest:
+                self._latest[key] = frame
+                self.conflated += 1
+                channel_totals.conflated += 1
+            else:
+                if len(self._latest) >= self._max_queue:
+                    self._latest.popitem(last=False)
+                    self.dropped += 1
+                    channel_totals.dropped += 1
+                self._latest[key] = frame
+        else:
+            if len(self._queue) >= self._max_queue:
+                if self.policy == DISCONNECT:
+                    self.dropped += len(self._queue) + 1
+                    channel_totals.dropped += len(self._queue) + 1
+                    self._disconnect()
+                    return
+                self._queue.popleft()
+                self.dropped += 1
+                channel_totals.dropped += 1
+            self._queue.append(frame)
+
+        self._ready.set()
+
+    def offer_control(self, frame: str) -> None:
+        if self._closed:
+            return
+        self._control.append(frame)
+        self._ready.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._control.clear()
+        self._queue.clear()
+        self._latest.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def _pop(self) -> Optional[str]:
+        if self._control:
+            return self._control.popleft()
+        if self._latest:
+            return self._latest.popitem(last=False)[1]
+        if self._queue:
+            return self._queue.popleft()
+        return None
+
+    def _disconnect(self) -> None:
+        logger.warning(
+            "Disconnecting slow WebSocket client %s (queue full)", self.ws.client
+        )
+        self.close()
+        asyncio.create_task(self._close_socket())
+        self._on_close(self.ws)
+
+    async def _close_socket(self) -> None:
+        try:
+            await self.ws.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
+
+    async def _drain(self) -> None:
+        try:
+            if self.max_hz is None:
+                await self._send_each()
+            else:
+                await self._send_coalesced(1.0 / self.max_hz)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self._closed = True
+            self._on_close(self.ws)
+
+    async def _send(self, frame: str) -> None:
+        if self.binary:
+            await self.ws.send_bytes(frame.encode("utf-8"))
+        else:
+            await self.ws.send_text(frame)
+        self.sent += 1
+        channel_totals.sent += 1
+
+    async def _send_each(self) -> None:
+        while True:
+            await self._ready.wait()
+            frame = self._pop()
+            while frame is not None:
+                await self._send(frame)
+                frame = self._pop()
+            self._ready.clear()
+
+    async def _send_coalesced(self, interval_s: float) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+
+            while self._control:
+                await self._send(self._control.popleft())
+
+            started = loop.time()
+            frames = list(self._latest.values())
+            self._latest.clear()
+            if not frames:
+                continue
+
+            await self._send("[" + ",".join(frames) + "]")
+
+            await asyncio.sleep(max(0.0, interval_s - (loop.time() - started)))
+
+
+class SnapshotSource(Protocol):
+    def recent(self, symbol: str) -> Optional[List[dict]]: ...
+
+    def symbols(self) -> List[str]: ...
+
+
+class FanoutEngine:
+    """Serializes each message once and queues it for every subscribed client."""
+
+    def __init__(
+        self,
+        name: str,
+        max_queue: int,
+        policy: str,
+        snapshot_source: Optional[SnapshotSource] = None,
+    ) -> None:
+        self.name = name
+        self.subscriptions = SubscriptionRegistry()
+        self.snapshot_source = snapshot_source
+
+        self.on_interest_change: Optional[Callable[[], None]] = None
+
+        self.published = 0  # messages with at least one subscriber
+        self.deliveries = 0  # frames offered to client channels
+
+        self._max_queue = max_queue
+        self._policy = policy
+        self._channels: Dict[WebSocket, ClientChannel] = {}
+
+    def attach(
+        self,
+        ws: WebSocket,
+        symbols: Iterable[str],
+        max_hz: Optional[float] = None,
+        channel: Optional[ClientChannel] = None,
+        snapshot: bool = False,
+    ) -> ClientChannel:
+        """Subscribe `ws` to `symbols`, creating its ClientChannel on first use."""
+        symbols = list(symbols)
+        existing = self._channels.get(ws)
+        if existing is None:
+            existing = channel or ClientChannel(
+                ws,
+                self._max_queue,
+                self._policy,
+                self.detach,
+                max_hz=max_hz,
+            )
+            self._channels[ws] = existing
+
+        if snapshot and self.snapshot_source is not None:
+            # Expand "*" first, so symbols the socket already follows are
+            # filtered out of it too; a socket already on "*" has them all.
+            already = self.subscriptions.symbols_for(ws)
+            wanted = self.snapshot_source.symbols() if WILDCARD in symbols else symbols
+            if WILDCARD not in already:
+                self._send_snapshots(existing, [s for s in wanted if s not in already])
+
+        self.subscriptions.add(ws, symbols)
+        self._interest_changed()
+        return existing
+
+    def unsubscribe(self, ws: WebSocket, symbols: Iterable[str]) -> None:
+        self.subscriptions.discard(ws, symbols)
+        self._interest_changed()
+
+    def detach(self, ws: WebSocket) -> None:
+        self.subscriptions.remove(ws)
+        channel = self._channels.pop(ws, None)
+        if channel is not None:
+            channel.close()
+        self._interest_changed()
+
+    def publish(self, symbol: str, data: dict) -> int:
+        """Queue `data` for every subscriber of `symbol`; returns the audience size."""
+        audience = self.subscriptions.subscribers(symbol)
+        if not audience:
+            return 0
+        return self._offer(symbol, audience, orjson.dumps(data).decode("utf-8"))
+
+    def publish_frame(self, symbol: str, frame: str) -> int:
+        """Like `publish()`, for a message that is already JSON-encoded."""
+        audience = self.subscriptions.subscribers(symbol)
+        if not audience:
+            return 0
+        return self._offer(symbol, audience, frame)
+
+    def _offer(self, symbol: str, audience: List[WebSocket], frame: str) -> int:
+        key = f"{self.name}:{symbol}"
+        enveloped = None
+
+        for ws in audience:
+            channel = self._channels.get(ws)
+            if channel is None:
+                continue
+            if channel.envelope:
+                if enveloped is None:
+                    enveloped = f'{{"stream":"{self.name}","data":{frame}}}'
+                channel.offer(key, enveloped)
+            else:
+                channel.offer(key, frame)
+
+        self.published += 1
+        self.deliveries += len(audience)
+        return len(audience)
+
+    def _interest_changed(self) -> None:
+        if self.on_interest_change is not None:
+            self.on_interest_change()
+
+    def _send_snapshots(self, channel: ClientChannel, symbols: List[str]) -> None:
+        for symbol in symbols:
+            records = self.snapshot_source.recent(symbol)
+            if not records:
+                continue
+            channel.offer_control(
+                orjson.dumps(
+                    {
+                        "type": "snapshot",
+                        "stream": self.name,
+                        "symbol": symbol,
+                        "data": records,
+                    }
+                ).decode("utf-8")
+            )
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                "client": f"{ws.client.host}:{ws.client.port}" if ws.client else None,
+                "symbols": sorted(self.subscriptions.symbols_for(ws)),
+                "max_hz": channel.max_hz,
+                "queue_depth": channel.depth,
+                "sent": channel.sent,
+                "conflated": channel.conflated,
+                "dropped": channel.dropped,
+            }
+            for ws, channel in self._channels.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self._channels)
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from typing import Dict, List, Set
+
+import orjson
+from redis.asyncio import Redis
+from tracing import StageTracer
+
+from app.core.logger import logger
+from app.core.metrics import WS_FANOUT_SECONDS
+from app.core.redis_client import redis_client
+from app.services.ws.fanout import FanoutEngine
+from app.services.ws.tick_broadcaster import tick_fanout, tick_history
+from app.services.ws.analytics_broadcaster import analytics_fanout, latest_analytics
+
+CHANNEL_PREFIX = "ws"
+
+
+def channel_name(stream: str, symbol: str) -> str:
+    return f"{CHANNEL_PREFIX}:{stream}:{symbol}"
+
+
+class RedisFramePublisher:
+    """Ingest-role sink: PUBLISHes each message to `ws:{stream}:{symbol}`."""
+
+    def __init__(self, redis: Redis, stream: str) -> None:
+        self._redis = redis
+        self._stream = stream
+        self.published = 0
+
+    async def publish(self, records: List[dict]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for data in records:
+            pipe.publish(channel_name(self._stream, data["symbol"]), orjson.dumps(data))
+        await pipe.execute()
+        self.published += len(records)
+
+
+class GatewaySubscriber:
+    """Gateway-role feed: follows the Redis channels its own clients subscribe to."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        engines: Dict[str, FanoutEngine],
+        caches: Dict[str, object],
+    ) -> None:
+        self._redis = redis
+        self._engines = engines
+        self._caches = caches
+        self._fanout_seconds = {stream: WS_FANOUT_SECONDS.labels(stream) for stream in engines}
+        self.tracers = {stream: StageTracer(f"{stream}:gateway") for stream in engines}
+        self._changed = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._channels: Set[str] = set()
+        self._patterns: Set[str] = set()
+
+        self.received = 0
+
+    async def run(self) -> None:
+        for engine in self._engines.values():
+            engine.on_interest_change = self._changed.set
+
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._changed.set()
+        try:
+            await asyncio.gather(self._sync(pubsub), self._read(pubsub))
+        finally:
+            for engine in self._engines.values():
+                engine.on_interest_change = None
+            await pubsub.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "patterns": sorted(self._patterns),
+            "received": self.received,
+        }
+
+    async def _sync(self, pubsub) -> None:
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+
+            channels: Set[str] = set()
+            patterns: Set[str] = set()
+            for stream, engine in self._engines.items():
+                if engine.subscriptions.has_wildcard():
+                    patterns.add(channel_name(stream, "*"))
+                    continue
+                wanted = set(engine.subscriptions.symbols())
+                channels.update(channel_name(stream, s) for s in wanted)
+                self._evict(stream, wanted)
+
+            async with self._lock:
+                try:
+                    if channels - self._channels:
+                        await pubsub.subscribe(*(channels - self._channels))
+                    if self._channels - channels:
+                        await pubsub.unsubscribe(*(self._channels - channels))
+                    if patterns - self._patterns:
+                        await pubsub.psubscribe(*(patterns - self._patterns))
+                    if self._patterns - patterns:
+                        await pubsub.punsubscribe(*(self._patterns - patterns))
+                except Exception as exc:
+                    logger.warning("Gateway subscription sync failed: %s", exc)
+                    await asyncio.sleep(1)
+                    self._changed.set()
+                    continue
+
+                self._channels, self._patterns = channels, patterns
+
+    async def _read(self, pubsub) -> None:
+        outage_started = None
+        while True:
+            if not pubsub.subscribed:
+                await asyncio.sleep(0.1)
+                continue
+
+            try:
+                message = await pubsub.get_message(timeout=1.0)
+            except Exception as exc:
+                if outage_started is None:
+                    outage_started = time.monotonic()
+                    logger.warning("Gateway lost its Redis pub/sub connection: %s", exc)
+                await self._reconnect(pubsub)
+                continue
+
+            if outage_started is not None:
+                logger.info(
+                    "Gateway pub/sub restored after %.1fs", time.monotonic() - outage_started
+                )
+                outage_started = None
+
+            if message is None or message["type"] not in ("message", "pmessage"):
+                continue
+
+            _, stream, symbol = message["channel"].split(":", 2)
+            engine = self._engines.get(stream)
+            if engine is None:
+                continue
+
+            self.received += 1
+            frame = message["data"]
+            started = time.perf_counter()
+            engine.publish_frame(symbol, frame)
+            self._fanout_seconds[stream].observe(time.perf_counter() - started)
+
+            try:
+                data = orjson.loads(frame)
+                self.tracers[stream].observe(data)
+                cache = self._caches.get(stream)
+                if cache is not None:
+                    cache.append(data)
+            except Exception as exc:
+                logger.warning("Gateway skipped malformed %s frame: %s", stream, exc)
+
+    async def _reconnect(self, pubsub) -> None:
+        """Drop the dead connection and let _sync subscribe from scratch."""
+        await asyncio.sleep(1)
+        async with self._lock:
+            await pubsub.aclose()
+            self._channels, self._patterns = set(), set()
+        for stream in self._caches:
+            self._evict(stream, set())
+        self._changed.set()
+
+    def _evict(self, stream: str, wanted: Set[str]) -> None:
+        cache = self._caches.get(stream)
+        if cache is None:
+            return
+        for symbol in cache.symbols():
+            if symbol not in wanted:
+                cache.discard(symbol)
+
+
+gateway_subscriber = GatewaySubscriber(
+    redis_client,
+    {"ticks": tick_fanout, "analytics": analytics_fanout},
+    {"ticks": tick_history, "analytics": latest_analytics},
+)
@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class TickRingBuffer:
+    """The last `depth` ticks per symbol, held in fixed-width NumPy arrays."""
+
+    def __init__(self, depth: int = 100, initial_symbols: int = 128) -> None:
+        self._depth = depth
+        self._rows: Dict[str, int] = {}
+        self._price = np.zeros((initial_symbols, depth), dtype=np.float64)
+        self._volume = np.zeros((initial_symbols, depth), dtype=np.int32)
+        self._timestamp = np.zeros((initial_symbols, depth), dtype=np.float64)
+        self._appended = np.zeros(initial_symbols, dtype=np.int64)
+
+    def append(self, tick: dict) -> None:
+        symbol = tick["symbol"]
+        row = self._rows.get(symbol)
+        if row is None:
+            row = self._add_row(symbol)
+
+        n = int(self._appended[row])
+        slot = n % self._depth
+        self._price[row, slot] = tick["price"]
+        self._volume[row, slot] = tick["volume"]
+        self._timestamp[row, slot] = tick["timestamp"]
+        self._appended[row] = n + 1
+
+    def recent(self, symbol: str) -> Optional[List[dict]]:
+        """Retained ticks for `symbol`, oldest first, or None if unseen."""
+        row = self._rows.get(symbol)
+        if row is None:
+            return None
+
+        n = int(self._appended[row])
+        count = min(n, self._depth)
+        slots = np.arange(n - count, n) % self._depth
+
+        return [
+            {"symbol": symbol, "price": price, "volume": volume, "timestamp": ts}
+            for price, volume, ts in zip(
+                self._price[row, slots].tolist(),
+                self._volume[row, slots].tolist(),
+                self._timestamp[row, slots].tolist(),
+            )
+        ]
+
+    def discard(self, symbol: str) -> None:
+        """Forget `symbol`'s history; its row is kept for reuse."""
+        row = self._rows.get(symbol)
+        if row is not None:
+            self._appended[row] = 0
+
+    def symbols(self) -> List[str]:
+        return [s for s, row in self._rows.items() if self._appended[row]]
+
+    def nbytes(self) -> int:
+        return (
+            self._price.nbytes
+            + self._volume.nbytes
+            + self._timestamp.nbytes
+            + self._appended.nbytes
+        )
+
+    def _add_row(self, symbol: str) -> int:
+        row = len(self._rows)
+        if row == len(self._appended):
+            grow = len(self._appended)
+            self._price = np.vstack([self._price, np.zeros_like(self._price[:grow])])
+            self._volume = np.vstack([self._volume, np.zeros_like(self._volume[:grow])])
+            self._timestamp = np.vstack(
+                [self._timestamp, np.zeros_like(self._timestamp[:grow])]
+            )
+            self._appended = np.concatenate([self._appended, np.zeros(grow, dtype=np.int64)])
+        self._rows[symbol] = row
+        return row
+
+
+class LatestValueCache:
+    """Most recent record per symbol, with the same read API as TickRingBuffer."""
+
+    def __init__(self) -> None:
+        self._latest: Dict[str, dict] = {}
+
+    def append(self, record: dict) -> None:
+        self._latest[record["symbol"]] = record
+
+    def recent(self, symbol: str) -> Optional[List[dict]]:
+        record = self._latest.get(symbol)
+        return None if record is None else [record]
+
+    def discard(self, symbol: str) -> None:
+        self._latest.pop(symbol, None)
+
+    def symbols(self) -> List[str]:
+        return list(self._latest)
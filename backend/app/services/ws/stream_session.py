@@ -0,0 +1,112 @@
+import time
+from typing import Dict, Iterable, List, Optional
+
+import orjson
+from fastapi import WebSocket
+
+from app.core.config import settings
+from app.services.ws.fanout import ClientChannel, FanoutEngine
+from app.services.ws.tick_broadcaster import tick_fanout
+from app.services.ws.analytics_broadcaster import analytics_fanout
+
+STREAMS: Dict[str, FanoutEngine] = {
+    "ticks": tick_fanout,
+    "analytics": analytics_fanout,
+}
+
+
+def parse_symbols(csv: str) -> List[str]:
+    return [s.strip().upper() for s in csv.split(",") if s.strip()]
+
+
+class StreamSession:
+    """One multiplexed /ws/stream connection."""
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        max_hz: Optional[float] = None,
+        binary: bool = False,
+    ) -> None:
+        self.ws = ws
+        self.channel = ClientChannel(
+            ws,
+            settings.WS_CLIENT_QUEUE_SIZE,
+            settings.WS_SLOW_CONSUMER_POLICY,
+            lambda _ws: self.close(),
+            max_hz=max_hz,
+            envelope=True,
+            binary=binary,
+        )
+
+    def subscribe(
+        self, stream: str, symbols: Iterable[str], snapshot: bool = True
+    ) -> None:
+        STREAMS[stream].attach(
+            self.ws, symbols, channel=self.channel, snapshot=snapshot
+        )
+
+    def unsubscribe(self, stream: str, symbols: Iterable[str]) -> None:
+        STREAMS[stream].unsubscribe(self.ws, symbols)
+
+    def handle(self, raw: str) -> None:
+        try:
+            message = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            self._reply({"type": "error", "message": "Invalid JSON"})
+            return
+
+        if not isinstance(message, dict):
+            self._reply({"type": "error", "message": "Expected a JSON object"})
+            return
+
+        op = message.get("op")
+        msg_id = message.get("id")
+
+        if op == "ping":
+            self._reply({"type": "pong", "id": msg_id, "server_time": time.time()})
+            return
+
+        if op not in ("subscribe", "unsubscribe"):
+            self._error(msg_id, f"Unknown op: {op!r}")
+            return
+
+        stream = message.get("stream")
+        if stream not in STREAMS:
+            self._error(msg_id, f"Unknown stream: {stream!r}")
+            return
+
+        symbols = message.get("symbols")
+        if not isinstance(symbols, list) or not all(isinstance(s, str) for s in symbols):
+            self._error(msg_id, "symbols must be a list of strings")
+            return
+
+        symbols = [s.strip().upper() for s in symbols if s.strip()]
+        if op == "subscribe":
+            self.subscribe(stream, symbols, snapshot=bool(message.get("snapshot", True)))
+        else:
+            self.unsubscribe(stream, symbols)
+
+        self._reply(
+            {
+                "type": "ack",
+                "op": op,
+                "id": msg_id,
+                "stream": stream,
+                "symbols": sorted(STREAMS[stream].subscriptions.symbols_for(self.ws)),
+            }
+        )
+
+    def heartbeat(self) -> None:
+        self._reply({"type": "heartbeat", "server_time": time.time()})
+
+    def close(self) -> None:
+        for engine in STREAMS.values():
+            engine.detach(self.ws)
+        self.channel.close()
+
+    def _error(self, msg_id, message: str) -> None:
+        self._reply({"type": "error", "id": msg_id, "message": message})
+
+    def _reply(self, payload: dict) -> None:
+        self.channel.offer_control(orjson.dumps(payload).decode("utf-8"))
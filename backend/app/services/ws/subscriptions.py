@@ -0,0 +1,91 @@
+from typing import Dict, Hashable, Iterable, List, Set
+
+WILDCARD = "*"
+
+
+class SubscriptionRegistry:
+    """Maps symbols to the sockets subscribed to them."""
+
+    def __init__(self) -> None:
+        self._by_symbol: Dict[str, Set[Hashable]] = {}
+        self._wildcard: Set[Hashable] = set()
+        self._subs: Dict[Hashable, Set[str]] = {}
+
+    def add(self, ws: Hashable, symbols: Iterable[str]) -> None:
+        """Subscribe `ws` to `symbols`, on top of anything it already has."""
+        subs = self._subs.setdefault(ws, set())
+
+        for symbol in symbols:
+            if symbol in subs:
+                continue
+            subs.add(symbol)
+            if symbol == WILDCARD:
+                self._wildcard.add(ws)
+            else:
+                self._by_symbol.setdefault(symbol, set()).add(ws)
+
+    def discard(self, ws: Hashable, symbols: Iterable[str]) -> None:
+        """Unsubscribe `ws` from `symbols`; the socket stays registered."""
+        subs = self._subs.get(ws)
+        if subs is None:
+            return
+
+        for symbol in symbols:
+            if symbol not in subs:
+                continue
+            subs.discard(symbol)
+            if symbol == WILDCARD:
+                self._wildcard.discard(ws)
+            else:
+                self._unindex(symbol, ws)
+
+    def remove(self, ws: Hashable) -> None:
+        """Drop `ws` and all of its subscriptions."""
+        subs = self._subs.pop(ws, None)
+        if subs is None:
+            return
+
+        self._wildcard.discard(ws)
+        for symbol in subs:
+            if symbol != WILDCARD:
+                self._unindex(symbol, ws)
+
+    def subscribers(self, symbol: str) -> List[Hashable]:
+        """Sockets that should receive a message for `symbol`, as a new list."""
+        direct = self._by_symbol.get(symbol)
+        if not direct:
+            return list(self._wildcard)
+        if not self._wildcard:
+            return list(direct)
+        return list(direct | self._wildcard)
+
+    def symbols_for(self, ws: Hashable) -> Set[str]:
+        return set(self._subs.get(ws, ()))
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one direct subscriber."""
+        return list(self._by_symbol)
+
+    def audience_sizes(self) -> Dict[str, int]:
+        """Direct subscriber count per symbol, plus "*" for wildcard sockets."""
+        sizes = {symbol: len(sockets) for symbol, sockets in self._by_symbol.items()}
+        if self._wildcard:
+            sizes[WILDCARD] = len(self._wildcard)
+        return sizes
+
+    def has_wildcard(self) -> bool:
+        return bool(self._wildcard)
+
+    def _unindex(self, symbol: str, ws: Hashable) -> None:
+        sockets = self._by_symbol.get(symbol)
+        if sockets is None:
+            return
+        sockets.discard(ws)
+        if not sockets:
+            del self._by_symbol[symbol]
+
+    def __contains__(self, ws: Hashable) -> bool:
+        return ws in self._subs
+
+    def __len__(self) -> int:
+        return len(self._subs)
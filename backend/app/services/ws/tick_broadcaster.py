@@ -1,48 +1,26 @@
-import asyncio
-from aiokafka import AIOKafkaConsumer
-import json
-from app.services.http.ticks_redis_service import add_tick_to_redis
+import time
+from typing import List
+from app.core.config import settings
+from app.core.metrics import WS_FANOUT_SECONDS
+from app.services.ws.fanout import FanoutEngine
+from app.services.ws.recent_history import TickRingBuffer
+
+
+tick_history = TickRingBuffer(depth=settings.WS_SNAPSHOT_TICKS)
+
+tick_fanout = FanoutEngine(
+    "ticks",
+    max_queue=settings.WS_CLIENT_QUEUE_SIZE,
+    policy=settings.WS_SLOW_CONSUMER_POLICY,
+    snapshot_source=tick_history,
+)
+fanout_seconds = WS_FANOUT_SECONDS.labels("ticks")
+
+async def publish_ticks(ticks: List[dict]) -> None:
+    """Ingestion-hub sink: in-memory history, then live fan-out."""
+    started = time.perf_counter()
+    for tick in ticks:
+        tick_history.append(tick)
+        tick_fanout.publish(tick["symbol"], tick)
+    fanout_seconds.observe(time.perf_counter() - started)
 
-
-KAFKA_BROKER = "kafka:9092"
-TOPIC = "market_ticks"
-
-tick_clients = {}
-async def tick_kafka_consumer():
-    consumer = AIOKafkaConsumer(
-        TOPIC,
-        bootstrap_servers=KAFKA_BROKER,
-        group_id="backend-tick-group",
-        value_deserializer=lambda v: json.loads(v.decode("utf-8")),
-        auto_offset_reset="latest"
-    )
-
-    while True:
-        try:
-            await consumer.start()
-            print("📡 Tick consumer connected")
-            break
-        except:
-            print("⏳ Waiting for Kafka...")
-            await asyncio.sleep(3)
-
-    try:
-        async for msg in consumer:
-            tick = msg.value
-            symbol = tick["symbol"]
-            await add_tick_to_redis(tick)
-
-            dead = []
-
-            for ws, subs in tick_clients.items():
-                if symbol in subs or "*" in subs:
-                    try:
-                        await ws.send_json(tick)
-                    except:
-                        dead.append(ws)
-
-            for ws in dead:
-                tick_clients.pop(ws, None)
-
-    finally:
-        await consumer.stop()
@@ -0,0 +1,82 @@
+"""
+Payload size and server-side cost of GET /api/ticks for a 72 h window:
+raw ticks vs LTTB (max_points) vs OHLCV bars (bucket).
+
+Timings cover turning the stored columns into the response body (dict
+building + JSON encoding), i.e. everything after the Redis read, which is
+identical for all three modes.
+
+    python benchmarks/bench_downsample.py --hours 72 --rate-hz 2 --max-points 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import orjson  # noqa: E402
+
+from app.services.http.downsample import downsample, parse_bucket  # noqa: E402
+from app.services.http.ticks_redis_service import PACKED_TICK, now_ms  # noqa: E402
+
+
+def make_records(hours: float, rate_hz: float, seed: int = 7) -> np.ndarray:
+    n = int(hours * 3600 * rate_hz)
+    rng = np.random.default_rng(seed)
+    interval_ms = 1000 / rate_hz
+
+    records = np.empty(n, dtype=PACKED_TICK)
+    records["ts"] = now_ms() - int(n * interval_ms) + (np.arange(n) * interval_ms).astype(np.int64)
+    records["price"] = np.round(100 * np.exp(np.cumsum(rng.normal(0, 2e-4, n))), 2)
+    records["volume"] = rng.integers(1, 1000, n)
+    return records
+
+
+def measure(label: str, fn, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = orjson.dumps(fn())
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<22} {len(body) / 1024:>10.1f} KB {best * 1000:>10.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=72)
+    parser.add_argument("--rate-hz", type=float, default=2.0)
+    parser.add_argument("--max-points", type=int, default=1000)
+    parser.add_argument("--bucket", default="5m")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.hours, args.rate_hz)
+    ts, price, volume = records["ts"], records["price"], records["volume"]
+    print(f"{len(records):,} ticks over {args.hours:g} h\n")
+    print(f"{'mode':<22} {'payload':>13} {'encode':>13}")
+
+    measure("raw", lambda: downsample("AAPL", ts, price, volume), args.repeat)
+    measure(
+        f"lttb max_points={args.max_points}",
+        lambda: downsample("AAPL", ts, price, volume, max_points=args.max_points),
+        args.repeat,
+    )
+    bucket_ms = parse_bucket(args.bucket)
+    measure(
+        f"ohlcv bucket={args.bucket}",
+        lambda: downsample("AAPL", ts, price, volume, bucket_ms=bucket_ms),
+        args.repeat,
+    )
+    measure(
+        "ohlcv + max_points",
+        lambda: downsample(
+            "AAPL", ts, price, volume, max_points=args.max_points, bucket_ms=bucket_ms
+        ),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Latency of GET /api/health served from the background monitor's cached
+snapshot, and, with --kafka, of the old per-request probe (start and stop
+a fresh AIOKafkaProducer) against the same broker.
+
+    python benchmarks/bench_health.py --requests 2000 --kafka localhost:9092
+
+Requests go through the ASGI app in-process (no sockets), so the cached
+figure is the endpoint's own cost.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from aiokafka import AIOKafkaProducer  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.services.http.health_service import health_monitor  # noqa: E402
+
+
+def summary(label: str, timings: list) -> None:
+    timings.sort()
+    p99 = timings[int(len(timings) * 0.99)]
+    print(f"{label:<28} p50={statistics.median(timings):>9.3f}ms p99={p99:>9.3f}ms")
+
+
+async def per_request_probe(bootstrap: str) -> bool:
+    producer = AIOKafkaProducer(bootstrap_servers=bootstrap)
+    try:
+        await producer.start()
+        return True
+    except Exception:
+        return False
+    finally:
+        try:
+            await producer.stop()
+        except Exception:
+            pass
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--kafka", default=None, help="bootstrap servers for the old probe")
+    parser.add_argument("--kafka-requests", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await health_monitor.probe()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        timings = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            response = await client.get("/api/health")
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"status={response.json()['status']}")
+        summary("GET /api/health (cached)", timings)
+
+    if args.kafka:
+        timings = []
+        for _ in range(args.kafka_requests):
+            started = time.perf_counter()
+            await per_request_probe(args.kafka)
+            timings.append((time.perf_counter() - started) * 1000)
+        summary("per-request Kafka producer", timings)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
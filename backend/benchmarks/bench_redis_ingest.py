@@ -0,0 +1,109 @@
+"""
+Ticks/sec into Redis: the original per-tick writer (a ZADD, then a
+ZREMRANGEBYSCORE trim, two round trips per tick) vs. RedisTickWriter fed
+in ingestion-hub sized batches.
+
+Runs against fakeredis by default; pass --redis-url to measure a real
+server, where the saved round trips matter far more:
+
+    python benchmarks/bench_redis_ingest.py --ticks 20000
+    python benchmarks/bench_redis_ingest.py --redis-url redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from redis.asyncio import Redis  # noqa: E402
+
+from app.services.http.ticks_redis_service import WINDOW_MS, ZSetTickStore  # noqa: E402
+from app.services.redis_tick_writer import RedisTickWriter  # noqa: E402
+
+
+def make_ticks(n: int, n_symbols: int) -> list:
+    now = time.time()
+    return [
+        {
+            "symbol": f"SYM{i % n_symbols:03d}",
+            "price": 100.0 + (i % 97) / 100,
+            "volume": 100 + i % 900,
+            "timestamp": now + i / 1000.0,
+        }
+        for i in range(n)
+    ]
+
+
+async def add_tick_per_call(redis: Redis, tick: dict) -> None:
+    """add_tick_to_redis as it was before RedisTickWriter."""
+    ts_ms = int(float(tick["timestamp"]) * 1000)
+
+    data = {
+        "symbol": tick["symbol"],
+        "price": tick["price"],
+        "volume": tick["volume"],
+        "timestamp_ms": ts_ms,
+    }
+
+    key = f"ticks:{data['symbol']}"
+    serialized = json.dumps(data)
+
+    await redis.zadd(key, {serialized: ts_ms})
+
+    await redis.zremrangebyscore(key, 0, ts_ms - WINDOW_MS)
+
+
+async def bench_per_tick(redis: Redis, ticks: list) -> float:
+    started = time.perf_counter()
+    for tick in ticks:
+        await add_tick_per_call(redis, tick)
+    return time.perf_counter() - started
+
+
+async def bench_writer(redis: Redis, ticks: list, flush_size: int, sink_batch: int) -> float:
+    writer = RedisTickWriter(redis, store=ZSetTickStore(redis), flush_size=flush_size)
+    started = time.perf_counter()
+    for i in range(0, len(ticks), sink_batch):
+        await writer.add_many(ticks[i:i + sink_batch])
+    await writer.flush()
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--flush-size", type=int, default=500)
+    parser.add_argument("--sink-batch", type=int, default=500,
+                        help="ticks per add_many() call, as the hub's sink hands them over")
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    if args.redis_url:
+        redis = Redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        from fakeredis import FakeAsyncRedis
+
+        redis = FakeAsyncRedis(decode_responses=True)
+
+    ticks = make_ticks(args.ticks, args.symbols)
+
+    await redis.flushdb()
+    per_tick = await bench_per_tick(redis, ticks)
+    await redis.flushdb()
+    batched = await bench_writer(redis, ticks, args.flush_size, args.sink_batch)
+    await redis.flushdb()
+    await redis.aclose()
+
+    target = args.redis_url or "fakeredis"
+    print(f"ticks={args.ticks} symbols={args.symbols} flush_size={args.flush_size} ({target})")
+    print(f"per-tick ZADD+trim: {args.ticks / per_tick:>12,.0f} ticks/s")
+    print(f"RedisTickWriter   : {args.ticks / batched:>12,.0f} ticks/s")
+    print(f"speedup           : {per_tick / batched:>12.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Per-message audience lookup: full client scan vs. SubscriptionRegistry.
+
+    python benchmarks/bench_subscriptions.py --sockets 10000 --symbols 100
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ws.subscriptions import SubscriptionRegistry  # noqa: E402
+
+
+class FakeSocket:
+    __slots__ = ()
+
+
+def build(n_sockets: int, n_symbols: int, per_client: int, wildcard_ratio: float):
+    symbols = [f"SYM{i:03d}" for i in range(n_symbols)]
+    scan = {}
+    registry = SubscriptionRegistry()
+
+    for _ in range(n_sockets):
+        ws = FakeSocket()
+        if random.random() < wildcard_ratio:
+            subs = {"*"}
+        else:
+            subs = set(random.sample(symbols, per_client))
+        scan[ws] = subs
+        registry.add(ws, subs)
+
+    return symbols, scan, registry
+
+
+def bench_scan(scan: dict, symbols: list, messages: int) -> float:
+    started = time.perf_counter()
+    for i in range(messages):
+        symbol = symbols[i % len(symbols)]
+        for ws, subs in scan.items():
+            if symbol in subs or "*" in subs:
+                pass
+    return time.perf_counter() - started
+
+
+def bench_registry(registry: SubscriptionRegistry, symbols: list, messages: int) -> float:
+    started = time.perf_counter()
+    for i in range(messages):
+        for ws in registry.subscribers(symbols[i % len(symbols)]):
+            pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--per-client", type=int, default=3)
+    parser.add_argument("--wildcard-ratio", type=float, default=0.001)
+    parser.add_argument("--messages", type=int, default=2_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    symbols, scan, registry = build(
+        args.sockets, args.symbols, args.per_client, args.wildcard_ratio
+    )
+
+    started = time.perf_counter()
+    for ws, subs in scan.items():
+        registry.remove(ws)
+        registry.add(ws, subs)
+    churn_us = (time.perf_counter() - started) / len(scan) * 1e6
+
+    scan_s = bench_scan(scan, symbols, args.messages)
+    registry_s = bench_registry(registry, symbols, args.messages)
+
+    print(f"sockets={args.sockets} symbols={args.symbols} per_client={args.per_client}")
+    print(f"full scan : {scan_s / args.messages * 1e6:>10.1f} us/message")
+    print(f"registry  : {registry_s / args.messages * 1e6:>10.1f} us/message")
+    print(f"speedup   : {scan_s / registry_s:>10.1f}x")
+    print(f"remove+add: {churn_us:>10.2f} us/socket")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Symbol autocomplete: the old linear scan vs. SymbolIndex, as the symbol
+universe grows. The real SYMBOL_CONFIGS are padded with synthetic tickers
+and company names (a made-up brand plus common words); queries are a mix
+of symbol prefixes, name words, substrings, typos and misses.
+
+    python benchmarks/bench_symbol_search.py --sizes 100 1000 10000 50000
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from dataclasses import replace
+from typing import Callable, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "..", "shared"))
+
+from symbols import SYMBOL_CONFIGS, SymbolConfig  # noqa: E402
+
+from app.services.http.symbol_index import SymbolIndex  # noqa: E402
+
+WORDS = (
+    "Acme Global Pacific Atlantic United First National American Digital "
+    "Quantum Solar Green Blue River Summit Pioneer Frontier Apex Vertex "
+    "Northern Southern Capital Energy Health Medical Bio Pharma Systems "
+    "Networks Software Semiconductor Foods Motors Airlines Mining Realty"
+).split()
+SUFFIXES = ["Inc.", "Corp.", "Holdings", "Group", "Ltd.", "& Co.", "Technologies"]
+
+
+def brand(rng: random.Random) -> str:
+    syllables = rng.randint(2, 3)
+    return "".join(
+        rng.choice("BCDFGKLMNPRSTVZ") + rng.choice("AEIOU") + rng.choice(["", "N", "R", "X"])
+        for _ in range(syllables)
+    ).capitalize()
+
+
+def universe(n: int, rng: random.Random) -> List[SymbolConfig]:
+    configs = list(SYMBOL_CONFIGS[:n])
+    taken = {cfg.symbol for cfg in configs}
+    template = SYMBOL_CONFIGS[0]
+    while len(configs) < n:
+        symbol = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 5)))
+        if symbol in taken:
+            continue
+        taken.add(symbol)
+        # Like real listings: a mostly distinctive brand, then maybe a
+        # common industry word, then a legal suffix.
+        words = [brand(rng)] + rng.sample(WORDS, rng.randint(0, 2)) + [rng.choice(SUFFIXES)]
+        name = " ".join(words)
+        configs.append(replace(template, symbol=symbol, name=name))
+    return configs
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + word[i + 1:] if len(word) > 4 else word + "X"
+
+
+def queries(configs: List[SymbolConfig], count: int, rng: random.Random) -> List[str]:
+    out = []
+    for _ in range(count):
+        cfg = rng.choice(configs)
+        word = rng.choice(cfg.name.split())
+        kind = rng.randrange(6)
+        if kind == 0:
+            out.append(cfg.symbol[: rng.randint(1, len(cfg.symbol))].lower())
+        elif kind == 1:
+            out.append(word[: rng.randint(2, max(2, len(word)))])
+        elif kind == 2:
+            out.append(cfg.symbol[1:] or cfg.symbol)
+        elif kind == 3:
+            out.append(typo(cfg.name.split()[0], rng))
+        elif kind == 4:
+            out.append(cfg.name[: rng.randint(3, len(cfg.name))])
+        else:
+            out.append("".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 6))))
+    return out
+
+
+def linear_search(configs: List[SymbolConfig]) -> Callable[[str, int], list]:
+    """The pre-index SymbolsService.search_symbols: two scans, symbols only."""
+
+    def search(query: str, limit: int) -> list:
+        cleaned = query.strip().upper()
+        if cleaned == "":
+            return configs[:limit]
+        starts_with = [cfg for cfg in configs if cfg.symbol.startswith(cleaned)]
+        contains = [
+            cfg for cfg in configs
+            if cleaned in cfg.symbol and cfg not in starts_with
+        ]
+        return (starts_with + contains)[:limit]
+
+    return search
+
+
+def measure(search: Callable[[str, int], list], qs: List[str], limit: int) -> List[float]:
+    timings = []
+    for q in qs:
+        started = time.perf_counter()
+        search(q, limit)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings
+
+
+def us(timings: List[float], q: float) -> float:
+    return timings[min(len(timings) - 1, int(len(timings) * q))] * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10_000, 50_000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--linear-max", type=int, default=10_000,
+                        help="skip the linear scan above this many symbols")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"{'symbols':>8} {'build':>9} {'index p50':>10} {'p99':>9} {'max':>9} "
+        f"{'linear p50':>11} {'p99':>9}"
+    )
+    for n in args.sizes:
+        rng = random.Random(args.seed)
+        configs = universe(n, rng)
+        qs = queries(configs, args.queries, rng)
+
+        started = time.perf_counter()
+        index = SymbolIndex(configs)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        indexed = measure(index.search, qs, args.limit)
+        line = (
+            f"{n:>8,} {build_ms:>7.0f}ms {us(indexed, 0.5):>8.1f}µs "
+            f"{us(indexed, 0.99):>7.1f}µs {indexed[-1] * 1e6:>7.0f}µs"
+        )
+        if n <= args.linear_max:
+            linear = measure(linear_search(configs), qs[: max(50, args.queries // 10)], args.limit)
+            line += f" {us(linear, 0.5):>9.1f}µs {us(linear, 0.99):>7.1f}µs"
+        print(line)
+    print(f"{args.queries} mixed queries per size, limit={args.limit}")
+
+
+if __name__ == "__main__":
+    main()
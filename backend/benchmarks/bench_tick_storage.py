@@ -0,0 +1,118 @@
+"""
+Redis memory per million ticks and 24 h range-read latency for the
+sorted-set and bucketed tick layouts.
+
+With --redis-url, memory is measured with MEMORY USAGE on a real server.
+Against fakeredis (the default) only the raw value bytes can be counted,
+which understates the sorted set's per-member skiplist/dict overhead.
+
+    python benchmarks/bench_tick_storage.py --redis-url redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from redis.asyncio import Redis  # noqa: E402
+
+from app.services.http.ticks_redis_service import (  # noqa: E402
+    BucketTickStore,
+    ZSetTickStore,
+    now_ms,
+)
+
+
+def make_ticks(n: int, n_symbols: int, interval_ms: int) -> list:
+    per_symbol = n // n_symbols
+    start = now_ms() - per_symbol * interval_ms
+    return [
+        {
+            "symbol": f"SYM{s:03d}",
+            "price": round(100.0 + (i % 997) / 100, 2),
+            "volume": 100 + (i * 7) % 900,
+            "timestamp": (start + i * interval_ms) / 1000,
+        }
+        for i in range(per_symbol)
+        for s in range(n_symbols)
+    ]
+
+
+async def write(redis: Redis, store, ticks: list) -> None:
+    for i in range(0, len(ticks), 5000):
+        pipe = redis.pipeline(transaction=False)
+        store.stage(pipe, ticks[i:i + 5000])
+        await pipe.execute()
+        store.executed()
+
+
+async def memory(redis: Redis, real: bool, pattern: str) -> int:
+    total = 0
+    async for key in redis.scan_iter(match=pattern, count=1000):
+        if real:
+            total += await redis.memory_usage(key) or 0
+        else:
+            kind = await redis.type(key)
+            if kind in (b"zset", "zset"):
+                members = await redis.zrange(key, 0, -1)
+                total += sum(len(m) + 8 for m in members)
+            else:
+                total += await redis.strlen(key)
+    return total
+
+
+async def read_latency(store, symbol: str, repeats: int) -> float:
+    end = now_ms()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        await store.read_range(symbol, end - 24 * 3600 * 1000, end)
+    return (time.perf_counter() - started) / repeats * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--interval-ms", type=int, default=500)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    if args.redis_url:
+        text = Redis.from_url(args.redis_url, decode_responses=True)
+        binary = Redis.from_url(args.redis_url, decode_responses=False)
+    else:
+        from fakeredis import FakeAsyncRedis, FakeServer
+
+        server = FakeServer()
+        text = FakeAsyncRedis(server=server, decode_responses=True)
+        binary = FakeAsyncRedis(server=server, decode_responses=False)
+
+    real = args.redis_url is not None
+    ticks = make_ticks(args.ticks, args.symbols, args.interval_ms)
+    scale = 1_000_000 / len(ticks)
+
+    zset = ZSetTickStore(text, trim_interval_s=3600)
+    buckets = BucketTickStore(binary)
+
+    await text.flushdb()
+    await write(text, zset, ticks)
+    await write(binary, buckets, ticks)
+
+    zset_bytes = await memory(text, real, "ticks:*")
+    bucket_bytes = await memory(binary, real, "tickbin:*")
+    zset_ms = await read_latency(zset, "SYM000", 20)
+    bucket_ms = await read_latency(buckets, "SYM000", 20)
+
+    await text.flushdb()
+
+    mode = "MEMORY USAGE" if real else "raw value bytes (fakeredis)"
+    print(f"ticks={len(ticks)} symbols={args.symbols} measured by {mode}")
+    print(f"{'layout':<10} {'MB / 1M ticks':>14} {'24h read ms':>12}")
+    print(f"{'zset':<10} {zset_bytes * scale / 1e6:>14.1f} {zset_ms:>12.2f}")
+    print(f"{'bucketed':<10} {bucket_bytes * scale / 1e6:>14.1f} {bucket_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Peak Python memory of one /api/ticks read: the full JSON list vs the
+paged NDJSON stream, for growing windows.
+
+Uses fakeredis by default (the Redis-side buffers are then counted too);
+pass --redis-url to read from a real server.
+
+    python benchmarks/bench_tick_streaming.py --ticks 20000 100000 400000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson  # noqa: E402
+from redis.asyncio import Redis  # noqa: E402
+
+from app.services.http.ticks_redis_service import ZSetTickStore, now_ms  # noqa: E402
+
+
+async def fill(redis: Redis, store: ZSetTickStore, n: int) -> None:
+    start = now_ms() - n * 100
+    for i in range(0, n, 10_000):
+        pipe = redis.pipeline(transaction=False)
+        store.stage(
+            pipe,
+            [
+                {
+                    "symbol": "AAPL",
+                    "price": 100.0 + (j % 997) / 100,
+                    "volume": j % 1000,
+                    "timestamp": (start + j * 100) / 1000,
+                }
+                for j in range(i, min(n, i + 10_000))
+            ],
+        )
+        await pipe.execute()
+        store.executed()
+
+
+async def peak_full(store: ZSetTickStore, start: int, end: int) -> int:
+    tracemalloc.start()
+    body = orjson.dumps(await store.read_range("AAPL", start, end))
+    del body
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+async def peak_stream(store: ZSetTickStore, start: int, end: int, page: int) -> int:
+    tracemalloc.start()
+    async for lines in store.iter_range("AAPL", start, end, page):
+        chunk = "\n".join(lines)
+        del chunk
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, nargs="+", default=[20_000, 100_000, 400_000])
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    if args.redis_url:
+        redis = Redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        import fakeredis.aioredis
+
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    print(f"{'ticks':>10} {'json peak':>12} {'ndjson peak':>12}")
+    for n in args.ticks:
+        await redis.flushdb()
+        store = ZSetTickStore(redis, window_ms=10**12)
+        await fill(redis, store, n)
+
+        end = now_ms()
+        start = end - n * 100 - 1000
+        full = await peak_full(store, start, end)
+        streamed = await peak_stream(store, start, end, args.page_size)
+        print(f"{n:>10,} {full / 2**20:>10.1f}MB {streamed / 2**20:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
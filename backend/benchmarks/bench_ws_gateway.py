@@ -0,0 +1,205 @@
+"""
+End-to-end fan-out through stateless WebSocket gateways: ticks are
+PUBLISHed to Redis the way the ingest role does it, N `uvicorn` workers
+run with BACKEND_ROLE=gateway, and C clients connect round-robin.
+
+Reports connections per worker, published and delivered messages/s and publish-to-
+receive latency. Uses an in-process fakeredis TCP server by default;
+pass --redis-url to use a real one (recommended for absolute numbers,
+since the fake server is single-threaded Python).
+
+    python benchmarks/bench_ws_gateway.py --workers 1 2 4 --clients 400 --rate 2000
+
+Clients and the publisher share this process, so at high rates the
+benchmark itself can become the bottleneck; watch its CPU.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import orjson  # noqa: E402
+import websockets  # noqa: E402
+from redis.asyncio import Redis  # noqa: E402
+
+from app.services.ws.gateway import RedisFramePublisher  # noqa: E402
+
+
+def start_fake_redis(port: int) -> str:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"redis://127.0.0.1:{port}/0"
+
+
+def spawn_workers(n: int, base_port: int, redis_url: str) -> list:
+    env = dict(
+        os.environ,
+        BACKEND_ROLE="gateway",
+        REDIS_URL=redis_url,
+        PYTHONPATH=os.pathsep.join([BACKEND_DIR, os.path.join(BACKEND_DIR, "..", "shared")]),
+    )
+    return [
+        subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app",
+                "--port", str(base_port + i), "--log-level", "warning",
+            ],
+            cwd=BACKEND_DIR,
+            env=env,
+        )
+        for i in range(n)
+    ]
+
+
+def wait_ready(port: int, timeout_s: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"gateway on port {port} did not start")
+
+
+def worker_clients(port: int) -> int:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/ws/stats", timeout=5) as r:
+        return orjson.loads(r.read())["ticks"]["clients"]
+
+
+async def client(url: str, latencies: list, counter: list, stop: asyncio.Event) -> None:
+    async with websockets.connect(url, max_queue=None) as ws:
+        while not stop.is_set():
+            try:
+                frame = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            tick = orjson.loads(frame)
+            latencies.append(time.time() - tick["timestamp"])
+            counter[0] += 1
+
+
+async def publish(redis: Redis, symbols: list, rate: int, stop: asyncio.Event) -> int:
+    publisher = RedisFramePublisher(redis, "ticks")
+    batch = max(1, rate // 20)
+    interval = batch / rate
+    sent = 0
+    next_at = time.perf_counter()
+    while not stop.is_set():
+        now = time.time()
+        await publisher.publish(
+            [
+                {
+                    "symbol": random.choice(symbols),
+                    "price": 100.0 + random.random(),
+                    "volume": random.randint(1, 1000),
+                    "timestamp": now,
+                }
+                for _ in range(batch)
+            ]
+        )
+        sent += batch
+        next_at += interval
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+    return sent
+
+
+async def run(args, workers: int, redis_url: str) -> dict:
+    procs = spawn_workers(workers, args.base_port, redis_url)
+    redis = Redis.from_url(redis_url)
+    try:
+        for i in range(workers):
+            wait_ready(args.base_port + i)
+
+        symbols = [f"SYM{s:03d}" for s in range(args.symbols)]
+        stop = asyncio.Event()
+        latencies: list = []
+        counter = [0]
+
+        clients = []
+        for c in range(args.clients):
+            port = args.base_port + c % workers
+            subs = ",".join(random.sample(symbols, args.per_client))
+            clients.append(
+                asyncio.create_task(
+                    client(f"ws://127.0.0.1:{port}/ws/ticks?symbols={subs}", latencies, counter, stop)
+                )
+            )
+        await asyncio.sleep(args.warmup)
+        per_worker = [worker_clients(args.base_port + i) for i in range(workers)]
+
+        publisher = asyncio.create_task(publish(redis, symbols, args.rate, stop))
+        await asyncio.sleep(1.0)
+        latencies.clear()
+        counter[0] = 0
+        started = time.perf_counter()
+        await asyncio.sleep(args.duration)
+        elapsed = time.perf_counter() - started
+        delivered = counter[0]
+        stop.set()
+
+        published = await publisher
+        await asyncio.gather(*clients, return_exceptions=True)
+    finally:
+        await redis.aclose()
+        for p in procs:
+            p.terminate()
+        for p in procs:
+            p.wait()
+
+    latencies.sort()
+    return {
+        "per_worker": per_worker,
+        "published_per_s": published / (elapsed + 1.0),
+        "delivered_per_s": delivered / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float("nan"),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--per-client", type=int, default=10)
+    parser.add_argument("--rate", type=int, default=1000, help="ticks published per second")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--redis-port", type=int, default=16379)
+    args = parser.parse_args()
+
+    redis_url = args.redis_url or start_fake_redis(args.redis_port)
+    print(
+        f"clients={args.clients} symbols={args.symbols} per_client={args.per_client} "
+        f"rate={args.rate}/s duration={args.duration}s"
+    )
+    print(
+        f"{'workers':>7} {'conns/worker':>16} {'published/s':>12} "
+        f"{'delivered/s':>12} {'p50':>9} {'p99':>9}"
+    )
+    for workers in args.workers:
+        r = await run(args, workers, redis_url)
+        conns = "/".join(str(c) for c in r["per_worker"])
+        print(
+            f"{workers:>7} {conns:>16} {r['published_per_s']:>12,.0f} "
+            f"{r['delivered_per_s']:>12,.0f} "
+            f"{r['p50_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
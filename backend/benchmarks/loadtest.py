@@ -0,0 +1,494 @@
+"""
+Load test of the backend's hot paths: Kafka ingest -> Redis writer and
+tick fan-out -> WebSocket clients, against local stand-ins.
+
+The server is loadtest_server.py (app.main, standalone role) fed by an
+in-memory Kafka replacement at --rate ticks/s over --symbols symbols.
+Redis is an in-process fakeredis TCP server unless --redis-url is given
+(use a real one for absolute numbers; the fake is single-threaded
+Python). --client-procs processes connect --clients WebSockets in total
+to /ws/ticks, each subscribed to --per-client random symbols, or to "*"
+for a --wildcard fraction of them.
+
+Over the --duration measurement window it reports:
+  ingest   ticks/s consumed from the feed and handled by each sink
+  fan-out  frames/s received by clients, p50/p99/max of receive time
+           minus the tick's event time, frames sent/dropped server-side
+  server   CPU (1.0 = one core), RSS at the end and peak RSS
+  stages   /api/latency staleness per pipeline stage
+
+and writes config, environment and results as JSON to --output (the
+server's log goes next to it), so runs can be compared:
+
+    python benchmarks/loadtest.py --rate 5000 --clients 2000 --label baseline
+    # ...change something...
+    python benchmarks/loadtest.py --rate 5000 --clients 2000 \
+        --compare benchmarks/results/baseline.json
+
+Clients run in separate processes so they don't compete with the server
+for one core, but on a small machine they still share the CPUs; compare
+runs made on the same host.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+sys.path.insert(0, BACKEND_DIR)
+
+import orjson  # noqa: E402
+
+LATENCY_SAMPLES_PER_PROC = 50_000
+
+# (section, key, higher is better) for --compare.
+COMPARED = [
+    ("ingest", "consumed_per_s", True),
+    ("fanout", "received_per_s", True),
+    ("fanout", "p50_ms", False),
+    ("fanout", "p99_ms", False),
+    ("fanout", "frames_dropped", False),
+    ("server", "cpu_cores", False),
+    ("server", "rss_mb", False),
+    ("server", "peak_rss_mb", False),
+]
+
+
+def symbol_names(n: int) -> List[str]:
+    return [f"SYM{i:04d}" for i in range(n)]
+
+
+def raise_fd_limit() -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def start_fake_redis(port: int) -> str:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"redis://127.0.0.1:{port}/0"
+
+
+def spawn_server(args, redis_url: str, log) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        BACKEND_ROLE="standalone",
+        REDIS_URL=redis_url,
+        HEALTH_PROBE_INTERVAL_S="3600",
+        LOADTEST_RATE=str(args.rate),
+        LOADTEST_SYMBOLS=str(args.symbols),
+        LOADTEST_WIRE_FORMAT=args.wire_format,
+        PYTHONPATH=os.pathsep.join([BACKEND_DIR, os.path.join(BACKEND_DIR, "..", "shared")]),
+    )
+    return subprocess.Popen(
+        [
+            sys.executable, os.path.join(BACKEND_DIR, "benchmarks", "loadtest_server.py"),
+            "--port", str(args.port),
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        preexec_fn=raise_fd_limit,
+    )
+
+
+def get(port: int, path: str, timeout: float = 120.0) -> bytes:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as r:
+        return r.read()
+
+
+def wait_ready(port: int, timeout_s: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            get(port, "/health", timeout=1)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def scrape(port: int) -> Dict[str, float]:
+    """Unlabelled samples from /metrics, by name."""
+    samples = {}
+    for line in get(port, "/metrics").decode().splitlines():
+        if line and not line.startswith("#") and "{" not in line:
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class ProcSampler:
+    """CPU time and memory of one process, read from /proc (Linux only)."""
+
+    def __init__(self, pid: int) -> None:
+        self._pid = pid
+        self._tick = os.sysconf("SC_CLK_TCK")
+
+    def cpu_s(self) -> float:
+        with open(f"/proc/{self._pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self._tick
+
+    def memory_mb(self) -> Dict[str, float]:
+        memory = {}
+        with open(f"/proc/{self._pid}/status") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    key, kb = line.split()[:2]
+                    memory[key.rstrip(":")] = int(kb) / 1024
+        return memory
+
+
+# --- clients (one asyncio loop per process) ---------------------------------
+
+
+async def client(url: str, state: dict, measuring, stop) -> None:
+    import websockets
+
+    # A bounded receive queue lets a client that falls behind push back on
+    # the server over TCP, as a real browser would, instead of buffering
+    # frames here and reporting its own backlog as fan-out latency.
+    try:
+        ws = await websockets.connect(url, max_queue=64, open_timeout=60)
+    except Exception:
+        state["failed"] += 1
+        return
+
+    state["connected"] += 1
+    async with ws:
+        while not stop.is_set():
+            try:
+                frame = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            except websockets.ConnectionClosed:
+                # The server is stopped before the clients at the end of a run.
+                if measuring.is_set():
+                    state["disconnected"] += 1
+                return
+            if not measuring.is_set():
+                continue
+            age = time.time() - orjson.loads(frame)["timestamp"]
+            state["received"] += 1
+            samples = state["ages"]
+            if len(samples) < LATENCY_SAMPLES_PER_PROC:
+                samples.append(age)
+            else:
+                # Reservoir sampling keeps the percentiles unbiased.
+                j = random.randrange(state["received"])
+                if j < LATENCY_SAMPLES_PER_PROC:
+                    samples[j] = age
+            if age > state["max_age"]:
+                state["max_age"] = age
+
+
+async def run_clients(urls: List[str], measuring, stop, results) -> None:
+    state = {
+        "connected": 0, "failed": 0, "disconnected": 0,
+        "received": 0, "max_age": 0.0, "ages": [],
+    }
+    tasks = []
+    for url in urls:
+        tasks.append(asyncio.create_task(client(url, state, measuring, stop)))
+        # Stagger connects so the server's accept queue doesn't overflow.
+        if len(tasks) % 100 == 0:
+            await asyncio.sleep(0.05)
+    while not stop.is_set():
+        await asyncio.sleep(0.2)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    results.put(state)
+
+
+def client_proc(urls: List[str], measuring, stop, results) -> None:
+    raise_fd_limit()
+    asyncio.run(run_clients(urls, measuring, stop, results))
+
+
+def client_urls(args) -> List[str]:
+    rng = random.Random(args.seed)
+    symbols = symbol_names(args.symbols)
+    urls = []
+    for _ in range(args.clients):
+        if rng.random() < args.wildcard:
+            subs = "*"
+        else:
+            subs = ",".join(rng.sample(symbols, min(args.per_client, len(symbols))))
+        urls.append(f"ws://127.0.0.1:{args.port}/ws/ticks?symbols={subs}")
+    return urls
+
+
+# --- run ---------------------------------------------------------------------
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def git_rev() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args, redis_url: str, log) -> dict:
+    server = spawn_server(args, redis_url, log)
+    ctx = mp.get_context("spawn")
+    measuring, stop = ctx.Event(), ctx.Event()
+    results = ctx.Queue()
+    procs = []
+    try:
+        wait_ready(args.port)
+        proc = ProcSampler(server.pid)
+
+        urls = client_urls(args)
+        for i in range(args.client_procs):
+            p = ctx.Process(
+                target=client_proc,
+                args=(urls[i::args.client_procs], measuring, stop, results),
+                daemon=True,
+            )
+            p.start()
+            procs.append(p)
+
+        deadline = time.monotonic() + args.connect_timeout
+        while time.monotonic() < deadline:
+            try:
+                stats = orjson.loads(get(args.port, "/api/ws/stats", timeout=5))
+                clients = stats["ticks"]["clients"]
+            except OSError:
+                # An overloaded server may not answer promptly; keep waiting.
+                clients = 0
+            if clients >= args.clients:
+                break
+            time.sleep(0.5)
+        time.sleep(args.warmup)
+
+        ingest_before = orjson.loads(get(args.port, "/api/ingest/stats"))["backend-tick-group"]
+        metrics_before = scrape(args.port)
+        cpu_before = proc.cpu_s()
+        measuring.set()
+        started = time.perf_counter()
+        time.sleep(args.duration)
+        measuring.clear()
+        elapsed = time.perf_counter() - started
+        cpu_after = proc.cpu_s()
+        ingest_after = orjson.loads(get(args.port, "/api/ingest/stats"))["backend-tick-group"]
+        metrics_after = scrape(args.port)
+        memory = proc.memory_mb()
+        stages = orjson.loads(get(args.port, "/api/latency"))
+
+        # Server first: clients closing thousands of sockets at once would
+        # otherwise flood its log with disconnect errors.
+        server.terminate()
+        server.wait()
+        stop.set()
+        states = [results.get(timeout=60) for _ in procs]
+    finally:
+        stop.set()
+        for p in procs:
+            p.join(timeout=10)
+        if server.poll() is None:
+            server.terminate()
+            server.wait()
+
+    def delta(before: dict, after: dict, key: str) -> float:
+        return after.get(key, 0) - before.get(key, 0)
+
+    ages = sorted(a for s in states for a in s["ages"])
+    received = sum(s["received"] for s in states)
+    sinks = {
+        name: round(
+            (stats["processed"] - ingest_before["sinks"][name]["processed"]) / elapsed, 1
+        )
+        for name, stats in ingest_after["sinks"].items()
+    }
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "clients": {
+            "connected": sum(s["connected"] for s in states),
+            "failed": sum(s["failed"] for s in states),
+            "disconnected": sum(s["disconnected"] for s in states),
+        },
+        "ingest": {
+            "consumed_per_s": round(
+                (ingest_after["consumed"] - ingest_before["consumed"]) / elapsed, 1
+            ),
+            "sink_processed_per_s": sinks,
+            "sink_dropped": {
+                name: stats["dropped"] - ingest_before["sinks"][name]["dropped"]
+                for name, stats in ingest_after["sinks"].items()
+            },
+            "consumer_lag": ingest_after["consumer_lag"],
+        },
+        "fanout": {
+            "received_per_s": round(received / elapsed, 1),
+            "p50_ms": ms(percentile(ages, 0.50)),
+            "p99_ms": ms(percentile(ages, 0.99)),
+            "max_ms": ms(max((s["max_age"] for s in states), default=None)),
+            "frames_sent": int(
+                delta(metrics_before, metrics_after, "tradestream_ws_frames_sent_total")
+            ),
+            "frames_dropped": int(
+                delta(metrics_before, metrics_after, "tradestream_ws_frames_dropped_total")
+            ),
+            "frames_conflated": int(
+                delta(metrics_before, metrics_after, "tradestream_ws_frames_conflated_total")
+            ),
+        },
+        "server": {
+            "cpu_cores": round((cpu_after - cpu_before) / elapsed, 3),
+            "rss_mb": round(memory.get("VmRSS", 0.0), 1),
+            "peak_rss_mb": round(memory.get("VmHWM", 0.0), 1),
+        },
+        "stages": stages,
+    }
+
+
+def report(results: dict) -> None:
+    ingest, fanout, server = results["ingest"], results["fanout"], results["server"]
+    print(
+        f"clients   {results['clients']['connected']} connected, "
+        f"{results['clients']['failed']} failed, "
+        f"{results['clients']['disconnected']} disconnected mid-run"
+    )
+    print(
+        f"ingest    {ingest['consumed_per_s']:,.0f} ticks/s consumed, "
+        f"lag {ingest['consumer_lag']}"
+    )
+    for name, rate in ingest["sink_processed_per_s"].items():
+        print(f"  {name:<14} {rate:>10,.0f}/s  dropped {ingest['sink_dropped'][name]}")
+    print(
+        f"fan-out   {fanout['received_per_s']:,.0f} frames/s received, "
+        f"p50 {fanout['p50_ms']}ms p99 {fanout['p99_ms']}ms max {fanout['max_ms']}ms"
+    )
+    print(
+        f"  sent {fanout['frames_sent']:,} dropped {fanout['frames_dropped']:,} "
+        f"conflated {fanout['frames_conflated']:,}"
+    )
+    print(
+        f"server    cpu {server['cpu_cores']:.2f} cores, "
+        f"rss {server['rss_mb']:.0f}MB, peak {server['peak_rss_mb']:.0f}MB"
+    )
+    for stage, snapshot in results["stages"].items():
+        if snapshot["count"]:
+            print(
+                f"  {stage:<28} p50 {snapshot['p50_ms']}ms p99 {snapshot['p99_ms']}ms "
+                f"gaps {snapshot['gaps']}"
+            )
+
+
+def compare(baseline: dict, current: dict) -> None:
+    print(f"\nvs {baseline['config'].get('label') or baseline['env']['started_at']}")
+    print(f"{'metric':<24} {'baseline':>12} {'current':>12} {'change':>9}")
+    for section, key, higher_is_better in COMPARED:
+        before = baseline["results"][section].get(key)
+        after = current["results"][section].get(key)
+        if before is None or after is None:
+            continue
+        if not before:
+            print(f"{section + '.' + key:<24} {before:>12,.2f} {after:>12,.2f} {'':>9}")
+            continue
+        change = (after - before) / before * 100
+        mark = "" if abs(change) < 2 else (" +" if (change > 0) == higher_is_better else " -")
+        print(
+            f"{section + '.' + key:<24} {before:>12,.2f} {after:>12,.2f} "
+            f"{change:>+8.1f}%{mark}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rate", type=int, default=2000, help="ticks produced per second")
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--per-client", type=int, default=10, help="symbols per client")
+    parser.add_argument("--wildcard", type=float, default=0.02,
+                        help="fraction of clients subscribed to every symbol")
+    parser.add_argument("--client-procs", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--wire-format", choices=["json", "binary"], default="json")
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--connect-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=18100)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--redis-port", type=int, default=16379)
+    parser.add_argument("--label", default=None, help="name of this run in the results file")
+    parser.add_argument("--output", default=None,
+                        help="results file (default benchmarks/results/<label or timestamp>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", default=None,
+                        help="results file to print deltas against")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    redis_url = args.redis_url or start_fake_redis(args.redis_port)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    print(
+        f"rate={args.rate}/s symbols={args.symbols} clients={args.clients} "
+        f"per_client={args.per_client} wildcard={args.wildcard} duration={args.duration}s"
+    )
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{args.label or started_at.replace(':', '')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    server_log = os.path.splitext(output)[0] + ".server.log"
+    with open(server_log, "w") as log:
+        results = run(args, redis_url, log)
+    report(results)
+
+    config = {k: v for k, v in vars(args).items() if k not in ("output", "compare")}
+    config["redis"] = "external" if args.redis_url else "fakeredis"
+    document = {
+        "config": config,
+        "env": {
+            "started_at": started_at,
+            "git_rev": git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    with open(output, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"\nwrote {output} (server log: {server_log})")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+The backend as loadtest.py drives it: app.main under uvicorn, with the
+ingestion hub reading market_ticks from SyntheticConsumer, an in-memory
+Kafka stand-in, instead of a broker. Redis is whatever REDIS_URL points
+at (loadtest.py starts a fakeredis server by default).
+
+    LOADTEST_RATE=5000 LOADTEST_SYMBOLS=200 REDIS_URL=redis://127.0.0.1:16379/0 \
+        python benchmarks/loadtest_server.py --port 18100
+
+Other topics (market_analytics) stay idle.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import Dict, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn  # noqa: E402
+from aiokafka import TopicPartition  # noqa: E402
+from codec import encode_tick  # noqa: E402
+from loadtest import symbol_names  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.services.ingestion import TICKS_TOPIC, ingestion_hub  # noqa: E402
+
+RATE = float(os.getenv("LOADTEST_RATE", "1000"))
+SYMBOLS = int(os.getenv("LOADTEST_SYMBOLS", "100"))
+WIRE_FORMAT = os.getenv("LOADTEST_WIRE_FORMAT", "json")
+MAX_BATCH = 5000
+
+
+class Message(NamedTuple):
+    offset: int
+    value: bytes
+    headers: list
+
+
+class SyntheticConsumer:
+    """Just enough of AIOKafkaConsumer for TopicFeed, generating ticks at `RATE`/s."""
+
+    def __init__(self, topic: str, **_: object) -> None:
+        self._tp = TopicPartition(topic, 0)
+        self._rate = RATE if topic == TICKS_TOPIC else 0.0
+        self._symbols = symbol_names(SYMBOLS)
+        self._prices = [100.0 + random.random() * 50 for _ in self._symbols]
+        self._seq = [0] * len(self._symbols)
+        self._produced = 0
+        self._started = 0.0
+
+    async def start(self) -> None:
+        self._started = time.perf_counter()
+
+    async def stop(self) -> None:
+        pass
+
+    async def commit(self, offsets: Optional[Dict[TopicPartition, int]] = None) -> None:
+        pass
+
+    def highwater(self, tp: TopicPartition) -> int:
+        return self._produced
+
+    async def getmany(self, timeout_ms: int = 0, max_records: Optional[int] = None) -> dict:
+        if not self._rate:
+            await asyncio.sleep(timeout_ms / 1000)
+            return {}
+
+        due = int((time.perf_counter() - self._started) * self._rate) - self._produced
+        if due <= 0:
+            await asyncio.sleep(min(timeout_ms / 1000, 1 / self._rate))
+            return {}
+
+        due = min(due, max_records or MAX_BATCH, MAX_BATCH)
+        now = time.time()
+        messages = []
+        for _ in range(due):
+            i = self._produced % len(self._symbols)
+            self._seq[i] += 1
+            self._prices[i] += random.uniform(-0.05, 0.05)
+            value, headers = encode_tick(
+                {
+                    "symbol": self._symbols[i],
+                    "price": round(self._prices[i], 2),
+                    "volume": random.randint(1, 2000),
+                    "timestamp": now,
+                    "seq": self._seq[i],
+                },
+                WIRE_FORMAT,
+            )
+            messages.append(Message(self._produced, value, headers))
+            self._produced += 1
+        return {self._tp: messages}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18100)
+    args = parser.parse_args()
+
+    ingestion_hub.consumer_factory = SyntheticConsumer
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
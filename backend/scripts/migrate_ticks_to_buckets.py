@@ -0,0 +1,111 @@
+"""
+Backfill the bucketed tick layout from the existing `ticks:{symbol}`
+sorted sets.
+
+Migration path:
+
+  1. Deploy with REDIS_TICK_STORAGE=dual. New ticks go to both layouts and
+     reads still come from the sorted sets.
+  2. Run this script. For each symbol it copies the sorted-set ticks
+     older than the oldest tick already in the bucket layout, newest
+     first. What it has copied is always one contiguous range ending at
+     the dual-mode start, so an interrupted run resumes where it stopped
+     when re-run, and nothing dual mode wrote is duplicated.
+  3. Switch to REDIS_TICK_STORAGE=bucketed.
+  4. Re-run with --delete to drop the sorted sets.
+
+    python scripts/migrate_ticks_to_buckets.py [--delete]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.redis_client import redis_client, redis_binary_client  # noqa: E402
+from app.services.http.ticks_redis_service import (  # noqa: E402
+    BucketTickStore,
+    now_ms,
+)
+
+PAGE_SIZE = 5000
+
+
+async def migrate_key(store: BucketTickStore, key: str, delete: bool) -> int:
+    symbol = key.split(":", 1)[1]
+    earliest = await store.earliest_ms(symbol, now_ms())
+    cursor = f"({earliest}" if earliest is not None else "+inf"
+
+    # Pages walk down a score cursor rather than a LIMIT offset, so trims
+    # running meanwhile (which only remove the oldest ticks) can't shift
+    # ticks past the window. Each written page holds whole score groups:
+    # the bucket layout's oldest tick then marks a clean resume point.
+    copied = 0
+    skip = 0
+    while True:
+        page = await redis_client.zrevrangebyscore(
+            key, cursor, "-inf", start=skip, num=PAGE_SIZE, withscores=True
+        )
+        if not page:
+            break
+
+        last_page = len(page) < PAGE_SIZE
+        if not last_page:
+            lowest = page[-1][1]
+            if page[0][1] != lowest:
+                # Leave the lowest score group for the next page.
+                page = [(member, score) for member, score in page if score != lowest]
+                cursor, skip = int(lowest), 0
+            else:
+                # One timestamp fills the whole page; step through it.
+                cursor, skip = int(lowest), skip + len(page)
+
+        ticks = []
+        for member, _ in page:
+            data = orjson.loads(member)
+            ticks.append(
+                {
+                    "symbol": symbol,
+                    "price": data["price"],
+                    "volume": data["volume"],
+                    "timestamp": data["timestamp_ms"] / 1000,
+                }
+            )
+
+        pipe = redis_binary_client.pipeline(transaction=False)
+        store.stage(pipe, ticks, update_latest=False)
+        await pipe.execute()
+
+        copied += len(ticks)
+        if last_page:
+            break
+
+    if delete:
+        await redis_client.delete(key)
+
+    return copied
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delete", action="store_true", help="Drop each sorted set after copying")
+    args = parser.parse_args()
+
+    store = BucketTickStore(redis_binary_client)
+    total = 0
+
+    async for key in redis_client.scan_iter(match="ticks:*", count=500):
+        if await redis_client.type(key) != "zset":
+            continue
+        copied = await migrate_key(store, key, args.delete)
+        total += copied
+        print(f"{key}: {copied} ticks copied")
+
+    print(f"done: {total} ticks copied")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Steps/sec of MarketSimulator for growing symbol universes.
+
+    python benchmarks/bench_market_sim.py --sizes 100 10000 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from market_sim import MarketSimulator  # noqa: E402
+from symbols import SYMBOL_CONFIGS, SymbolConfig  # noqa: E402
+
+
+def make_universe(n: int) -> list:
+    """Repeat SYMBOL_CONFIGS under synthetic tickers until there are n symbols."""
+    return [
+        SymbolConfig(
+            f"{cfg.symbol}{i // len(SYMBOL_CONFIGS)}",
+            cfg.name,
+            cfg.base_price,
+            cfg.tick_volatility_cents,
+            cfg.max_intraday_deviation_cents,
+            cfg.mean_volume,
+            cfg.volume_jitter,
+            cfg.sector,
+        )
+        for i, cfg in ((i, SYMBOL_CONFIGS[i % len(SYMBOL_CONFIGS)]) for i in range(n))
+    ]
+
+
+def bench(n: int, seconds: float, sector_correlation: float) -> float:
+    sim = MarketSimulator(make_universe(n), sector_correlation=sector_correlation, seed=0)
+
+    steps = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        sim.step()
+        steps += 1
+
+    return steps / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--sector-correlation", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print(f"{'symbols':>10} {'steps/s':>12} {'ticks/s':>14}")
+    for n in args.sizes:
+        rate = bench(n, args.seconds, args.sector_correlation)
+        print(f"{n:>10,} {rate:>12,.0f} {rate * n:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
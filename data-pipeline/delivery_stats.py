@@ -0,0 +1,58 @@
+import asyncio
+import logging
+import time
+from typing import List
+
+from metrics import DELIVERY_FAILED, DELIVERY_SECONDS
+
+
+class DeliveryStats:
+    """Rolling producer throughput and send-to-ack latency."""
+
+    def __init__(self, report_interval_s: float = 10.0) -> None:
+        self._report_interval_s = report_interval_s
+        self._window_started = time.perf_counter()
+        self._latencies: List[float] = []
+        self._failed = 0
+
+    def track(self, future: asyncio.Future) -> asyncio.Future:
+        sent_at = time.perf_counter()
+
+        def _on_done(fut: asyncio.Future) -> None:
+            if fut.cancelled() or fut.exception() is not None:
+                self._failed += 1
+                DELIVERY_FAILED.inc()
+            else:
+                self.observe(time.perf_counter() - sent_at)
+
+        future.add_done_callback(_on_done)
+        return future
+
+    def observe(self, latency_s: float) -> None:
+        self._latencies.append(latency_s)
+        DELIVERY_SECONDS.observe(latency_s)
+
+    def maybe_report(self) -> None:
+        elapsed = time.perf_counter() - self._window_started
+        if elapsed < self._report_interval_s:
+            return
+
+        delivered = len(self._latencies)
+        if delivered:
+            ordered = sorted(self._latencies)
+            p50 = ordered[delivered // 2] * 1000
+            p99 = ordered[min(delivered - 1, int(delivered * 0.99))] * 1000
+        else:
+            p50 = p99 = 0.0
+
+        logging.info(
+            "Producer: %.0f msg/s, delivery p50=%.1f ms p99=%.1f ms, failed=%d",
+            delivered / elapsed,
+            p50,
+            p99,
+            self._failed,
+        )
+
+        self._window_started = time.perf_counter()
+        self._latencies = []
+        self._failed = 0
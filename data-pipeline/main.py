@@ -1,12 +1,15 @@
 import asyncio
-import json
-import random
+import os
 import time
 import logging
-from typing import Dict
 import asyncpg
 from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
 from symbols import SYMBOL_CONFIGS
+from codec import encode_tick
+from tick_writer import BatchTickWriter
+from delivery_stats import DeliveryStats
+from market_sim import MarketSimulator
+from metrics import PRODUCED, start_exporter, watch_consumer_lag, watch_tracers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +19,19 @@ logging.basicConfig(
 KAFKA_BROKER = "kafka:9092"
 TOPIC = "market_ticks"
 
+PRODUCER_MODE = os.getenv("PRODUCER_MODE", "pipelined")  # or "serial"
+PRODUCE_INTERVAL_S = float(os.getenv("PRODUCE_INTERVAL_S", "2.0"))
+PRODUCER_LINGER_MS = int(os.getenv("PRODUCER_LINGER_MS", "5"))
+PRODUCER_MAX_BATCH_BYTES = int(os.getenv("PRODUCER_MAX_BATCH_BYTES", "65536"))
+PRODUCER_COMPRESSION = os.getenv("PRODUCER_COMPRESSION", "lz4") or None
+PRODUCER_REPORT_INTERVAL_S = float(os.getenv("PRODUCER_REPORT_INTERVAL_S", "10.0"))
+TICK_WIRE_FORMAT = os.getenv("TICK_WIRE_FORMAT", "json")  # or "binary"
+SIM_SECTOR_CORRELATION = float(os.getenv("SIM_SECTOR_CORRELATION", "0.0"))
+
+DB_FLUSH_SIZE = int(os.getenv("DB_FLUSH_SIZE", "1000"))
+DB_FLUSH_INTERVAL_S = float(os.getenv("DB_FLUSH_INTERVAL_S", "0.5"))
+DB_MAX_IN_FLIGHT = int(os.getenv("DB_MAX_IN_FLIGHT", "2"))
+
 DB_CONFIG = {
     "user": "postgres",
     "password": "postgres",
@@ -45,12 +61,6 @@ SELECT create_hypertable(
 );
 """
 
-INSERT_QUERY = """
-INSERT INTO ticks (symbol, price, volume, ts)
-VALUES ($1, $2, $3, to_timestamp($4));
-"""
-
-
 async def wait_for_kafka() -> None:
     while True:
         try:
@@ -87,54 +97,66 @@ async def produce() -> None:
     await wait_for_kafka()
     producer = AIOKafkaProducer(
         bootstrap_servers=KAFKA_BROKER,
-        value_serializer=lambda value: json.dumps(value).encode("utf-8"),
+        linger_ms=PRODUCER_LINGER_MS,
+        max_batch_size=PRODUCER_MAX_BATCH_BYTES,
+        compression_type=PRODUCER_COMPRESSION,
     )
     await producer.start()
-    logging.info("Producer started.")
+    logging.info(
+        "Producer started (mode=%s, interval=%.3fs, compression=%s).",
+        PRODUCER_MODE,
+        PRODUCE_INTERVAL_S,
+        PRODUCER_COMPRESSION,
+    )
 
-    current_prices: Dict[str, float] = {
-        cfg.symbol: cfg.base_price for cfg in SYMBOL_CONFIGS
-    }
+    stats = DeliveryStats(PRODUCER_REPORT_INTERVAL_S)
+    simulator = MarketSimulator(
+        SYMBOL_CONFIGS,
+        sector_correlation=SIM_SECTOR_CORRELATION,
+    )
+    symbols = simulator.symbols
+    keys = [symbol.encode("utf-8") for symbol in symbols]
+    seq = 0
 
     try:
-        while True:
-            now_timestamp = time.time()
-
-            for cfg in SYMBOL_CONFIGS:
-                prev_price = current_prices[cfg.symbol]
-
-                step_cents = random.gauss(0.0, cfg.tick_volatility_cents)
-                new_price = prev_price + step_cents / 100.0
-
-                mean_reversion_strength = 0.002
-                new_price += (cfg.base_price - new_price) * mean_reversion_strength
-
-                band_dollars = cfg.max_intraday_deviation_cents / 100.0
-                min_price = cfg.base_price - band_dollars
-                max_price = cfg.base_price + band_dollars
-                if new_price < min_price:
-                    new_price = min_price
-                elif new_price > max_price:
-                    new_price = max_price
-
-                current_prices[cfg.symbol] = new_price
-
-                raw_volume = int(
-                    random.gauss(cfg.mean_volume, cfg.volume_jitter)
-                )
-                volume = max(1, raw_volume)
+        async for now_timestamp, prices, volumes in simulator.run(PRODUCE_INTERVAL_S):
+            pending = []
+            seq += 1
 
+            for symbol, key, price, volume in zip(
+                symbols, keys, prices.round(2).tolist(), volumes.tolist()
+            ):
                 msg = {
-                    "symbol": cfg.symbol,
-                    "price": round(new_price, 2),
+                    "symbol": symbol,
+                    "price": price,
                     "volume": volume,
                     "timestamp": now_timestamp,
+                    "seq": seq,
                 }
 
-                await producer.send_and_wait(TOPIC, msg)
-                logging.info("Produced \u2192 %s", msg)
+                value, headers = encode_tick(msg, TICK_WIRE_FORMAT)
 
-            await asyncio.sleep(2)
+                if PRODUCER_MODE == "serial":
+                    sent_at = time.perf_counter()
+                    await producer.send_and_wait(TOPIC, value, key=key, headers=headers)
+                    stats.observe(time.perf_counter() - sent_at)
+                else:
+                    pending.append(
+                        stats.track(await producer.send(TOPIC, value, key=key, headers=headers))
+                    )
+
+                logging.debug("Produced \u2192 %s", msg)
+
+            PRODUCED.labels(TOPIC).inc(len(symbols))
+
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logging.warning("Tick delivery failed: %s", result)
+                        break
+
+            stats.maybe_report()
 
     finally:
         logging.info("Stopping producer...")
@@ -153,34 +175,49 @@ async def consume_and_store() -> None:
     except Exception as exc:
         logging.info("Hypertable already exists or error: %s", exc)
 
+    await conn.close()
+
+    pool = await asyncpg.create_pool(
+        **DB_CONFIG,
+        min_size=1,
+        max_size=DB_MAX_IN_FLIGHT,
+    )
+
     consumer = AIOKafkaConsumer(
         TOPIC,
         bootstrap_servers=KAFKA_BROKER,
         group_id="db-writer-group",
-        value_deserializer=lambda value: json.loads(value.decode("utf-8")),
+        enable_auto_commit=False,
     )
 
     await consumer.start()
-    logging.info("DB consumer started.")
+    logging.info(
+        "DB consumer started (flush_size=%d, flush_interval=%.2fs, max_in_flight=%d).",
+        DB_FLUSH_SIZE,
+        DB_FLUSH_INTERVAL_S,
+        DB_MAX_IN_FLIGHT,
+    )
+
+    writer = BatchTickWriter(
+        consumer,
+        pool,
+        flush_size=DB_FLUSH_SIZE,
+        flush_interval_s=DB_FLUSH_INTERVAL_S,
+        max_in_flight=DB_MAX_IN_FLIGHT,
+        topic=TOPIC,
+    )
+    watch_consumer_lag(consumer, writer.positions, "db-writer-group")
+    watch_tracers([writer.fetch_tracer, writer.write_tracer])
 
     try:
-        async for msg in consumer:
-            tick = msg.value
-            logging.info("Inserting tick \u2192 %s", tick)
-
-            await conn.execute(
-                INSERT_QUERY,
-                tick["symbol"],
-                tick["price"],
-                tick["volume"],
-                tick["timestamp"],
-            )
+        await writer.run()
     finally:
         await consumer.stop()
-        await conn.close()
+        await pool.close()
 
 
 async def main() -> None:
+    start_exporter()
     await asyncio.gather(
         produce(),
         consume_and_store(),
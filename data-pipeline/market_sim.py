@@ -0,0 +1,89 @@
+import asyncio
+import time
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from symbols import SymbolConfig
+
+MEAN_REVERSION_STRENGTH = 0.002
+
+
+class MarketSimulator:
+    """Vectorized random walk over a whole symbol universe."""
+
+    def __init__(
+        self,
+        configs: Sequence[SymbolConfig],
+        sector_correlation: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        if not 0.0 <= sector_correlation <= 1.0:
+            raise ValueError("sector_correlation must be between 0 and 1")
+
+        self.symbols: List[str] = [cfg.symbol for cfg in configs]
+
+        self._rng = np.random.default_rng(seed)
+
+        self._base = np.array([cfg.base_price for cfg in configs], dtype=np.float64)
+        self._step_dollars = np.array(
+            [cfg.tick_volatility_cents for cfg in configs], dtype=np.float64
+        ) / 100.0
+        band = np.array(
+            [cfg.max_intraday_deviation_cents for cfg in configs], dtype=np.float64
+        ) / 100.0
+        self._min = self._base - band
+        self._max = self._base + band
+
+        self._mean_volume = np.array([cfg.mean_volume for cfg in configs], dtype=np.float64)
+        self._volume_jitter = np.array([cfg.volume_jitter for cfg in configs], dtype=np.float64)
+
+        sectors, self._sector_index = np.unique(
+            [cfg.sector for cfg in configs], return_inverse=True
+        )
+        self._n_sectors = len(sectors)
+        self._factor_weight = np.sqrt(sector_correlation)
+        self._idio_weight = np.sqrt(1.0 - sector_correlation)
+
+        self.prices = self._base.copy()
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def step(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance every symbol one tick and return (prices, volumes)."""
+        shocks = self._rng.standard_normal(len(self.prices))
+
+        if self._factor_weight > 0.0:
+            sector_shocks = self._rng.standard_normal(self._n_sectors)
+            shocks *= self._idio_weight
+            shocks += self._factor_weight * sector_shocks[self._sector_index]
+
+        prices = self.prices
+        prices += shocks * self._step_dollars
+        prices += (self._base - prices) * MEAN_REVERSION_STRENGTH
+        np.clip(prices, self._min, self._max, out=prices)
+
+        volumes = self._rng.normal(self._mean_volume, self._volume_jitter).astype(np.int64)
+        np.maximum(volumes, 1, out=volumes)
+
+        return prices, volumes
+
+    async def run(
+        self, interval_s: float
+    ) -> AsyncIterator[Tuple[float, np.ndarray, np.ndarray]]:
+        """Yield (timestamp, prices, volumes) every `interval_s` seconds."""
+        next_tick = time.perf_counter()
+
+        while True:
+            prices, volumes = self.step()
+            yield time.time(), prices, volumes
+
+            next_tick += interval_s
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Fell behind: resync instead of bursting to catch up.
+                next_tick = time.perf_counter()
+                await asyncio.sleep(0)
@@ -0,0 +1,105 @@
+import logging
+import os
+from typing import Dict, Iterable, Iterator
+
+from aiokafka import AIOKafkaConsumer, TopicPartition
+from prometheus_client import Counter, Histogram, start_http_server
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.registry import REGISTRY, Collector
+from telemetry import BATCH_BUCKETS, LATENCY_BUCKETS
+from tracing import StageTracer, StageTracerCollector
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
+# Counters are bumped once per produce cycle or fetched batch. The delivery
+# histogram is observed per tick from the ack callback, which already costs
+# more than the observe().
+PRODUCED = Counter(
+    "tradestream_pipeline_produced",
+    "Ticks handed to the Kafka producer.",
+    ["topic"],
+)
+DELIVERY_FAILED = Counter(
+    "tradestream_pipeline_delivery_failed",
+    "Ticks whose Kafka delivery failed.",
+)
+DELIVERY_SECONDS = Histogram(
+    "tradestream_pipeline_delivery_seconds",
+    "Send-to-ack latency per produced tick.",
+    buckets=LATENCY_BUCKETS,
+)
+
+CONSUMED = Counter(
+    "tradestream_pipeline_consumed",
+    "Ticks fetched by the DB writer's Kafka consumer.",
+    ["topic"],
+)
+DB_ROWS_WRITTEN = Counter(
+    "tradestream_pipeline_db_rows_written",
+    "Tick rows copied into the ticks hypertable.",
+)
+DB_ROWS_SKIPPED = Counter(
+    "tradestream_pipeline_db_rows_skipped",
+    "Ticks the DB writer skipped: malformed, or rejected by the database.",
+)
+DB_WRITE_RETRIES = Counter(
+    "tradestream_pipeline_db_write_retries",
+    "Tick batch writes retried after a connection error.",
+)
+DB_WRITE_SECONDS = Histogram(
+    "tradestream_pipeline_db_write_seconds",
+    "Duration of one tick batch COPY, retries included.",
+    buckets=LATENCY_BUCKETS,
+)
+DB_WRITE_BATCH_SIZE = Histogram(
+    "tradestream_pipeline_db_write_batch_size",
+    "Rows per tick batch COPY.",
+    buckets=BATCH_BUCKETS,
+)
+
+
+class ConsumerLagCollector(Collector):
+    """Per-partition lag of a consumer, read at scrape time."""
+
+    def __init__(
+        self,
+        consumer: AIOKafkaConsumer,
+        positions: Dict[TopicPartition, int],
+        group_id: str,
+    ) -> None:
+        self._consumer = consumer
+        self._positions = positions
+        self._group_id = group_id
+
+    def collect(self) -> Iterator[Metric]:
+        lag = GaugeMetricFamily(
+            "tradestream_kafka_consumer_lag",
+            "Messages behind the partition's high watermark.",
+            labels=["topic", "group", "partition"],
+        )
+        for tp, position in list(self._positions.items()):
+            highwater = self._consumer.highwater(tp)
+            if highwater is not None:
+                lag.add_metric(
+                    [tp.topic, self._group_id, str(tp.partition)],
+                    max(0, highwater - position),
+                )
+        yield lag
+
+
+def watch_consumer_lag(
+    consumer: AIOKafkaConsumer,
+    positions: Dict[TopicPartition, int],
+    group_id: str,
+) -> None:
+    REGISTRY.register(ConsumerLagCollector(consumer, positions, group_id))
+
+
+def watch_tracers(tracers: Iterable[StageTracer]) -> None:
+    watched = list(tracers)
+    REGISTRY.register(StageTracerCollector(lambda: watched))
+
+
+def start_exporter(port: int = METRICS_PORT) -> None:
+    start_http_server(port)
+    logging.info("Prometheus metrics on :%d/metrics", port)
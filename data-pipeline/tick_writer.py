@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Deque, Dict, List, Tuple
+
+import asyncpg
+from aiokafka import AIOKafkaConsumer, TopicPartition
+from codec import decode
+from retry import retry
+from tracing import StageTracer
+
+from metrics import (
+    CONSUMED,
+    DB_ROWS_SKIPPED,
+    DB_ROWS_WRITTEN,
+    DB_WRITE_BATCH_SIZE,
+    DB_WRITE_RETRIES,
+    DB_WRITE_SECONDS,
+)
+
+TICK_COLUMNS = ("symbol", "price", "volume", "ts")
+
+TickRecord = Tuple[str, float, int, datetime]
+Offsets = Dict[TopicPartition, int]
+
+RETRYABLE_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    ConnectionError,
+    OSError,
+)
+# asyncpg's client-side DataError (a row it can't encode) is an
+# InterfaceError too, but retrying it can never succeed.
+UNRETRYABLE_ERRORS = (ValueError,)
+
+
+def tick_to_record(tick: dict) -> TickRecord:
+    return (
+        tick["symbol"],
+        float(tick["price"]),
+        int(tick["volume"]),
+        datetime.fromtimestamp(float(tick["timestamp"]), tz=timezone.utc),
+    )
+
+
+class BatchTickWriter:
+    """Drains a Kafka consumer in batches and COPYs them into the ticks hypertable."""
+
+    def __init__(
+        self,
+        consumer: AIOKafkaConsumer,
+        pool: asyncpg.Pool,
+        flush_size: int = 1000,
+        flush_interval_s: float = 0.5,
+        max_in_flight: int = 2,
+        table: str = "ticks",
+        topic: str = "market_ticks",
+    ) -> None:
+        self._consumer = consumer
+        self._pool = pool
+        self._flush_size = flush_size
+        self._flush_interval_s = flush_interval_s
+        self._table = table
+
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight: Deque[Tuple[asyncio.Task, Offsets]] = deque()
+
+        self._records: List[TickRecord] = []
+        self._offsets: Offsets = {}
+        self._window_started = 0.0
+
+        self._event_times: List[float] = []
+
+        # Next offset to fetch per partition, for consumer-lag metrics.
+        self.positions: Offsets = {}
+        self.fetch_tracer = StageTracer(f"{topic}:pipeline_fetch")
+        self.write_tracer = StageTracer(f"{topic}:pipeline_db")
+
+    async def run(self) -> None:
+        try:
+            while True:
+                batches = await self._consumer.getmany(
+                    timeout_ms=self._fetch_timeout_ms(),
+                    max_records=self._flush_size - len(self._records),
+                )
+
+                for tp, messages in batches.items():
+                    if not messages:
+                        continue
+                    if not self._offsets:
+                        self._window_started = time.monotonic()
+                    for m in messages:
+                        self._add(tp, m)
+                    self._offsets[tp] = messages[-1].offset + 1
+                    self.positions[tp] = messages[-1].offset + 1
+                    CONSUMED.labels(tp.topic).inc(len(messages))
+
+                if self._window_full() or self._window_expired():
+                    await self._submit()
+
+                await self._commit_landed()
+        finally:
+            await self.drain()
+
+    async def drain(self) -> None:
+        """Flush whatever is buffered and wait for every in-flight batch."""
+        if self._offsets:
+            await self._submit()
+
+        if self._in_flight:
+            await asyncio.gather(
+                *(task for task, _ in self._in_flight),
+                return_exceptions=True,
+            )
+        await self._commit_landed()
+
+    def _add(self, tp: TopicPartition, m) -> None:
+        try:
+            tick = decode(m.value, m.headers)
+            record = tick_to_record(tick)
+        except Exception as exc:
+            DB_ROWS_SKIPPED.inc()
+            logging.warning(
+                "Skipping malformed tick at %s[%d] offset %d: %s",
+                tp.topic, tp.partition, m.offset, exc,
+            )
+            return
+
+        self.fetch_tracer.observe(tick)
+        self._records.append(record)
+        self._event_times.append(record[3].timestamp())
+
+    def _fetch_timeout_ms(self) -> int:
+        if not self._offsets:
+            return int(self._flush_interval_s * 1000)
+
+        remaining = self._flush_interval_s - (time.monotonic() - self._window_started)
+        return max(0, int(remaining * 1000))
+
+    def _window_full(self) -> bool:
+        return len(self._records) >= self._flush_size
+
+    def _window_expired(self) -> bool:
+        return bool(self._offsets) and (
+            time.monotonic() - self._window_started >= self._flush_interval_s
+        )
+
+    async def _submit(self) -> None:
+        records, offsets, event_times = self._records, self._offsets, self._event_times
+        self._records, self._offsets, self._event_times = [], {}, []
+
+        if not records:
+            # Only skipped messages: nothing to write, but their offsets
+            # still commit in order behind the batches ahead of them.
+            landed = asyncio.get_running_loop().create_future()
+            landed.set_result(None)
+            self._in_flight.append((landed, offsets))
+            return
+
+        await self._slots.acquire()
+        task = asyncio.create_task(self._write(records, event_times))
+        self._in_flight.append((task, offsets))
+
+    async def _write(self, records: List[TickRecord], event_times: List[float]) -> None:
+        first_started = time.perf_counter()
+        try:
+            try:
+                await self._retry(lambda: self._copy(records), "Tick batch write")
+                written = len(records)
+            except Exception as exc:
+                logging.warning(
+                    "Tick batch of %d rows rejected (%s); writing row by row", len(records), exc
+                )
+                written = await self._copy_rows(records)
+            DB_WRITE_SECONDS.observe(time.perf_counter() - first_started)
+            DB_WRITE_BATCH_SIZE.observe(len(records))
+            DB_ROWS_WRITTEN.inc(written)
+            self.write_tracer.observe_times(event_times)
+        finally:
+            self._slots.release()
+
+    async def _copy_rows(self, records: List[TickRecord]) -> int:
+        """One COPY per row, skipping rows the database rejects."""
+        written = 0
+        for record in records:
+            try:
+                await self._retry(lambda: self._copy([record]), "Tick row write")
+                written += 1
+            except Exception as exc:
+                DB_ROWS_SKIPPED.inc()
+                logging.warning(
+                    "Skipping tick %s @ %s rejected by the database: %s",
+                    record[0], record[3], exc,
+                )
+        return written
+
+    async def _retry(self, attempt: Callable[[], Awaitable[None]], what: str) -> None:
+        await retry(
+            attempt,
+            RETRYABLE_ERRORS,
+            what,
+            on_retry=lambda exc: DB_WRITE_RETRIES.inc(),
+            give_up_on=UNRETRYABLE_ERRORS,
+        )
+
+    async def _copy(self, records: List[TickRecord]) -> None:
+        started = time.perf_counter()
+        async with self._pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                self._table,
+                records=records,
+                columns=TICK_COLUMNS,
+            )
+        logging.debug(
+            "Wrote %d ticks in %.1f ms",
+            len(records),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    async def _commit_landed(self) -> None:
+        """Commit offsets for the longest prefix of batches that has landed."""
+        landed: Offsets = {}
+        failure = None
+
+        while self._in_flight and self._in_flight[0][0].done():
+            task, offsets = self._in_flight[0]
+            failure = task.exception()
+            if failure is not None:
+                # Leave the failed batch at the head so nothing after it
+                # is ever committed past its offsets.
+                break
+            self._in_flight.popleft()
+            landed.update(offsets)
+
+        if landed:
+            await self._consumer.commit(landed)
+
+        if failure is not None:
+            raise failure
@@ -0,0 +1,79 @@
+"""
+Encode/decode cost and payload size of the wire formats vs. stdlib json.
+
+    python shared/benchmarks/bench_codec.py --n 200000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codec import decode, encode_analytics, encode_tick  # noqa: E402
+
+TICK = {
+    "symbol": "AAPL",
+    "price": 190.37,
+    "volume": 1024,
+    "timestamp": 1731960000.123456,
+}
+
+ANALYTICS = {
+    "symbol": "AAPL",
+    "timestamp": 1731960000.123456,
+    "vwap": 190.2841234,
+    "volatility": 0.4123412,
+    "pct_change": -0.0812341,
+    "avg_volume": 951.25,
+    "volume_spike": False,
+}
+
+
+def per_op_us(fn, n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def bench(name: str, record: dict, encoder, n: int) -> None:
+    stdlib = json.dumps(record).encode("utf-8")
+    rows = [
+        (
+            "stdlib json",
+            len(stdlib),
+            per_op_us(lambda: json.dumps(record).encode("utf-8"), n),
+            per_op_us(lambda: json.loads(stdlib.decode("utf-8")), n),
+        )
+    ]
+
+    for wire_format in ("json", "binary"):
+        value, headers = encoder(record, wire_format)
+        rows.append(
+            (
+                f"codec {wire_format}",
+                len(value),
+                per_op_us(lambda: encoder(record, wire_format), n),
+                per_op_us(lambda: decode(value, headers), n),
+            )
+        )
+
+    print(f"\n{name}")
+    print(f"{'format':<14} {'bytes':>6} {'encode us':>10} {'decode us':>10}")
+    for label, size, enc, dec in rows:
+        print(f"{label:<14} {size:>6} {enc:>10.3f} {dec:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=200_000)
+    args = parser.parse_args()
+
+    bench("market_ticks", TICK, encode_tick, args.n)
+    bench("market_analytics", ANALYTICS, encode_analytics, args.n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Wire format for the market_ticks and market_analytics topics."""
+import struct
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+
+CONTENT_TYPE_HEADER = "content-type"
+
+JSON = b"application/json"
+TICK_V1 = b"application/x-tradestream-tick;v=1"
+TICK_V2 = b"application/x-tradestream-tick;v=2"
+ANALYTICS_V1 = b"application/x-tradestream-analytics;v=1"
+ANALYTICS_V2 = b"application/x-tradestream-analytics;v=2"
+
+Headers = List[Tuple[str, bytes]]
+
+# price, timestamp, volume, len(symbol) -- followed by the UTF-8 symbol.
+_TICK_V1 = struct.Struct("<ddIB")
+
+# price, timestamp, volume, seq, len(symbol) -- followed by the UTF-8 symbol.
+_TICK_V2 = struct.Struct("<ddIQB")
+
+# timestamp, vwap, volatility, pct_change, avg_volume, volume_spike,
+# len(symbol) -- followed by the UTF-8 symbol.
+_ANALYTICS_V1 = struct.Struct("<ddddd?B")
+
+# timestamp, event_ts, vwap, volatility, pct_change, avg_volume,
+# volume_spike, seq, len(symbol) -- followed by the UTF-8 symbol.
+_ANALYTICS_V2 = struct.Struct("<dddddd?QB")
+
+
+def _encode_json(data: dict) -> bytes:
+    return orjson.dumps(data)
+
+
+def _decode_tick_v1(value: bytes) -> dict:
+    price, timestamp, volume, symbol_len = _TICK_V1.unpack_from(value)
+    offset = _TICK_V1.size
+    return {
+        "symbol": value[offset:offset + symbol_len].decode("utf-8"),
+        "price": price,
+        "volume": volume,
+        "timestamp": timestamp,
+    }
+
+
+def _encode_tick_v2(tick: dict) -> bytes:
+    symbol = tick["symbol"].encode("utf-8")
+    return _TICK_V2.pack(
+        tick["price"],
+        tick["timestamp"],
+        tick["volume"],
+        tick.get("seq", 0),
+        len(symbol),
+    ) + symbol
+
+
+def _decode_tick_v2(value: bytes) -> dict:
+    price, timestamp, volume, seq, symbol_len = _TICK_V2.unpack_from(value)
+    offset = _TICK_V2.size
+    return {
+        "symbol": value[offset:offset + symbol_len].decode("utf-8"),
+        "price": price,
+        "volume": volume,
+        "timestamp": timestamp,
+        "seq": seq,
+    }
+
+
+def _decode_analytics_v1(value: bytes) -> dict:
+    (
+        timestamp,
+        vwap,
+        volatility,
+        pct_change,
+        avg_volume,
+        volume_spike,
+        symbol_len,
+    ) = _ANALYTICS_V1.unpack_from(value)
+    offset = _ANALYTICS_V1.size
+    return {
+        "symbol": value[offset:offset + symbol_len].decode("utf-8"),
+        "timestamp": timestamp,
+        "vwap": vwap,
+        "volatility": volatility,
+        "pct_change": pct_change,
+        "avg_volume": avg_volume,
+        "volume_spike": volume_spike,
+    }
+
+
+def _encode_analytics_v2(record: dict) -> bytes:
+    symbol = record["symbol"].encode("utf-8")
+    return _ANALYTICS_V2.pack(
+        record["timestamp"],
+        record.get("event_ts", record["timestamp"]),
+        record["vwap"],
+        record["volatility"],
+        record["pct_change"],
+        record["avg_volume"],
+        record["volume_spike"],
+        record.get("seq", 0),
+        len(symbol),
+    ) + symbol
+
+
+def _decode_analytics_v2(value: bytes) -> dict:
+    (
+        timestamp,
+        event_ts,
+        vwap,
+        volatility,
+        pct_change,
+        avg_volume,
+        volume_spike,
+        seq,
+        symbol_len,
+    ) = _ANALYTICS_V2.unpack_from(value)
+    offset = _ANALYTICS_V2.size
+    return {
+        "symbol": value[offset:offset + symbol_len].decode("utf-8"),
+        "timestamp": timestamp,
+        "event_ts": event_ts,
+        "vwap": vwap,
+        "volatility": volatility,
+        "pct_change": pct_change,
+        "avg_volume": avg_volume,
+        "volume_spike": volume_spike,
+        "seq": seq,
+    }
+
+
+_DECODERS: Dict[bytes, Callable[[bytes], dict]] = {
+    JSON: orjson.loads,
+    TICK_V1: _decode_tick_v1,
+    TICK_V2: _decode_tick_v2,
+    ANALYTICS_V1: _decode_analytics_v1,
+    ANALYTICS_V2: _decode_analytics_v2,
+}
+
+_TICK_ENCODERS: Dict[str, Tuple[bytes, Callable[[dict], bytes]]] = {
+    "json": (JSON, _encode_json),
+    "binary": (TICK_V2, _encode_tick_v2),
+}
+
+_ANALYTICS_ENCODERS: Dict[str, Tuple[bytes, Callable[[dict], bytes]]] = {
+    "json": (JSON, _encode_json),
+    "binary": (ANALYTICS_V2, _encode_analytics_v2),
+}
+
+
+def encode_tick(tick: dict, wire_format: str = "json") -> Tuple[bytes, Headers]:
+    """Return (value, headers) for a tick in the given wire format."""
+    content_type, encode = _TICK_ENCODERS[wire_format]
+    return encode(tick), [(CONTENT_TYPE_HEADER, content_type)]
+
+
+def encode_analytics(record: dict, wire_format: str = "json") -> Tuple[bytes, Headers]:
+    """Return (value, headers) for an analytics record in the given wire format."""
+    content_type, encode = _ANALYTICS_ENCODERS[wire_format]
+    return encode(record), [(CONTENT_TYPE_HEADER, content_type)]
+
+
+def content_type(headers: Optional[Sequence[Tuple[str, bytes]]]) -> bytes:
+    for key, value in headers or ():
+        if key == CONTENT_TYPE_HEADER:
+            return value
+    return JSON
+
+
+def decode(value: bytes, headers: Optional[Sequence[Tuple[str, bytes]]] = None) -> dict:
+    """Decode a Kafka message value using its content-type header."""
+    decoder = _DECODERS.get(content_type(headers))
+    if decoder is None:
+        raise ValueError(f"Unsupported content-type: {content_type(headers)!r}")
+    return decoder(value)
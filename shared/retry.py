@@ -0,0 +1,31 @@
+"""Retry with capped exponential backoff, for the database and ingest writers."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+async def retry(
+    attempt: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    what: str,
+    logger: logging.Logger = logging.getLogger(),
+    on_retry: Optional[Callable[[BaseException], None]] = None,
+    give_up_on: Tuple[Type[BaseException], ...] = (),
+    initial_delay_s: float = 0.5,
+    max_delay_s: float = 10.0,
+) -> T:
+    """Await `attempt()` until it stops raising `retry_on`, unless it's also `give_up_on`."""
+    delay = initial_delay_s
+    while True:
+        try:
+            return await attempt()
+        except retry_on as exc:
+            if isinstance(exc, give_up_on):
+                raise
+            if on_retry is not None:
+                on_retry(exc)
+            logger.warning("%s failed: %s. Retrying in %.1fs...", what, exc, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay_s)
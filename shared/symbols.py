@@ -10,131 +10,132 @@ class SymbolConfig:
     max_intraday_deviation_cents: float
     mean_volume: int
     volume_jitter: int
+    sector: str = ""
 
 SYMBOL_CONFIGS: List[SymbolConfig] = [
     # ---- Mega-cap tech / growth ----
-    SymbolConfig("AAPL", "Apple Inc.", 190.0, 6.0, 250.0, 950, 250),
-    SymbolConfig("MSFT", "Microsoft Corp.", 380.0, 6.0, 250.0, 850, 220),
-    SymbolConfig("GOOG", "Alphabet Class C", 140.0, 5.0, 220.0, 800, 220),
-    SymbolConfig("AMZN", "Amazon.com Inc.", 150.0, 7.0, 260.0, 900, 260),
-    SymbolConfig("TSLA", "Tesla Inc.", 260.0, 12.0, 600.0, 1100, 400),
-    SymbolConfig("META", "Meta Platforms Inc.", 320.0, 8.0, 400.0, 900, 260),
-    SymbolConfig("NVDA", "NVIDIA Corp.", 450.0, 14.0, 800.0, 1000, 350),
-    SymbolConfig("NFLX", "Netflix Inc.", 400.0, 10.0, 450.0, 700, 220),
-    SymbolConfig("ADBE", "Adobe Inc.", 500.0, 10.0, 500.0, 650, 200),
-    SymbolConfig("CRM", "Salesforce Inc.", 230.0, 7.0, 300.0, 650, 200),
-
-    SymbolConfig("ORCL", "Oracle Corp.", 120.0, 4.0, 180.0, 600, 180),
-    SymbolConfig("INTC", "Intel Corp.", 40.0, 3.0, 120.0, 700, 200),
-    SymbolConfig("AMD", "Advanced Micro Devices", 120.0, 5.0, 220.0, 800, 230),
-    SymbolConfig("CSCO", "Cisco Systems Inc.", 55.0, 3.0, 130.0, 600, 170),
-    SymbolConfig("TXN", "Texas Instruments Inc.", 165.0, 5.0, 220.0, 600, 180),
-    SymbolConfig("QCOM", "Qualcomm Inc.", 140.0, 5.0, 220.0, 650, 190),
-    SymbolConfig("AVGO", "Broadcom Inc.", 900.0, 20.0, 1200.0, 600, 180),
-    SymbolConfig("IBM", "IBM Corp.", 140.0, 4.0, 180.0, 500, 150),
-    SymbolConfig("SHOP", "Shopify Inc.", 70.0, 6.0, 260.0, 700, 260),
-    SymbolConfig("SQ", "Block Inc.", 65.0, 7.0, 260.0, 750, 260),
-
-    SymbolConfig("PYPL", "PayPal Holdings Inc.", 70.0, 6.0, 260.0, 700, 230),
-    SymbolConfig("UBER", "Uber Technologies", 45.0, 4.0, 180.0, 800, 260),
-    SymbolConfig("LYFT", "Lyft Inc.", 12.0, 5.0, 200.0, 500, 200),
-    SymbolConfig("ABNB", "Airbnb Inc.", 130.0, 6.0, 260.0, 700, 230),
-    SymbolConfig("SNAP", "Snap Inc.", 10.0, 4.0, 150.0, 650, 220),
-    SymbolConfig("PINS", "Pinterest Inc.", 30.0, 4.0, 180.0, 600, 200),
-    SymbolConfig("SPOT", "Spotify Technology", 160.0, 8.0, 300.0, 600, 200),
-    SymbolConfig("DOCU", "DocuSign Inc.", 55.0, 6.0, 240.0, 500, 180),
-    SymbolConfig("ZM", "Zoom Video Communications", 70.0, 7.0, 260.0, 500, 180),
-    SymbolConfig("MDB", "MongoDB Inc.", 380.0, 12.0, 700.0, 500, 170),
-
-    SymbolConfig("SNOW", "Snowflake Inc.", 170.0, 10.0, 450.0, 550, 180),
-    SymbolConfig("DDOG", "Datadog Inc.", 110.0, 7.0, 260.0, 550, 180),
-    SymbolConfig("NET", "Cloudflare Inc.", 70.0, 7.0, 260.0, 600, 190),
-    SymbolConfig("CRWD", "CrowdStrike Holdings", 260.0, 10.0, 500.0, 600, 190),
-    SymbolConfig("ZS", "Zscaler Inc.", 180.0, 9.0, 400.0, 550, 180),
-    SymbolConfig("OKTA", "Okta Inc.", 90.0, 7.0, 260.0, 500, 170),
-    SymbolConfig("PANW", "Palo Alto Networks", 250.0, 9.0, 450.0, 550, 180),
-    SymbolConfig("TEAM", "Atlassian Corp.", 200.0, 8.0, 350.0, 550, 170),
-    SymbolConfig("INTU", "Intuit Inc.", 500.0, 10.0, 600.0, 550, 170),
-    SymbolConfig("NOW", "ServiceNow Inc.", 650.0, 12.0, 800.0, 500, 160),
-
-    SymbolConfig("HUBS", "HubSpot Inc.", 500.0, 11.0, 700.0, 450, 150),
+    SymbolConfig("AAPL", "Apple Inc.", 190.0, 6.0, 250.0, 950, 250, "tech"),
+    SymbolConfig("MSFT", "Microsoft Corp.", 380.0, 6.0, 250.0, 850, 220, "tech"),
+    SymbolConfig("GOOG", "Alphabet Class C", 140.0, 5.0, 220.0, 800, 220, "tech"),
+    SymbolConfig("AMZN", "Amazon.com Inc.", 150.0, 7.0, 260.0, 900, 260, "tech"),
+    SymbolConfig("TSLA", "Tesla Inc.", 260.0, 12.0, 600.0, 1100, 400, "tech"),
+    SymbolConfig("META", "Meta Platforms Inc.", 320.0, 8.0, 400.0, 900, 260, "tech"),
+    SymbolConfig("NVDA", "NVIDIA Corp.", 450.0, 14.0, 800.0, 1000, 350, "tech"),
+    SymbolConfig("NFLX", "Netflix Inc.", 400.0, 10.0, 450.0, 700, 220, "tech"),
+    SymbolConfig("ADBE", "Adobe Inc.", 500.0, 10.0, 500.0, 650, 200, "tech"),
+    SymbolConfig("CRM", "Salesforce Inc.", 230.0, 7.0, 300.0, 650, 200, "tech"),
+
+    SymbolConfig("ORCL", "Oracle Corp.", 120.0, 4.0, 180.0, 600, 180, "tech"),
+    SymbolConfig("INTC", "Intel Corp.", 40.0, 3.0, 120.0, 700, 200, "tech"),
+    SymbolConfig("AMD", "Advanced Micro Devices", 120.0, 5.0, 220.0, 800, 230, "tech"),
+    SymbolConfig("CSCO", "Cisco Systems Inc.", 55.0, 3.0, 130.0, 600, 170, "tech"),
+    SymbolConfig("TXN", "Texas Instruments Inc.", 165.0, 5.0, 220.0, 600, 180, "tech"),
+    SymbolConfig("QCOM", "Qualcomm Inc.", 140.0, 5.0, 220.0, 650, 190, "tech"),
+    SymbolConfig("AVGO", "Broadcom Inc.", 900.0, 20.0, 1200.0, 600, 180, "tech"),
+    SymbolConfig("IBM", "IBM Corp.", 140.0, 4.0, 180.0, 500, 150, "tech"),
+    SymbolConfig("SHOP", "Shopify Inc.", 70.0, 6.0, 260.0, 700, 260, "tech"),
+    SymbolConfig("SQ", "Block Inc.", 65.0, 7.0, 260.0, 750, 260, "tech"),
+
+    SymbolConfig("PYPL", "PayPal Holdings Inc.", 70.0, 6.0, 260.0, 700, 230, "tech"),
+    SymbolConfig("UBER", "Uber Technologies", 45.0, 4.0, 180.0, 800, 260, "tech"),
+    SymbolConfig("LYFT", "Lyft Inc.", 12.0, 5.0, 200.0, 500, 200, "tech"),
+    SymbolConfig("ABNB", "Airbnb Inc.", 130.0, 6.0, 260.0, 700, 230, "tech"),
+    SymbolConfig("SNAP", "Snap Inc.", 10.0, 4.0, 150.0, 650, 220, "tech"),
+    SymbolConfig("PINS", "Pinterest Inc.", 30.0, 4.0, 180.0, 600, 200, "tech"),
+    SymbolConfig("SPOT", "Spotify Technology", 160.0, 8.0, 300.0, 600, 200, "tech"),
+    SymbolConfig("DOCU", "DocuSign Inc.", 55.0, 6.0, 240.0, 500, 180, "tech"),
+    SymbolConfig("ZM", "Zoom Video Communications", 70.0, 7.0, 260.0, 500, 180, "tech"),
+    SymbolConfig("MDB", "MongoDB Inc.", 380.0, 12.0, 700.0, 500, 170, "tech"),
+
+    SymbolConfig("SNOW", "Snowflake Inc.", 170.0, 10.0, 450.0, 550, 180, "tech"),
+    SymbolConfig("DDOG", "Datadog Inc.", 110.0, 7.0, 260.0, 550, 180, "tech"),
+    SymbolConfig("NET", "Cloudflare Inc.", 70.0, 7.0, 260.0, 600, 190, "tech"),
+    SymbolConfig("CRWD", "CrowdStrike Holdings", 260.0, 10.0, 500.0, 600, 190, "tech"),
+    SymbolConfig("ZS", "Zscaler Inc.", 180.0, 9.0, 400.0, 550, 180, "tech"),
+    SymbolConfig("OKTA", "Okta Inc.", 90.0, 7.0, 260.0, 500, 170, "tech"),
+    SymbolConfig("PANW", "Palo Alto Networks", 250.0, 9.0, 450.0, 550, 180, "tech"),
+    SymbolConfig("TEAM", "Atlassian Corp.", 200.0, 8.0, 350.0, 550, 170, "tech"),
+    SymbolConfig("INTU", "Intuit Inc.", 500.0, 10.0, 600.0, 550, 170, "tech"),
+    SymbolConfig("NOW", "ServiceNow Inc.", 650.0, 12.0, 800.0, 500, 160, "tech"),
+
+    SymbolConfig("HUBS", "HubSpot Inc.", 500.0, 11.0, 700.0, 450, 150, "tech"),
 
     # ---- Financials ----
-    SymbolConfig("JPM", "JPMorgan Chase & Co.", 170.0, 4.0, 200.0, 800, 220),
-    SymbolConfig("BAC", "Bank of America", 35.0, 3.0, 120.0, 900, 260),
-    SymbolConfig("C", "Citigroup Inc.", 50.0, 3.0, 130.0, 700, 220),
-    SymbolConfig("WFC", "Wells Fargo", 45.0, 3.0, 130.0, 700, 220),
-    SymbolConfig("GS", "Goldman Sachs", 360.0, 8.0, 400.0, 500, 160),
-    SymbolConfig("MS", "Morgan Stanley", 90.0, 5.0, 220.0, 600, 190),
-    SymbolConfig("V", "Visa Inc.", 250.0, 5.0, 260.0, 600, 180),
-    SymbolConfig("MA", "Mastercard Inc.", 400.0, 6.0, 320.0, 550, 170),
-    SymbolConfig("AXP", "American Express", 180.0, 5.0, 260.0, 550, 170),
+    SymbolConfig("JPM", "JPMorgan Chase & Co.", 170.0, 4.0, 200.0, 800, 220, "financials"),
+    SymbolConfig("BAC", "Bank of America", 35.0, 3.0, 120.0, 900, 260, "financials"),
+    SymbolConfig("C", "Citigroup Inc.", 50.0, 3.0, 130.0, 700, 220, "financials"),
+    SymbolConfig("WFC", "Wells Fargo", 45.0, 3.0, 130.0, 700, 220, "financials"),
+    SymbolConfig("GS", "Goldman Sachs", 360.0, 8.0, 400.0, 500, 160, "financials"),
+    SymbolConfig("MS", "Morgan Stanley", 90.0, 5.0, 220.0, 600, 190, "financials"),
+    SymbolConfig("V", "Visa Inc.", 250.0, 5.0, 260.0, 600, 180, "financials"),
+    SymbolConfig("MA", "Mastercard Inc.", 400.0, 6.0, 320.0, 550, 170, "financials"),
+    SymbolConfig("AXP", "American Express", 180.0, 5.0, 260.0, 550, 170, "financials"),
 
     # ---- Consumer ----
-    SymbolConfig("WMT", "Walmart Inc.", 155.0, 3.0, 150.0, 700, 200),
-    SymbolConfig("TGT", "Target Corp.", 140.0, 4.0, 200.0, 600, 190),
-    SymbolConfig("COST", "Costco Wholesale", 550.0, 6.0, 350.0, 600, 180),
-    SymbolConfig("HD", "Home Depot", 320.0, 5.0, 260.0, 600, 180),
-    SymbolConfig("LOW", "Lowe's Companies", 220.0, 5.0, 220.0, 550, 170),
-    SymbolConfig("NKE", "Nike Inc.", 110.0, 4.0, 200.0, 650, 200),
-    SymbolConfig("SBUX", "Starbucks Corp.", 100.0, 4.0, 200.0, 600, 190),
-    SymbolConfig("MCD", "McDonald's Corp.", 290.0, 4.0, 200.0, 550, 170),
-    SymbolConfig("KO", "Coca-Cola Co.", 60.0, 2.0, 80.0, 650, 200),
-    SymbolConfig("PEP", "PepsiCo Inc.", 180.0, 3.0, 150.0, 600, 180),
-    SymbolConfig("DIS", "Walt Disney Co.", 100.0, 4.0, 200.0, 600, 190),
-    SymbolConfig("ROKU", "Roku Inc.", 70.0, 8.0, 300.0, 500, 200),
-    SymbolConfig("TTD", "The Trade Desk", 80.0, 7.0, 260.0, 500, 190),
-    SymbolConfig("F", "Ford Motor Co.", 14.0, 2.0, 70.0, 650, 220),
-    SymbolConfig("GM", "General Motors", 35.0, 3.0, 120.0, 600, 200),
+    SymbolConfig("WMT", "Walmart Inc.", 155.0, 3.0, 150.0, 700, 200, "consumer"),
+    SymbolConfig("TGT", "Target Corp.", 140.0, 4.0, 200.0, 600, 190, "consumer"),
+    SymbolConfig("COST", "Costco Wholesale", 550.0, 6.0, 350.0, 600, 180, "consumer"),
+    SymbolConfig("HD", "Home Depot", 320.0, 5.0, 260.0, 600, 180, "consumer"),
+    SymbolConfig("LOW", "Lowe's Companies", 220.0, 5.0, 220.0, 550, 170, "consumer"),
+    SymbolConfig("NKE", "Nike Inc.", 110.0, 4.0, 200.0, 650, 200, "consumer"),
+    SymbolConfig("SBUX", "Starbucks Corp.", 100.0, 4.0, 200.0, 600, 190, "consumer"),
+    SymbolConfig("MCD", "McDonald's Corp.", 290.0, 4.0, 200.0, 550, 170, "consumer"),
+    SymbolConfig("KO", "Coca-Cola Co.", 60.0, 2.0, 80.0, 650, 200, "consumer"),
+    SymbolConfig("PEP", "PepsiCo Inc.", 180.0, 3.0, 150.0, 600, 180, "consumer"),
+    SymbolConfig("DIS", "Walt Disney Co.", 100.0, 4.0, 200.0, 600, 190, "consumer"),
+    SymbolConfig("ROKU", "Roku Inc.", 70.0, 8.0, 300.0, 500, 200, "consumer"),
+    SymbolConfig("TTD", "The Trade Desk", 80.0, 7.0, 260.0, 500, 190, "consumer"),
+    SymbolConfig("F", "Ford Motor Co.", 14.0, 2.0, 70.0, 650, 220, "consumer"),
+    SymbolConfig("GM", "General Motors", 35.0, 3.0, 120.0, 600, 200, "consumer"),
 
     # ---- ETFs ----
-    SymbolConfig("SPY", "S&P 500 ETF", 450.0, 4.0, 260.0, 1000, 300),
-    SymbolConfig("QQQ", "NASDAQ 100 ETF", 380.0, 4.0, 260.0, 900, 270),
-    SymbolConfig("IWM", "Russell 2000 ETF", 200.0, 4.0, 220.0, 800, 250),
+    SymbolConfig("SPY", "S&P 500 ETF", 450.0, 4.0, 260.0, 1000, 300, "etf"),
+    SymbolConfig("QQQ", "NASDAQ 100 ETF", 380.0, 4.0, 260.0, 900, 270, "etf"),
+    SymbolConfig("IWM", "Russell 2000 ETF", 200.0, 4.0, 220.0, 800, 250, "etf"),
 
     # ---- Energy / Industrials ----
-    SymbolConfig("XOM", "Exxon Mobil", 110.0, 3.0, 150.0, 700, 220),
-    SymbolConfig("CVX", "Chevron Corp.", 170.0, 3.0, 150.0, 650, 210),
-    SymbolConfig("COP", "ConocoPhillips", 115.0, 3.0, 150.0, 600, 200),
-    SymbolConfig("CAT", "Caterpillar Inc.", 260.0, 4.0, 220.0, 550, 180),
-    SymbolConfig("BA", "Boeing Co.", 220.0, 5.0, 260.0, 550, 180),
-    SymbolConfig("GE", "General Electric", 110.0, 3.0, 150.0, 600, 190),
-    SymbolConfig("LMT", "Lockheed Martin", 430.0, 5.0, 300.0, 450, 150),
+    SymbolConfig("XOM", "Exxon Mobil", 110.0, 3.0, 150.0, 700, 220, "industrials"),
+    SymbolConfig("CVX", "Chevron Corp.", 170.0, 3.0, 150.0, 650, 210, "industrials"),
+    SymbolConfig("COP", "ConocoPhillips", 115.0, 3.0, 150.0, 600, 200, "industrials"),
+    SymbolConfig("CAT", "Caterpillar Inc.", 260.0, 4.0, 220.0, 550, 180, "industrials"),
+    SymbolConfig("BA", "Boeing Co.", 220.0, 5.0, 260.0, 550, 180, "industrials"),
+    SymbolConfig("GE", "General Electric", 110.0, 3.0, 150.0, 600, 190, "industrials"),
+    SymbolConfig("LMT", "Lockheed Martin", 430.0, 5.0, 300.0, 450, 150, "industrials"),
 
     # ---- Healthcare ----
-    SymbolConfig("JNJ", "Johnson & Johnson", 170.0, 3.0, 150.0, 600, 180),
-    SymbolConfig("PFE", "Pfizer Inc.", 35.0, 2.0, 80.0, 650, 200),
-    SymbolConfig("MRK", "Merck & Co.", 110.0, 3.0, 150.0, 600, 190),
-    SymbolConfig("ABBV", "AbbVie Inc.", 160.0, 3.0, 150.0, 600, 190),
-    SymbolConfig("UNH", "UnitedHealth Group", 500.0, 6.0, 350.0, 550, 170),
-    SymbolConfig("TMO", "Thermo Fisher Scientific", 550.0, 7.0, 400.0, 450, 150),
-    SymbolConfig("GILD", "Gilead Sciences", 80.0, 3.0, 130.0, 550, 180),
-    SymbolConfig("BMY", "Bristol-Myers Squibb", 65.0, 3.0, 120.0, 550, 180),
-    SymbolConfig("AMGN", "Amgen Inc.", 260.0, 4.0, 220.0, 500, 170),
+    SymbolConfig("JNJ", "Johnson & Johnson", 170.0, 3.0, 150.0, 600, 180, "healthcare"),
+    SymbolConfig("PFE", "Pfizer Inc.", 35.0, 2.0, 80.0, 650, 200, "healthcare"),
+    SymbolConfig("MRK", "Merck & Co.", 110.0, 3.0, 150.0, 600, 190, "healthcare"),
+    SymbolConfig("ABBV", "AbbVie Inc.", 160.0, 3.0, 150.0, 600, 190, "healthcare"),
+    SymbolConfig("UNH", "UnitedHealth Group", 500.0, 6.0, 350.0, 550, 170, "healthcare"),
+    SymbolConfig("TMO", "Thermo Fisher Scientific", 550.0, 7.0, 400.0, 450, 150, "healthcare"),
+    SymbolConfig("GILD", "Gilead Sciences", 80.0, 3.0, 130.0, 550, 180, "healthcare"),
+    SymbolConfig("BMY", "Bristol-Myers Squibb", 65.0, 3.0, 120.0, 550, 180, "healthcare"),
+    SymbolConfig("AMGN", "Amgen Inc.", 260.0, 4.0, 220.0, 500, 170, "healthcare"),
 
     # ---- Apparel / software ----
-    SymbolConfig("LULU", "Lululemon Athletica", 380.0, 6.0, 320.0, 550, 180),
-    SymbolConfig("ADSK", "Autodesk Inc.", 210.0, 6.0, 260.0, 500, 170),
-    SymbolConfig("ETSY", "Etsy Inc.", 70.0, 6.0, 260.0, 550, 180),
-    SymbolConfig("ROST", "Ross Stores", 120.0, 4.0, 200.0, 550, 180),
-    SymbolConfig("BKNG", "Booking Holdings", 3200.0, 25.0, 2000.0, 300, 120),
+    SymbolConfig("LULU", "Lululemon Athletica", 380.0, 6.0, 320.0, 550, 180, "apparel_software"),
+    SymbolConfig("ADSK", "Autodesk Inc.", 210.0, 6.0, 260.0, 500, 170, "apparel_software"),
+    SymbolConfig("ETSY", "Etsy Inc.", 70.0, 6.0, 260.0, 550, 180, "apparel_software"),
+    SymbolConfig("ROST", "Ross Stores", 120.0, 4.0, 200.0, 550, 180, "apparel_software"),
+    SymbolConfig("BKNG", "Booking Holdings", 3200.0, 25.0, 2000.0, 300, 120, "apparel_software"),
 
     # ---- Airlines ----
-    SymbolConfig("DAL", "Delta Air Lines", 40.0, 3.0, 130.0, 600, 200),
-    SymbolConfig("UAL", "United Airlines", 45.0, 3.0, 130.0, 600, 200),
-    SymbolConfig("FDX", "FedEx Corp.", 260.0, 4.0, 220.0, 550, 180),
-    SymbolConfig("UPS", "United Parcel Service", 190.0, 4.0, 220.0, 550, 180),
+    SymbolConfig("DAL", "Delta Air Lines", 40.0, 3.0, 130.0, 600, 200, "airlines"),
+    SymbolConfig("UAL", "United Airlines", 45.0, 3.0, 130.0, 600, 200, "airlines"),
+    SymbolConfig("FDX", "FedEx Corp.", 260.0, 4.0, 220.0, 550, 180, "airlines"),
+    SymbolConfig("UPS", "United Parcel Service", 190.0, 4.0, 220.0, 550, 180, "airlines"),
 
     # ---- Telecom ----
-    SymbolConfig("T", "AT&T Inc.", 18.0, 1.5, 60.0, 650, 200),
-    SymbolConfig("VZ", "Verizon Communications", 35.0, 2.0, 80.0, 650, 200),
-    SymbolConfig("CHTR", "Charter Communications", 330.0, 6.0, 300.0, 350, 140),
-    SymbolConfig("TMUS", "T-Mobile US", 150.0, 4.0, 200.0, 500, 170),
+    SymbolConfig("T", "AT&T Inc.", 18.0, 1.5, 60.0, 650, 200, "telecom"),
+    SymbolConfig("VZ", "Verizon Communications", 35.0, 2.0, 80.0, 650, 200, "telecom"),
+    SymbolConfig("CHTR", "Charter Communications", 330.0, 6.0, 300.0, 350, 140, "telecom"),
+    SymbolConfig("TMUS", "T-Mobile US", 150.0, 4.0, 200.0, 500, 170, "telecom"),
 
     # ---- New tech / crypto-adjacent ----
-    SymbolConfig("PLTR", "Palantir Technologies", 22.0, 5.0, 200.0, 700, 230),
-    SymbolConfig("RBLX", "Roblox Corp.", 30.0, 5.0, 220.0, 650, 220),
-    SymbolConfig("COIN", "Coinbase Global", 140.0, 15.0, 900.0, 650, 250),
+    SymbolConfig("PLTR", "Palantir Technologies", 22.0, 5.0, 200.0, 700, 230, "new_tech"),
+    SymbolConfig("RBLX", "Roblox Corp.", 30.0, 5.0, 220.0, 650, 220, "new_tech"),
+    SymbolConfig("COIN", "Coinbase Global", 140.0, 15.0, 900.0, 650, 250, "new_tech"),
 ]
 
 allowed_symbols: List[str] = [cfg.symbol for cfg in SYMBOL_CONFIGS]
\ No newline at end of file
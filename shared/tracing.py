@@ -0,0 +1,124 @@
+"""Event-time staleness and sequence-gap tracking per pipeline stage."""
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+
+def event_time(record: dict) -> Optional[float]:
+    """Origin event time of a record in epoch seconds, or None."""
+    ts = record.get("event_ts") or record.get("timestamp")
+    if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+        return ts
+    return None
+
+
+class StageTracer:
+    """Event-time age and per-symbol sequence continuity of the records at one stage."""
+
+    def __init__(self, stage: str, window: int = 4096) -> None:
+        self.stage = stage
+        self._window = window
+        self._ages: List[float] = [0.0] * window
+        self._last_seq: Dict[str, int] = {}
+
+        self.count = 0
+        self.untimed = 0
+        self.gaps = 0
+        self.reordered = 0
+        self.max_age_s = 0.0
+
+    def observe(self, record: dict, now: Optional[float] = None) -> None:
+        if not isinstance(record, dict):
+            self.untimed += 1
+            return
+        if now is None:
+            now = time.time()
+        ts = event_time(record)
+        if ts is None:
+            self.untimed += 1
+        else:
+            self._record_age(now - ts)
+
+        seq = record.get("seq")
+        symbol = record.get("symbol")
+        if isinstance(seq, int) and seq and symbol is not None:
+            last = self._last_seq.get(symbol)
+            if last is not None:
+                if seq > last + 1:
+                    self.gaps += seq - last - 1
+                elif seq <= last:
+                    self.reordered += 1
+            self._last_seq[symbol] = seq
+
+    def observe_many(self, records: Iterable[dict], now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        for record in records:
+            self.observe(record, now)
+
+    def observe_times(self, event_times: Iterable[float], now: Optional[float] = None) -> None:
+        """Age-only variant for stages that no longer hold the records."""
+        if now is None:
+            now = time.time()
+        for ts in event_times:
+            self._record_age(now - ts)
+
+    def snapshot(self) -> dict:
+        filled = min(self.count, self._window)
+        if filled:
+            p50, p99 = np.percentile(self._ages[:filled], [50, 99]).tolist()
+        else:
+            p50 = p99 = None
+
+        return {
+            "count": self.count,
+            "p50_ms": None if p50 is None else round(p50 * 1000, 2),
+            "p99_ms": None if p99 is None else round(p99 * 1000, 2),
+            "max_ms": round(self.max_age_s * 1000, 2),
+            "untimed": self.untimed,
+            "gaps": self.gaps,
+            "reordered": self.reordered,
+        }
+
+    def _record_age(self, age: float) -> None:
+        self._ages[self.count % self._window] = age
+        self.count += 1
+        if age > self.max_age_s:
+            self.max_age_s = age
+
+
+class StageTracerCollector(Collector):
+    """p50/p99 event-time staleness and sequence gaps per traced stage."""
+
+    def __init__(self, tracers: Callable[[], Iterable[StageTracer]]) -> None:
+        self._tracers = tracers
+
+    def collect(self) -> Iterator[Metric]:
+        staleness = GaugeMetricFamily(
+            "tradestream_stage_staleness_seconds",
+            "Event-time age of recent records at a pipeline stage.",
+            labels=["stage", "quantile"],
+        )
+        gaps = CounterMetricFamily(
+            "tradestream_stage_sequence_gaps",
+            "Sequence numbers skipped per symbol at a pipeline stage.",
+            labels=["stage"],
+        )
+        reordered = CounterMetricFamily(
+            "tradestream_stage_sequence_reordered",
+            "Records at or below their symbol's last sequence number.",
+            labels=["stage"],
+        )
+
+        for tracer in self._tracers():
+            snapshot = tracer.snapshot()
+            if snapshot["count"]:
+                staleness.add_metric([tracer.stage, "0.5"], snapshot["p50_ms"] / 1000)
+                staleness.add_metric([tracer.stage, "0.99"], snapshot["p99_ms"] / 1000)
+            gaps.add_metric([tracer.stage], tracer.gaps)
+            reordered.add_metric([tracer.stage], tracer.reordered)
+
+        yield from (staleness, gaps, reordered)